@@ -0,0 +1,245 @@
+"""İstasyon üretiminin ölçeklenme ve bellek kıyaslaması.
+
+EV_DISTRIBUTION_2025 hedefleri 1k'dan 10M istasyona kadar ölçeklenir ve her
+boyut için üç aşama ayrı ölçülür:
+
+- generation: üretici akışı tüketilir, başka iş yapılmaz,
+- serialization:<biçim>: akış write_stations ile dosyaya yazılır,
+- aggregation: akış StationAggregator'dan geçirilir.
+
+Her ölçüm taze bir süreçte (spawn) yapılır, böylece tepe RSS değerleri
+birbirini etkilemez. Serileştirme ve toplama sürelerine üreticide geçen süre
+dahil edilmez; üretici adım adım zamanlanıp geçen süreden düşülür.
+--tracemalloc verilirse Python yığınının tepe değeri ayrı bir çalıştırmada
+ölçülür, süreler tracemalloc'suz çalıştırmadan gelir.
+
+Sonuçlar JSON olarak kaydedilir (--save) ve önceki bir temel dosyayla
+karşılaştırılabilir (--compare); izin verilen paydan fazla yavaşlama veya
+bellek artışı varsa komut 1 ile çıkar.
+
+    python -m benchmarks.bench_generation --save benchmarks/baseline.json
+    python -m benchmarks.bench_generation --compare benchmarks/baseline.json
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from zes_stations.aggregates import StationAggregator
+from zes_stations.data import EV_DISTRIBUTION_2025
+from zes_stations.formats import OUTPUT_FORMATS, write_stations
+from zes_stations.generator import ENGINES, generate_distributed_stations, np, scale_distribution
+
+BASELINE_VERSION = 1
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+DEFAULT_FORMATS = ('json', 'ndjson')
+DEFAULT_SEED = 2025
+# Karşılaştırmada izin verilen göreli kötüleşme (0.2 = %20)
+DEFAULT_TOLERANCE = 0.2
+# Bu süreden kısa ölçümler karşılaştırmada gürültü sayılır
+MIN_COMPARABLE_SECONDS = 0.05
+
+_BASE_TOTAL = sum(EV_DISTRIBUTION_2025.values())
+
+
+def distribution_for(size):
+    """Toplamı yaklaşık size olan ölçeklenmiş şehir dağılımı."""
+    return scale_distribution(EV_DISTRIBUTION_2025, size / _BASE_TOTAL)
+
+
+def _timed(stations, clock):
+    # Üreticide geçen süreyi clock[0]'a ekler; tüketicinin süresi dışarıda kalır
+    stations = iter(stations)
+    perf_counter = time.perf_counter
+    while True:
+        t0 = perf_counter()
+        try:
+            station = next(stations)
+        except StopIteration:
+            clock[0] += perf_counter() - t0
+            return
+        clock[0] += perf_counter() - t0
+        yield station
+
+
+def _max_rss_mb():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux kilobayt, macOS bayt döndürür
+    return rss / (1 << 20) if sys.platform == 'darwin' else rss / 1024
+
+
+def _run_phase(task):
+    """Tek bir (motor, boyut, aşama) ölçümü; ayrı süreçte çalışır."""
+    engine, size, phase, seed, use_tracemalloc, tmp_dir = task
+    distribution = distribution_for(size)
+    rss_start = _max_rss_mb()
+    if use_tracemalloc:
+        tracemalloc.start()
+
+    gen_clock = [0.0]
+    output_bytes = None
+    stations = generate_distributed_stations(distribution, engine=engine, seed=seed)
+    t0 = time.perf_counter()
+    if phase == 'generation':
+        count = 0
+        for count, _ in enumerate(stations, 1):
+            pass
+    elif phase == 'aggregation':
+        aggregator = StationAggregator()
+        count = 0
+        for count, station in enumerate(_timed(stations, gen_clock), 1):
+            aggregator.add(station)
+        aggregator.to_sidecar()
+    else:
+        fmt = phase.split(':', 1)[1]
+        path = os.path.join(tmp_dir, f'{engine}-{size}-{OUTPUT_FORMATS[fmt]}')
+        count = write_stations(_timed(stations, gen_clock), path, fmt)
+        output_bytes = os.path.getsize(path)
+        os.remove(path)
+    wall = time.perf_counter() - t0
+
+    result = {
+        'engine': engine,
+        'size': size,
+        'phase': phase,
+        'stations': count,
+        'seconds': round(wall - gen_clock[0], 4),
+        'wallSeconds': round(wall, 4),
+        'peakRssMb': round(_max_rss_mb(), 1),
+        'rssGrowthMb': round(_max_rss_mb() - rss_start, 1),
+    }
+    result['stationsPerSec'] = round(count / result['seconds']) if result['seconds'] > 0 else None
+    if use_tracemalloc:
+        result['tracemallocPeakMb'] = round(tracemalloc.get_traced_memory()[1] / (1 << 20), 1)
+        tracemalloc.stop()
+    if output_bytes is not None:
+        result['outputBytes'] = output_bytes
+    return result
+
+
+def _environment():
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpuCount': os.cpu_count(),
+        'numpy': np.__version__ if np is not None else None,
+    }
+
+
+def _in_fresh_process(ctx, task):
+    # Her ölçüm için yeni süreç: tepe RSS önceki ölçümlerden etkilenmez
+    with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+        return pool.submit(_run_phase, task).result()
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, engines=ENGINES, formats=DEFAULT_FORMATS, seed=DEFAULT_SEED,
+                   use_tracemalloc=False, progress=print):
+    """Tüm (motor, boyut, aşama) ölçümlerini sırayla yapar ve sonuç belgesini döndürür."""
+    phases = ['generation'] + [f'serialization:{fmt}' for fmt in formats] + ['aggregation']
+    results = []
+    ctx = multiprocessing.get_context('spawn')
+    with tempfile.TemporaryDirectory(prefix='zes-bench-') as tmp_dir:
+        for engine in engines:
+            for size in sizes:
+                for phase in phases:
+                    result = _in_fresh_process(ctx, (engine, size, phase, seed, False, tmp_dir))
+                    if use_tracemalloc:
+                        # tracemalloc süreleri şişirir; yalnızca tepe değeri ayrı bir çalıştırmadan alınır
+                        traced = _in_fresh_process(ctx, (engine, size, phase, seed, True, tmp_dir))
+                        result['tracemallocPeakMb'] = traced['tracemallocPeakMb']
+                    results.append(result)
+                    if progress:
+                        progress(_format_row(result))
+    return {
+        'version': BASELINE_VERSION,
+        'generatedAt': datetime.now().isoformat(timespec='seconds'),
+        'seed': seed,
+        'environment': _environment(),
+        'results': results,
+    }
+
+
+def _format_row(r):
+    rate = f"{r['stationsPerSec']:>12,}/sn" if r['stationsPerSec'] else f"{'-':>15}"
+    line = (f"  {r['engine']:<6} {r['stations']:>11,} {r['phase']:<22} {r['seconds']:>9.3f} sn {rate} "
+            f"tepe RSS {r['peakRssMb']:>8.1f} MB")
+    if 'tracemallocPeakMb' in r:
+        line += f"  tracemalloc {r['tracemallocPeakMb']:.1f} MB"
+    return line
+
+
+def _key(result):
+    return result['engine'], result['size'], result['phase']
+
+
+def compare(current, baseline, tolerance=DEFAULT_TOLERANCE):
+    """Temel dosyaya göre kötüleşen ölçümlerin açıklamalarını döndürür."""
+    previous = {_key(r): r for r in baseline['results']}
+    regressions = []
+    for r in current['results']:
+        old = previous.get(_key(r))
+        if old is None:
+            continue
+        label = f"{r['engine']} {r['size']:,} {r['phase']}"
+        if (old['seconds'] >= MIN_COMPARABLE_SECONDS and old['stationsPerSec'] and r['stationsPerSec']
+                and r['stationsPerSec'] < old['stationsPerSec'] * (1 - tolerance)):
+            regressions.append(f"{label}: {old['stationsPerSec']:,} -> {r['stationsPerSec']:,} istasyon/sn")
+        if r['rssGrowthMb'] > max(old['rssGrowthMb'], 1.0) * (1 + tolerance) + 5:
+            regressions.append(f"{label}: RSS artışı {old['rssGrowthMb']} -> {r['rssGrowthMb']} MB")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='İstasyon üretimi ölçeklenme/bellek kıyaslaması')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                        help='istasyon sayıları (varsayılan: 1k 10k 100k 1M 10M)')
+    parser.add_argument('--engines', choices=ENGINES, nargs='+',
+                        help='üretim motorları (varsayılan: kurulu olanların hepsi)')
+    parser.add_argument('--formats', choices=sorted(OUTPUT_FORMATS), nargs='+', default=list(DEFAULT_FORMATS),
+                        help='serileştirme biçimleri (varsayılan: json ndjson)')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--tracemalloc', action='store_true',
+                        help='Python yığınındaki tepe belleği de ölç (süreleri belirgin şekilde yavaşlatır)')
+    parser.add_argument('--save', metavar='DOSYA', help='sonuçları bu JSON dosyasına yaz')
+    parser.add_argument('--compare', metavar='DOSYA', help='sonuçları bu temel dosyayla karşılaştır')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='izin verilen göreli kötüleşme (varsayılan: 0.2)')
+    args = parser.parse_args(argv)
+
+    engines = args.engines or [e for e in ENGINES if e != 'numpy' or np is not None]
+    if 'numpy' in engines and np is None:
+        parser.error('numpy motoru için numpy kurulu olmalı')
+
+    print(f"⏱️ {len(engines)} motor x {len(args.sizes)} boyut ölçülüyor (tohum {args.seed})\n")
+    current = run_benchmarks(args.sizes, engines, args.formats, args.seed, args.tracemalloc)
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(current, f, ensure_ascii=False, indent=2)
+            f.write('\n')
+        print(f"\n💾 Sonuçlar {args.save} dosyasına kaydedildi")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.tolerance)
+        if regressions:
+            print(f"\n❌ {len(regressions)} ölçüm temel değerden kötü (tolerans %{args.tolerance * 100:g}):")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\n✅ Temel değerlere göre gerileme yok ({args.compare})")
+
+
+if __name__ == '__main__':
+    main()
@@ -9,6 +9,10 @@ const __dirname = path.dirname(__filename);
 const ROOT_DIR = path.resolve(__dirname, '..');
 const DATA_PATH = path.join(ROOT_DIR, 'real_zes_stations.json');
 
+// --delta <dosya>: generate_distributed_stations.py --cache ile üretilen deltayı mevcut tablolara uygula
+const DELTA_ARG = process.argv.indexOf('--delta');
+const DELTA_PATH = DELTA_ARG !== -1 ? process.argv[DELTA_ARG + 1] : null;
+
 // Gerçek nüfus ve EV verileri (haritada gösterilenle aynı)
 const REAL_POPULATIONS = {
   "İstanbul": 15907951, "Ankara": 5803482, "İzmir": 4462056, "Bursa": 3194720, "Antalya": 2688004,
@@ -354,7 +358,81 @@ async function main() {
   await conn.end();
 }
 
-main().catch((err) => {
+async function insertSockets(conn, istasyonId, s) {
+  const ac = Number(s.acSockets || 0);
+  const dc = Number(s.dcSockets || 0);
+  await conn.execute(`INSERT INTO istasyon_soketleri (istasyon_id, tur, adet) VALUES (?, 'AC', ?), (?, 'DC', ?)`, [istasyonId, ac, istasyonId, dc]);
+}
+
+// Tam yeniden yükleme yapmadan eklenen/silinen/değişen istasyonları uygular.
+// İstasyonlar ada (ad) göre eşlenir; sehir_metrikleri gerçek pazar verisinden geldiği için değiştirilmez.
+async function applyDelta(deltaPath) {
+  const delta = JSON.parse(await fs.readFile(deltaPath, 'utf-8'));
+
+  const conn = await mysql.createConnection({
+    host: MYSQL_HOST,
+    port: Number(MYSQL_PORT),
+    user: MYSQL_USER,
+    password: MYSQL_PASSWORD,
+    database: MYSQL_DATABASE,
+    charset: 'utf8mb4_general_ci',
+  });
+  await conn.execute(`SET NAMES utf8mb4`);
+
+  const [sehirRows] = await conn.query(`SELECT id, ad FROM sehirler`);
+  const sehirIds = new Map(sehirRows.map((r) => [r.ad, r.id]));
+  const added = [...delta.added];
+  let removed = 0;
+  let changed = 0;
+
+  await conn.beginTransaction();
+  try {
+    for (const s of delta.removed) {
+      const [res] = await conn.execute(`DELETE FROM istasyonlar WHERE ad = ?`, [s.name]);
+      removed += res.affectedRows;
+    }
+
+    for (const s of delta.changed) {
+      const [[row]] = await conn.query(`SELECT id FROM istasyonlar WHERE ad = ?`, [s.name]);
+      if (!row) {
+        added.push(s);
+        continue;
+      }
+      await conn.execute(`DELETE FROM istasyon_soketleri WHERE istasyon_id = ?`, [row.id]);
+      await insertSockets(conn, row.id, s);
+      changed += 1;
+    }
+
+    let inserted = 0;
+    for (const s of added) {
+      const sehirId = sehirIds.get(sehirAdi(s.name));
+      // Eğer haritada olmayan bir şehir çıkar ise atla
+      if (!sehirId) continue;
+      // Aynı adla zaten kayıtlı istasyon yinelenmez, yalnızca soketleri güncellenir
+      // (ör. tam yüklemeden sonra uygulanan bir delta)
+      const [[existing]] = await conn.query(`SELECT id FROM istasyonlar WHERE ad = ?`, [s.name]);
+      if (existing) {
+        await conn.execute(`DELETE FROM istasyon_soketleri WHERE istasyon_id = ?`, [existing.id]);
+        await insertSockets(conn, existing.id, s);
+        changed += 1;
+        continue;
+      }
+      const [istRes] = await conn.execute(`INSERT INTO istasyonlar (ad, sehir_id) VALUES (?, ?)`, [s.name, sehirId]);
+      await insertSockets(conn, istRes.insertId, s);
+      inserted += 1;
+    }
+
+    await conn.commit();
+    console.log(`✅ Delta uygulandı: +${inserted} / -${removed} / ~${changed} istasyon`);
+  } catch (err) {
+    await conn.rollback();
+    throw err;
+  } finally {
+    await conn.end();
+  }
+}
+
+(DELTA_PATH ? applyDelta(DELTA_PATH) : main()).catch((err) => {
   console.error('Seeding failed:', err);
   process.exit(1);
 });
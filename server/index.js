@@ -10,6 +10,8 @@ const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
 const ROOT_DIR = path.resolve(__dirname, '..');
 const DATA_PATH = path.join(ROOT_DIR, 'real_zes_stations.json');
+// generate_distributed_stations.py tarafından yazılan, önceden hesaplanmış şehir/ilçe özetleri
+const AGGREGATES_PATH = path.join(ROOT_DIR, 'real_zes_stations.aggregates.json');
 
 const app = express();
 const PORT = process.env.PORT || 4000;
@@ -18,6 +20,9 @@ app.use(cors());
 app.use(express.json());
 
 let stations = [];
+let aggregates = null;
+let aggregateCityRows = [];
+let stationsByCity = new Map();
 let pool = null;
 const {
   MYSQL_HOST,
@@ -56,9 +61,51 @@ async function loadStations() {
       console.error('Failed to load stations:', err);
       stations = [];
     }
+    await loadAggregates();
   }
 }
 
+async function loadAggregates() {
+  try {
+    const raw = await fs.readFile(AGGREGATES_PATH, 'utf-8');
+    const parsed = JSON.parse(raw);
+    // Özet dosyası bu istasyon dosyasından üretilmemişse (eski veya başka bir üretim) kullanma
+    const stat = await fs.stat(DATA_PATH, { bigint: true });
+    const source = parsed?.source;
+    const fresh = source
+      && source.file === path.basename(DATA_PATH)
+      && String(source.size) === String(stat.size)
+      && source.mtimeNs === String(stat.mtimeNs)
+      && parsed.summary?.totalStations === stations.length;
+    if (!fresh) {
+      console.warn('Aggregates sidecar is stale, falling back to per-request aggregation');
+      return;
+    }
+    aggregates = parsed;
+    // Özet ilçe ve güç dağılımını da taşır; API yanıtları eski alanlarla sınırlı kalır
+    aggregateCityRows = aggregates.cities.map(toCityRow);
+    stationsByCity = new Map();
+    for (const s of stations) {
+      const city = getCityFromName(s.name);
+      if (!stationsByCity.has(city)) stationsByCity.set(city, []);
+      stationsByCity.get(city).push(s);
+    }
+    console.log(`Loaded aggregates for ${aggregates.cities.length} cities from real_zes_stations.aggregates.json`);
+  } catch (err) {
+    if (err.code !== 'ENOENT') console.error('Failed to load aggregates:', err);
+  }
+}
+
+function toCityRow(entry) {
+  return {
+    city: entry.city,
+    zesStations: entry.zesStations,
+    acSockets: entry.acSockets,
+    dcSockets: entry.dcSockets,
+    totalSockets: entry.totalSockets,
+  };
+}
+
 function getCityFromName(name) {
   if (!name) return '';
   const parts = String(name).split(' - ');
@@ -77,6 +124,7 @@ async function aggregateByCity() {
     );
     return rows;
   }
+  if (aggregates) return aggregateCityRows;
   const cityMap = new Map();
   for (const s of stations) {
     const city = getCityFromName(s.name);
@@ -121,6 +169,13 @@ async function getSummary() {
       lastUpdated: new Date().toISOString(),
     };
   }
+  if (aggregates) {
+    return {
+      ...aggregates.summary,
+      topCities: aggregates.summary.topCities.map(toCityRow),
+      lastUpdated: aggregates.generatedAt,
+    };
+  }
   const cities = await aggregateByCity();
   const totalStations = stations.length;
   const totals = cities.reduce((acc, c) => {
@@ -195,6 +250,12 @@ app.get('/api/cities/:name', async (req, res) => {
     );
     return res.json({ summary: cityRows[0] || null, stations: stationRows });
   }
+  if (aggregates) {
+    const position = aggregates.index[name.toLowerCase()];
+    const summary = position === undefined ? null : aggregateCityRows[position];
+    const cityStations = summary ? stationsByCity.get(summary.city) || [] : [];
+    return res.json({ summary, stations: cityStations });
+  }
   const cities = await aggregateByCity();
   const city = cities.find(c => c.city.toLowerCase() === name.toLowerCase());
   const cityStations = stations.filter(s => getCityFromName(s.name).toLowerCase() === name.toLowerCase());
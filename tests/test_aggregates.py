@@ -0,0 +1,89 @@
+"""Şehir/ilçe özeti (sidecar): sayımlar ve istasyon dosyasının parmak izi."""
+import json
+import os
+from collections import Counter
+
+import pytest
+
+from zes_stations.aggregates import StationAggregator, aggregates_path, file_fingerprint, split_station_name
+from zes_stations.cli import main
+from zes_stations.formats import iter_station_file, write_stations
+from zes_stations.generator import POWER_TIERS, TIER_POWER, generate_distributed_stations
+
+
+@pytest.fixture(scope='module')
+def stations():
+    return list(generate_distributed_stations({'İstanbul': 150, 'Ankara': 80, 'Van': 6}, seed=5))
+
+
+def _expected(stations):
+    tiers = dict(zip(TIER_POWER, POWER_TIERS))
+    cities = {}
+    for s in stations:
+        city, district = split_station_name(s['name'])
+        for key in ((city,), (city, district)):
+            e = cities.setdefault(key, {'zesStations': 0, 'acSockets': 0, 'dcSockets': 0, 'powerMix': Counter()})
+            e['zesStations'] += 1
+            e['acSockets'] += s['acSockets']
+            e['dcSockets'] += s['dcSockets']
+            e['powerMix'][tiers[s['power']]] += 1
+    return cities
+
+
+def test_counts_match_stations(stations):
+    aggregator = StationAggregator()
+    for s in stations:
+        aggregator.add(s)
+    doc = aggregator.to_sidecar()
+    expected = _expected(stations)
+
+    assert [c['city'] for c in doc['cities']] == ['İstanbul', 'Ankara', 'Van']
+    for city in doc['cities']:
+        for row, key in [(city, (city['city'],))] + [(d, (city['city'], d['district'])) for d in city['districts']]:
+            e = expected.pop(key)
+            assert row['zesStations'] == e['zesStations']
+            assert (row['acSockets'], row['dcSockets']) == (e['acSockets'], e['dcSockets'])
+            assert row['totalSockets'] == e['acSockets'] + e['dcSockets']
+            assert row['powerMix'] == {tier: e['powerMix'][tier] for tier in POWER_TIERS}
+        assert sum(d['zesStations'] for d in city['districts']) == city['zesStations']
+    assert expected == {}
+
+    summary = doc['summary']
+    assert summary['totalStations'] == len(stations)
+    assert summary['totalSockets'] == sum(s['acSockets'] + s['dcSockets'] for s in stations)
+    assert summary['cityCount'] == 3
+    assert doc['index'] == {city.lower(): i for i, city in enumerate(['İstanbul', 'Ankara', 'Van'])}
+    assert doc['source'] is None
+
+
+def test_fingerprint_matches_written_file(tmp_path, stations):
+    output = tmp_path / 'real_zes_stations.json'
+    aggregator = StationAggregator()
+    write_stations((aggregator.add(s) or s for s in stations), output)
+    aggregator.write(aggregates_path(str(output)), source=str(output))
+
+    with open(aggregates_path(str(output)), encoding='utf-8') as f:
+        doc = json.load(f)
+    st = os.stat(output)
+    # server/index.js'in fs.stat(..., {bigint: true}) ile karşılaştırdığı alanlar
+    assert doc['version'] == 2
+    assert doc['source'] == {'file': 'real_zes_stations.json', 'size': st.st_size, 'mtimeNs': str(st.st_mtime_ns)}
+    assert doc['source'] == file_fingerprint(output)
+    assert doc['summary']['totalStations'] == len(stations)
+
+    # Dosya sonradan değişirse parmak izi artık eşleşmez
+    with open(output, 'a', encoding='utf-8') as f:
+        f.write('\n')
+    assert file_fingerprint(output) != doc['source']
+
+
+def test_cli_sidecar_matches_output(tmp_path):
+    output = tmp_path / 'stations.ndjson'
+    main(['--seed', '1', '--format', 'ndjson', '-o', str(output), '-q'])
+    with open(aggregates_path(str(output)), encoding='utf-8') as f:
+        doc = json.load(f)
+    stations = list(iter_station_file(output))
+    assert doc['source'] == file_fingerprint(output)
+    assert doc['summary']['totalStations'] == len(stations)
+    assert {c['city']: c['zesStations'] for c in doc['cities']} == dict(
+        Counter(split_station_name(s['name'])[0] for s in stations))
@@ -0,0 +1,81 @@
+"""Denetimin enjekte edilen yinelenen kimlik, yakın kopya ve yanlış şehir kayıtlarını bulması."""
+import copy
+
+import numpy as np
+import pytest
+
+from zes_stations.audit import ID_BITMAP_BITS, StationAudit, audit_stations, near_duplicate_pairs
+from zes_stations.data import CITY_CENTERS
+from zes_stations.generator import generate_distributed_stations
+from zes_stations.spatial import haversine_km
+
+DISTRIBUTION = {'Ankara': 200, 'İstanbul': 300, 'Bursa': 100}
+
+
+@pytest.fixture(scope='module')
+def stations():
+    return list(generate_distributed_stations(DISTRIBUTION, seed=1))
+
+
+def test_generated_stations_are_clean(stations):
+    report = audit_stations(stations)
+    assert report['stations'] == 600
+    assert report['duplicateIds']['count'] == 0
+    assert report['cityMismatches']['count'] == 0
+    assert report['unknownCities'] == {}
+    assert report['invalidCoordinates']['count'] == 0
+
+
+def test_injected_problems_are_reported(stations):
+    stations = copy.deepcopy(stations)
+    # Yinelenen kimlik
+    duplicate = copy.deepcopy(stations[10])
+    duplicate['name'] += ' 2'
+    duplicate['coordinates'] = {'lat': 39.5, 'lng': 32.5}
+    # Yakın kopya: 3 m kuzeyde, farklı kimlik
+    near = copy.deepcopy(stations[20])
+    near['id'] = 'ZES9001'
+    near['name'] += ' Ek'
+    near['coordinates']['lat'] += 3 / 111_195
+    # Ankara adıyla İstanbul koordinatı
+    misplaced = copy.deepcopy(stations[5])
+    misplaced['id'] = 'ZES9002'
+    misplaced['name'] += ' Yeni'
+    misplaced['coordinates'] = {'lat': CITY_CENTERS['İstanbul'][0], 'lng': CITY_CENTERS['İstanbul'][1]}
+    report = audit_stations(stations + [duplicate, near, misplaced], max_examples=1000)
+
+    assert report['duplicateIds']['count'] == 1
+    assert report['duplicateIds']['examples'][0]['id'] == stations[10]['id']
+    pairs = {tuple(p['ids']): p['distanceM'] for p in report['nearDuplicates']['examples']}
+    assert pairs[(stations[20]['id'], 'ZES9001')] == pytest.approx(3.0, abs=0.01)
+    mismatches = {m['id']: m for m in report['cityMismatches']['examples']}
+    assert set(mismatches) == {'ZES9002'}
+    assert mismatches['ZES9002']['city'] == 'Ankara'
+    assert mismatches['ZES9002']['nearestCity'] == 'İstanbul'
+
+
+def test_large_ids_do_not_grow_bitmap():
+    audit = StationAudit()
+    for n in (99_999_999_999, ID_BITMAP_BITS, 99_999_999_999, 12, 12):
+        audit.add({'id': f'ZES{n:04d}', 'name': f'Ankara - {n}', 'coordinates': {'lat': 39.9, 'lng': 32.8}})
+    report = audit.report()
+    assert report['duplicateIds']['count'] == 2
+    assert [d['id'] for d in report['duplicateIds']['examples']] == ['ZES99999999999', 'ZES0012']
+    # Bit dizisi yalnızca küçük kimlik (12) kadar büyür
+    assert len(audit._seen_numbers) <= 8
+
+
+@pytest.mark.parametrize('near_m', [10.0, 150.0])
+def test_near_duplicate_pairs_match_brute_force(near_m):
+    rng = np.random.default_rng(16)
+    # Küçük bir alanda yoğun nokta bulutu ve birkaç tam kopya
+    lats = rng.uniform(40.95, 41.0, 800)
+    lngs = rng.uniform(28.95, 29.02, 800)
+    lats[700:710] = lats[:10]
+    lngs[700:710] = lngs[:10]
+    lats[5] = np.nan
+    i, j, meters = near_duplicate_pairs(lats, lngs, near_m)
+    dist = haversine_km(lats[:, None], lngs[:, None], lats[None, :], lngs[None, :]) * 1000
+    bi, bj = np.nonzero(np.triu(dist < near_m, k=1))
+    assert list(zip(i.tolist(), j.tolist())) == list(zip(bi.tolist(), bj.tolist()))
+    np.testing.assert_allclose(meters, dist[bi, bj])
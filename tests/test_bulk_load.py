@@ -0,0 +1,88 @@
+"""bulk_load: SQLite yüklemesi ve MySQL ayarlarının .env'den okunması."""
+import sqlite3
+
+import pytest
+
+from zes_stations import bulk_load
+from zes_stations.bulk_load import SQLiteDialect, mysql_settings, read_dotenv
+from zes_stations.generator import generate_distributed_stations
+
+MYSQL_KEYS = ('MYSQL_HOST', 'MYSQL_PORT', 'MYSQL_USER', 'MYSQL_PASSWORD', 'MYSQL_DATABASE')
+
+
+@pytest.fixture
+def clean_env(monkeypatch):
+    for key in MYSQL_KEYS:
+        monkeypatch.delenv(key, raising=False)
+
+
+def test_read_dotenv(tmp_path):
+    env = tmp_path / '.env'
+    env.write_text('# MySQL settings\n'
+                   'MYSQL_HOST=db.local\n'
+                   'export MYSQL_USER = zes \n'
+                   'MYSQL_PASSWORD="p#ss word"\n'
+                   "MYSQL_DATABASE='zes_kdss'\n"
+                   'MYSQL_PORT=3307 # yorum\n'
+                   '\n'
+                   'BOZUK SATIR\n', encoding='utf-8')
+    assert read_dotenv(env) == {'MYSQL_HOST': 'db.local', 'MYSQL_USER': 'zes', 'MYSQL_PASSWORD': 'p#ss word',
+                                'MYSQL_DATABASE': 'zes_kdss', 'MYSQL_PORT': '3307'}
+    assert read_dotenv(tmp_path / 'yok.env') == {}
+
+
+def test_mysql_settings_from_dotenv_and_environment(tmp_path, monkeypatch, clean_env):
+    env = tmp_path / '.env'
+    env.write_text('MYSQL_USER=zes\nMYSQL_PASSWORD=secret\nMYSQL_DATABASE=zes_kdss\n', encoding='utf-8')
+    assert mysql_settings(env) == {'host': '127.0.0.1', 'port': 3306, 'user': 'zes', 'password': 'secret',
+                                   'database': 'zes_kdss'}
+    # Ortam değişkenleri .env'deki değerlerin önüne geçer
+    monkeypatch.setenv('MYSQL_DATABASE', 'other')
+    assert mysql_settings(env)['database'] == 'other'
+    with pytest.raises(RuntimeError, match='MYSQL_USER'):
+        mysql_settings(tmp_path / 'yok.env')
+
+
+def test_connect_mysql_creates_database(monkeypatch):
+    calls = []
+
+    class Cursor:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def execute(self, sql):
+            calls.append(sql)
+
+    class Connection:
+        def cursor(self):
+            return Cursor()
+
+        def select_db(self, name):
+            calls.append(('select_db', name))
+
+    def connect(**kwargs):
+        assert 'database' not in kwargs
+        return Connection()
+
+    monkeypatch.setattr(bulk_load, 'pymysql', type('pymysql', (), {'connect': staticmethod(connect)}))
+    bulk_load.connect_mysql({'host': 'h', 'port': 3306, 'user': 'u', 'password': 'p', 'database': 'zes_kdss'})
+    assert calls == ['CREATE DATABASE IF NOT EXISTS `zes_kdss` CHARACTER SET utf8mb4 COLLATE utf8mb4_general_ci',
+                     ('select_db', 'zes_kdss')]
+
+
+def test_sqlite_load_counts():
+    stations = list(generate_distributed_stations({'Ankara': 40, 'Bursa': 20}, seed=1))
+    conn = sqlite3.connect(':memory:')
+    result = bulk_load.bulk_load(conn, iter(stations), SQLiteDialect())
+    assert result['stations'] == 60
+    # İstasyon başına bir AC ve bir DC satırı
+    assert result['sockets'] == 120
+    assert conn.execute('SELECT COUNT(*) FROM istasyonlar').fetchone()[0] == 60
+    ac, dc = conn.execute("SELECT SUM(CASE tur WHEN 'AC' THEN adet END), SUM(CASE tur WHEN 'DC' THEN adet END) "
+                          'FROM istasyon_soketleri').fetchone()
+    assert (ac, dc) == (sum(s['acSockets'] for s in stations), sum(s['dcSockets'] for s in stations))
+    nufus = dict(conn.execute('SELECT ad, nufus FROM sehirler').fetchall())
+    assert nufus['Ankara'] == 5803482
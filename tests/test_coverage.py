@@ -0,0 +1,72 @@
+"""Kapsama rasterı mesafelerinin haversine ile kaba kuvvet karşılaştırması ve il özetleri."""
+import numpy as np
+import pytest
+
+from zes_stations.coverage import CoverageRaster, build_coverage, city_summary
+from zes_stations.spatial import StationIndex, haversine_km
+
+BBOX = (39.6, 32.4, 40.2, 33.3)
+
+
+def _stations(seed):
+    rng = np.random.default_rng(seed)
+    # Seyrek dağılım, bbox dışında kalanlar ve tek karoda yoğun bir küme
+    lats = np.concatenate([rng.uniform(39.0, 40.8, 300), rng.normal(39.93, 0.01, 3000)])
+    lngs = np.concatenate([rng.uniform(31.8, 33.9, 300), rng.normal(32.85, 0.01, 3000)])
+    return lats, lngs
+
+
+def _brute_force(raster, lats, lngs):
+    n_rows, n_cols = raster.shape
+    grid_lat, grid_lng = np.meshgrid(raster.cell_lats(np.arange(n_rows)), raster.cell_lngs(np.arange(n_cols)),
+                                     indexing='ij')
+    best = np.full(grid_lat.size, np.inf)
+    for start in range(0, len(lats), 256):
+        d = haversine_km(grid_lat.ravel()[:, None], grid_lng.ravel()[:, None],
+                         lats[None, start:start + 256], lngs[None, start:start + 256])
+        best = np.minimum(best, d.min(axis=1))
+    return best.reshape(n_rows, n_cols)
+
+
+@pytest.mark.parametrize('seed, tile_cells', [(1, 32), (2, 8)])
+def test_distances_match_haversine(seed, tile_cells):
+    lats, lngs = _stations(seed)
+    raster = build_coverage(StationIndex(lats, lngs), None, bbox=BBOX, resolution_m=1500, tile_cells=tile_cells)
+    np.testing.assert_allclose(raster.distances, _brute_force(raster, lats, lngs), atol=1e-3)
+
+
+def test_sparse_stations_and_empty_index():
+    lats = np.asarray([39.0, 41.0])
+    lngs = np.asarray([32.0, 33.5])
+    raster = build_coverage(StationIndex(lats, lngs), None, bbox=BBOX, resolution_m=3000)
+    np.testing.assert_allclose(raster.distances, _brute_force(raster, lats, lngs), atol=1e-3)
+    empty = build_coverage(StationIndex([], []), None, bbox=BBOX, resolution_m=3000)
+    assert np.isinf(empty.distances).all()
+
+
+def test_written_raster_reopens(tmp_path):
+    lats, lngs = _stations(3)
+    prefix = str(tmp_path / 'coverage')
+    raster = build_coverage(StationIndex(lats, lngs), prefix, bbox=BBOX, resolution_m=2000)
+    raster.write_meta(prefix)
+    reopened = CoverageRaster.open(prefix)
+    np.testing.assert_array_equal(reopened.distances, raster.distances)
+    for lat, lng in [(39.93, 32.85), (39.7, 33.2), (40.15, 32.5)]:
+        expected = haversine_km(lat, lng, lats, lngs).min()
+        # Hücre merkezi ile nokta arasındaki fark en fazla yarım köşegen kadardır
+        assert abs(reopened.value_at(lat, lng) - expected) <= 1.5
+    assert reopened.value_at(38.0, 32.8) is None
+
+
+def test_city_summary_splits_population_by_nearest_centre():
+    centers = {'Batı': (39.9, 32.6), 'Doğu': (39.9, 33.1)}
+    populations = {'Batı': 400_000, 'Doğu': 100_000}
+    raster = build_coverage(StationIndex([39.9], [32.6]), None, bbox=BBOX, resolution_m=1000)
+    rows = {r['city']: r for r in city_summary(raster, populations=populations, centers=centers, reach_km=30)}
+    assert set(rows) == {'Batı', 'Doğu', 'TOPLAM'}
+    for city, population in populations.items():
+        assert rows[city]['population'] == pytest.approx(population, rel=1e-6)
+    assert rows['TOPLAM']['population'] == pytest.approx(500_000, rel=1e-6)
+    # İstasyon Batı merkezinde: Doğu'nun nüfusu ortalamada daha uzakta kalır
+    assert rows['Batı']['meanKm'] < rows['Doğu']['meanKm']
+    assert rows['Doğu']['shareBeyondKm']['25'] > rows['Batı']['shareBeyondKm']['25']
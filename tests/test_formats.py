@@ -0,0 +1,78 @@
+"""Akış halindeki yazıcı ve okuyucuların gidiş-dönüş testleri."""
+import gzip
+import io
+import json
+
+import pytest
+
+from zes_stations.formats import (
+    OUTPUT_FORMATS,
+    _iter_json_array,
+    iter_station_file,
+    output_stem,
+    write_stations,
+)
+from zes_stations.generator import generate_distributed_stations
+
+
+@pytest.fixture(scope='module')
+def stations():
+    stations = list(generate_distributed_stations({'İstanbul': 40, 'Ankara': 25, 'Van': 3}, seed=7))
+    # Ayraç ve kaçış gerektiren karakterler
+    stations[0]['name'] = 'İstanbul - "Kadıköy" [Rıhtım], {İskele}\\\\ \\n şğüçöı'
+    return stations
+
+
+@pytest.mark.parametrize('fmt', sorted(OUTPUT_FORMATS))
+def test_round_trip(tmp_path, stations, fmt):
+    path = tmp_path / OUTPUT_FORMATS[fmt]
+    assert write_stations(iter(stations), path, fmt) == len(stations)
+    assert list(iter_station_file(path)) == stations
+
+
+def test_written_files_are_compact_and_valid(tmp_path, stations):
+    json_path = tmp_path / 'a.json'
+    write_stations(stations, json_path, 'json')
+    text = json_path.read_text(encoding='utf-8')
+    assert text.count('\n') == 1 and json.loads(text) == stations
+    gz_path = tmp_path / 'a.ndjson.gz'
+    write_stations(stations, gz_path, 'ndjson.gz')
+    lines = gzip.decompress(gz_path.read_bytes()).decode('utf-8').splitlines()
+    assert [json.loads(line) for line in lines] == stations
+
+
+def test_empty_stream(tmp_path):
+    for fmt, name in OUTPUT_FORMATS.items():
+        path = tmp_path / name
+        assert write_stations(iter(()), path, fmt) == 0
+        assert list(iter_station_file(path)) == []
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 64, 1000])
+@pytest.mark.parametrize('indent', [None, 2])
+def test_json_array_across_chunk_boundaries(stations, chunk_size, indent):
+    text = json.dumps(stations, ensure_ascii=indent is None, indent=indent)
+    assert list(_iter_json_array(io.StringIO(text), chunk_size)) == stations
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 5])
+def test_json_array_numbers_split_across_chunks(chunk_size):
+    # Bölünmüş bir sayının başı tek başına geçerli JSON'dur ("12", "4.5")
+    text = '[123, 456.5e1,7 , -0.25E-2, "x", true, null]'
+    assert list(_iter_json_array(io.StringIO(text), chunk_size)) == [123, 4565.0, 7, -0.0025, 'x', True, None]
+
+
+@pytest.mark.parametrize('text', ['{"a": 1}', '[{"a": 1}, {"b"', '[{"a": 1}', '[12x]'])
+def test_json_array_errors(text):
+    with pytest.raises(ValueError):
+        list(_iter_json_array(io.StringIO(text), 4))
+
+
+def test_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        write_stations([], tmp_path / 'x', 'xml')
+
+
+def test_output_stem():
+    assert output_stem('out/real_zes_stations.ndjson.gz') == 'out/real_zes_stations'
+    assert output_stem('a.json') == 'a' and output_stem('a.jsonl') == 'a' and output_stem('a') == 'a'
@@ -0,0 +1,69 @@
+"""Tohumlu üretimin işçi sayısından bağımsız, birebir aynı çıktı vermesi."""
+import tempfile
+
+import pytest
+
+from zes_stations.formats import write_stations
+from zes_stations.generator import VECTOR_CHUNK, generate_distributed_stations
+
+# İstanbul birden çok blokta üretilir
+DISTRIBUTION = {'İstanbul': VECTOR_CHUNK + 800, 'Ankara': 500, 'Bursa': 300, 'Van': 7}
+
+
+def _write(tmp_path, name, **kwargs):
+    path = tmp_path / name
+    write_stations(generate_distributed_stations(DISTRIBUTION, seed=42, **kwargs), path, 'ndjson')
+    return path.read_bytes()
+
+
+@pytest.mark.parametrize('engine', ['python', 'numpy'])
+def test_parallel_output_is_byte_identical(tmp_path, engine):
+    if engine == 'numpy':
+        pytest.importorskip('numpy')
+    serial = _write(tmp_path, 'serial.ndjson', engine=engine)
+    assert serial.count(b'\n') == sum(DISTRIBUTION.values())
+    for workers in (2, 3):
+        assert _write(tmp_path, f'w{workers}.ndjson', engine=engine, workers=workers) == serial
+
+
+def test_parallel_temp_files_are_removed(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
+    stations = generate_distributed_stations(DISTRIBUTION, seed=1, workers=2)
+    first = [next(stations) for _ in range(10)]
+    assert first[0]['id'] == 'ZES0001'
+    # Yarıda bırakılan akış da geçici dosyaları siler
+    stations.close()
+    assert list(tmp_path.iterdir()) == []
+    assert sum(1 for _ in generate_distributed_stations(DISTRIBUTION, seed=1, workers=2)) == sum(DISTRIBUTION.values())
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_parallel_requires_seed():
+    with pytest.raises(ValueError):
+        next(generate_distributed_stations(DISTRIBUTION, workers=2))
+
+
+@pytest.mark.parametrize('kwargs', [{'min_spacing_m': -5}, {'min_spacing_m': 0}, {'min_spacing_m': float('nan')},
+                                    {'workers': 0}, {'workers': -2, 'seed': 1}])
+def test_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        next(generate_distributed_stations(DISTRIBUTION, **kwargs))
+
+
+def test_incremental_rejects_invalid_spacing(tmp_path):
+    from zes_stations.incremental import IncrementalRun
+
+    with pytest.raises(ValueError):
+        IncrementalRun(str(tmp_path), DISTRIBUTION, {}, min_spacing_m=-1)
+
+
+@pytest.mark.parametrize('argv', [['--min-spacing', '-5'], ['--min-spacing', '0'], ['--workers', '0'],
+                                  ['--workers', '-1', '--seed', '1']])
+def test_cli_rejects_invalid_arguments(tmp_path, argv, capsys):
+    from zes_stations.cli import main
+
+    with pytest.raises(SystemExit) as exc:
+        main(argv + ['-o', str(tmp_path / 'out.json'), '-q'])
+    assert exc.value.code == 2
+    assert argv[0] in capsys.readouterr().err
+    assert not (tmp_path / 'out.json').exists()
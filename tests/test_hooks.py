@@ -0,0 +1,119 @@
+"""Metrik kancaları: çekiliş sayımı, şehir/aşama metrikleri ve süre ölçümü."""
+import random
+import time
+
+import numpy as np
+import pytest
+
+from zes_stations.data import DETAILED_LOCATIONS
+from zes_stations.generator import generate_distributed_stations
+from zes_stations.hooks import (
+    ConsoleHooks,
+    CountingRNG,
+    Hooks,
+    MetricsRecorder,
+    MultiHooks,
+    TimedConsumer,
+    TimedSink,
+    phase,
+)
+
+# 'Köy' için lokasyon yok: genel üretim yoluna düşer
+LOCATIONS = {'Ankara': DETAILED_LOCATIONS['Ankara']}
+DISTRIBUTION = {'Ankara': 50, 'Köy': 20}
+
+
+def test_counting_rng_python():
+    rng = CountingRNG(random.Random(1))
+    plain = random.Random(1)
+    assert rng.uniform(0, 1) == plain.uniform(0, 1)
+    assert rng.choices('abc', k=5) == plain.choices('abc', k=5)
+    assert rng.choice('abc') == plain.choice('abc')
+    assert rng.random() == plain.random()
+    assert rng.draws == 1 + 5 + 1 + 1
+
+
+def test_counting_rng_numpy():
+    rng = CountingRNG(np.random.default_rng(1))
+    plain = np.random.default_rng(1)
+    np.testing.assert_array_equal(rng.uniform(-1, 1, 7), plain.uniform(-1, 1, 7))
+    np.testing.assert_array_equal(rng.integers(0, 3, size=(2, 3)), plain.integers(0, 3, size=(2, 3)))
+    np.testing.assert_array_equal(rng.choice(3, size=4, p=[0.2, 0.3, 0.5]), plain.choice(3, size=4, p=[0.2, 0.3, 0.5]))
+    assert rng.random() == plain.random()
+    assert rng.draws == 7 + 6 + 4 + 1
+
+
+@pytest.mark.parametrize('engine, workers', [('python', 1), ('numpy', 1), ('python', 2), ('numpy', 2)])
+def test_recorder_through_generation(engine, workers):
+    recorder = MetricsRecorder()
+    stations = list(generate_distributed_stations(DISTRIBUTION, LOCATIONS, engine=engine, seed=4, workers=workers,
+                                                  hooks=recorder))
+    # Ölçüm rastgele akışı değiştirmez
+    assert stations == list(generate_distributed_stations(DISTRIBUTION, LOCATIONS, engine=engine, seed=4))
+
+    # İstasyon başına: lokasyonlu şehirde 2 sapma + güç + tip, genel üretimde 2 koordinat + güç
+    draws = {'Ankara': 4 * 50, 'Köy': 3 * 20}
+    assert [c['city'] for c in recorder.cities] == list(DISTRIBUTION)
+    for c in recorder.cities:
+        assert c['stations'] == DISTRIBUTION[c['city']]
+        assert c['rngDraws'] == draws[c['city']]
+        assert c['anchors'] == len(LOCATIONS.get(c['city'], ()))
+        assert c['seconds'] >= 0 and c['cached'] is False
+    assert recorder.counters == {'cities': 2, 'stations': 70, 'anchors': len(LOCATIONS['Ankara']),
+                                 'rngDraws': sum(draws.values())}
+    assert recorder.phases['generation'] == pytest.approx(sum(c['seconds'] for c in recorder.cities))
+    doc = recorder.to_dict()
+    assert set(doc) == {'phases', 'counters', 'cities'} and doc['counters'] == recorder.counters
+
+
+def test_uninstrumented_hooks_get_counts_only():
+    events = []
+
+    class Listener(Hooks):
+        def city_finished(self, city, metrics):
+            events.append((city, metrics))
+
+    list(generate_distributed_stations(DISTRIBUTION, LOCATIONS, seed=4, hooks=Listener()))
+    assert [(city, m['stations']) for city, m in events] == list(DISTRIBUTION.items())
+    assert all('rngDraws' not in m and 'seconds' not in m for _, m in events)
+
+
+def test_multi_hooks_and_console(capsys):
+    recorder = MetricsRecorder()
+    hooks = MultiHooks(None, ConsoleHooks(), recorder)
+    assert hooks.instrument
+    assert not MultiHooks(ConsoleHooks()).instrument
+    list(generate_distributed_stations(DISTRIBUTION, LOCATIONS, seed=4, hooks=hooks))
+    assert 'Ankara: 50 istasyon' in capsys.readouterr().out
+    assert recorder.counters['stations'] == 70
+
+
+def test_phase_and_timed_sink():
+    recorder = MetricsRecorder()
+    with phase(recorder, 'write'):
+        time.sleep(0.02)
+    with phase(recorder, 'write'):
+        pass
+    assert 0.02 <= recorder.phases['write'] < 0.5
+
+    seen = []
+    sink = TimedSink(lambda s: (seen.append(s), time.sleep(0.01)))
+    for i in range(3):
+        sink(i)
+    assert seen == [0, 1, 2] and 0.03 <= sink.seconds < 0.5
+
+
+def test_timed_consumer_counts_consumer_time_only():
+    def slow_producer():
+        for i in range(5):
+            time.sleep(0.03)
+            yield i
+
+    stream = TimedConsumer(slow_producer())
+    for _ in stream:
+        time.sleep(0.01)
+    time.sleep(0.02)
+    seconds = stream.finish()
+    # Tüketici 5 x 0.01 + akış sonrası 0.02; üreticinin 0.15 sn'si dahil değil
+    assert 0.07 <= seconds < 0.14
+    assert stream.finish() == seconds
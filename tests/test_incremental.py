@@ -0,0 +1,73 @@
+"""Artımlı üretimde kimlik kararlılığı ve delta içeriği."""
+import json
+
+import pytest
+
+from zes_stations.data import DETAILED_LOCATIONS
+from zes_stations.formats import _encode
+from zes_stations.incremental import IncrementalRun
+
+FIRST = {'Ankara': 30, 'Bursa': 20, 'Van': 5}
+SECOND = {'Ankara': 35, 'Bursa': 20}
+
+
+def _run(cache_dir, distribution, delta_file=None):
+    run = IncrementalRun(str(cache_dir), distribution, DETAILED_LOCATIONS, seed=1)
+    stations = {s['id']: s for s in run.stations()}
+    delta = run.commit(str(delta_file) if delta_file else None)
+    return run, stations, delta
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return tmp_path / 'cache'
+
+
+def test_first_run_writes_no_delta(cache, tmp_path):
+    delta_file = tmp_path / 'delta.json'
+    delta_file.write_text('{"added": []}')
+    run, stations, _ = _run(cache, FIRST, delta_file)
+    assert run.baseline
+    assert len(stations) == sum(FIRST.values())
+    # Önceki çalıştırmadan kalan delta da silinir; tam yüklenen veritabanına uygulanamaz
+    assert not delta_file.exists()
+
+
+def test_unchanged_run_reuses_cache(cache, tmp_path):
+    _, first, _ = _run(cache, FIRST)
+    run, again, delta = _run(cache, FIRST, tmp_path / 'delta.json')
+    assert not run.baseline
+    assert run.reused == list(FIRST) and run.regenerated == []
+    assert [_encode(s) for s in again.values()] == [_encode(s) for s in first.values()]
+    assert delta == {'added': [], 'removed': [], 'changed': []}
+
+
+def test_ids_are_stable_and_delta_matches(cache, tmp_path):
+    _, first, _ = _run(cache, FIRST)
+    delta_file = tmp_path / 'delta.json'
+    run, second, delta = _run(cache, SECOND, delta_file)
+    assert run.reused == ['Bursa'] and run.regenerated == ['Ankara']
+
+    # Aynı ada sahip istasyon aynı kimliği korur; yeni adlar en yüksek kimliğin arkasından gelir
+    first_by_name = {s['name']: station_id for station_id, s in first.items()}
+    for station_id, s in second.items():
+        if s['name'] in first_by_name:
+            assert first_by_name[s['name']] == station_id
+        else:
+            assert int(station_id[3:]) > len(first)
+    bursa = [i for i, s in first.items() if s['name'].startswith('Bursa - ')]
+    assert all(_encode(first[i]) == _encode(second[i]) for i in bursa)
+
+    added = sorted(i for i in second if i not in first)
+    removed = sorted(i for i in first if i not in second)
+    changed = sorted(i for i in second if i in first and _encode(first[i]) != _encode(second[i]))
+    assert sorted(s['id'] for s in delta['added']) == added
+    assert sorted(s['id'] for s in delta['removed']) == removed
+    assert sorted(s['id'] for s in delta['changed']) == changed
+    assert added and changed
+    # Van dağılımdan çıktı: tüm istasyonları silinmiş sayılır
+    assert {i for i, s in first.items() if s['name'].startswith('Van - ')} <= set(removed)
+
+    written = json.loads(delta_file.read_text(encoding='utf-8'))
+    assert written['regenerated'] == ['Ankara']
+    assert {k: written[k] for k in ('added', 'removed', 'changed')} == delta
@@ -0,0 +1,87 @@
+"""StationIndex sorgularının kaba kuvvet (tüm noktalar) hesabıyla karşılaştırılması."""
+import numpy as np
+import pytest
+
+from zes_stations.spatial import StationIndex, haversine_km
+
+
+@pytest.fixture(scope='module')
+def points():
+    rng = np.random.default_rng(6)
+    # Seyrek ülke geneli ve yoğun bir kent kümesi
+    lats = np.concatenate([rng.uniform(36.0, 42.0, 1500), rng.normal(41.0, 0.05, 1500)])
+    lngs = np.concatenate([rng.uniform(26.0, 44.0, 1500), rng.normal(29.0, 0.05, 1500)])
+    return lats, lngs
+
+
+@pytest.fixture(scope='module', params=[0.02, 0.05, 0.5])
+def index(request, points):
+    return StationIndex(*points, cell_deg=request.param)
+
+
+QUERIES = [(41.0, 29.0), (39.9, 32.85), (36.2, 44.5), (42.5, 25.0), (38.0, 35.0)]
+
+
+@pytest.mark.parametrize('lat, lng', QUERIES)
+def test_nearest_matches_brute_force(index, points, lat, lng):
+    dist = haversine_km(lat, lng, *points)
+    idx, km = index.nearest(lat, lng, k=7)
+    np.testing.assert_allclose(km, np.sort(dist)[:7])
+    np.testing.assert_allclose(dist[idx], km)
+
+
+@pytest.mark.parametrize('lat, lng', QUERIES)
+@pytest.mark.parametrize('radius_km', [0.5, 5.0, 80.0])
+def test_query_radius_matches_brute_force(index, points, lat, lng, radius_km):
+    dist = haversine_km(lat, lng, *points)
+    idx, km = index.query_radius(lat, lng, radius_km)
+    assert sorted(idx.tolist()) == np.flatnonzero(dist <= radius_km).tolist()
+    assert np.all(np.diff(km) >= 0)
+
+
+@pytest.mark.parametrize('box', [(40.9, 28.9, 41.1, 29.1), (37.0, 30.0, 39.5, 36.0), (43.0, 20.0, 44.0, 21.0)])
+def test_query_bbox_matches_brute_force(index, points, box):
+    lats, lngs = points
+    lat_min, lng_min, lat_max, lng_max = box
+    inside = (lats >= lat_min) & (lats <= lat_max) & (lngs >= lng_min) & (lngs <= lng_max)
+    assert sorted(index.query_bbox(*box).tolist()) == np.flatnonzero(inside).tolist()
+
+
+def test_nearest_many_and_max_km(index, points):
+    q_lat = np.asarray([q[0] for q in QUERIES])
+    q_lng = np.asarray([q[1] for q in QUERIES])
+    dist = haversine_km(q_lat[:, None], q_lng[:, None], points[0][None, :], points[1][None, :])
+    idx, km = index.nearest_many(q_lat, q_lng, max_km=50)
+    best = dist.min(axis=1)
+    found = best <= 50
+    np.testing.assert_allclose(km[found], best[found])
+    assert np.all(idx[~found] == -1) and np.all(np.isinf(km[~found]))
+
+
+def test_empty_index():
+    index = StationIndex([], [])
+    idx, km = index.nearest(39.0, 32.0, k=3)
+    assert len(idx) == 0 and len(km) == 0
+    assert len(index.query_bbox(30, 20, 45, 50)) == 0
+
+
+@pytest.mark.parametrize('cell_deg', [0.05, 0.1, 0.3])
+def test_stations_on_grid_edge_are_found(cell_deg):
+    # (max - min) / cell_deg tam sayıya yuvarlandığında son satır/sütun
+    lats = np.asarray([39.0, 41.0, 40.1])
+    lngs = np.asarray([32.0, 33.5, 32.9])
+    index = StationIndex(lats, lngs, cell_deg=cell_deg)
+    for i, (lat, lng) in enumerate(zip(lats, lngs)):
+        idx, km = index.nearest(lat, lng)
+        assert idx[0] == i and km[0] == 0
+    assert sorted(index.query_bbox(38, 31, 42, 34).tolist()) == [0, 1, 2]
+
+
+def test_nearest_far_outside_small_grid():
+    index = StationIndex([39.9, 39.91], [32.6, 32.62])
+    for lat, lng in [(40.1, 33.2), (36.0, 44.0), (42.0, 26.0)]:
+        dist = haversine_km(lat, lng, index.lats, index.lngs)
+        idx, km = index.nearest(lat, lng, k=2)
+        np.testing.assert_allclose(km, np.sort(dist))
+        idx, km = index.nearest(lat, lng, max_km=dist.min() - 1)
+        assert len(idx) == 0
@@ -0,0 +1,116 @@
+"""Sütunlu .zcol deposu: yazma/açma gidiş-dönüşü, sütun tipleri ve kapatma."""
+import os
+
+import numpy as np
+import pytest
+
+from zes_stations.aggregates import split_station_name
+from zes_stations.generator import generate_distributed_stations
+from zes_stations.store import MAGIC, ColumnarWriter, StationStore, columnar_path, write_columnar
+
+# float32 (enlem/boylam < 45 için ~3.8e-6 derece ulp) ve 6 basamağa yuvarlama
+COORD_TOLERANCE_DEG = 4e-6
+
+
+@pytest.fixture(scope='module')
+def stations():
+    return list(generate_distributed_stations({'İstanbul': 120, 'Ankara': 60, 'Van': 5}, seed=3))
+
+
+@pytest.fixture
+def path(tmp_path, stations):
+    path = tmp_path / 'stations.zcol'
+    assert write_columnar(iter(stations), path) == len(stations)
+    return path
+
+
+def test_round_trip(path, stations):
+    with StationStore(path) as store:
+        assert len(store) == len(stations)
+        for row, station in zip(store, stations):
+            record = row.to_dict()
+            coords = record.pop('coordinates')
+            expected = dict(station)
+            expected_coords = expected.pop('coordinates')
+            assert record == expected
+            assert list(record) == list(expected)
+            assert abs(coords['lat'] - expected_coords['lat']) <= COORD_TOLERANCE_DEG
+            assert abs(coords['lng'] - expected_coords['lng']) <= COORD_TOLERANCE_DEG
+        last = store[-1]
+        assert last.id == stations[-1]['id']
+        assert (last.city, last.district) == split_station_name(stations[-1]['name'])
+        assert (store[0].city, store[0].district) == split_station_name(stations[0]['name'])
+        with pytest.raises(IndexError):
+            store[len(stations)]
+
+
+def test_columns_and_dtypes(path, stations):
+    with StationStore(path) as store:
+        expected = {'id': np.uint32, 'lat': np.float32, 'lng': np.float32, 'dc_sockets': np.uint8,
+                    'ac_sockets': np.uint8, 'power': np.uint8, 'type': np.uint8, 'status': np.uint8,
+                    'name': np.uint32, 'city': np.uint32}
+        for name, dtype in expected.items():
+            column = np.asarray(store.column(name))
+            assert column.dtype == dtype and len(column) == len(stations)
+        np.testing.assert_array_equal(store.column('id'), [int(s['id'][3:]) for s in stations])
+        np.testing.assert_array_equal(store.column('dc_sockets'), [s['dcSockets'] for s in stations])
+        np.testing.assert_array_equal(np.asarray(store.column('lat')),
+                                      np.asarray([s['coordinates']['lat'] for s in stations], np.float32))
+        power = np.asarray(store.enums['power'])[np.asarray(store.column('power'))]
+        assert power.tolist() == [s['power'] for s in stations]
+        assert sorted(store.enums['type']) == sorted({s['type'] for s in stations})
+
+
+def test_close_and_reopen(path, stations):
+    store = StationStore(path)
+    lat = np.asarray(store.column('lat'))
+    name = store[0].name
+    # Dışa aktarılmış numpy dizisi varken de close() hata vermez, dizi geçerli kalır
+    store.close()
+    store.close()
+    assert lat[0] == np.float32(stations[0]['coordinates']['lat'])
+    with pytest.raises(KeyError):
+        store.column('lat')
+    del lat
+
+    with StationStore(path) as again:
+        assert again[0].name == name
+        assert [r.id for r in again] == [s['id'] for s in stations]
+
+
+def _open_fds():
+    try:
+        return len(os.listdir('/proc/self/fd'))
+    except FileNotFoundError:
+        pytest.skip('/proc/self/fd yok')
+
+
+def test_invalid_files(tmp_path):
+    empty = tmp_path / 'empty.zcol'
+    empty.write_bytes(b'')
+    with pytest.raises(ValueError):
+        StationStore(empty)
+    other = tmp_path / 'other.zcol'
+    other.write_bytes(b'[{"id": "ZES0001"}]')
+    with pytest.raises(ValueError):
+        StationStore(other)
+    broken = tmp_path / 'broken.zcol'
+    broken.write_bytes(MAGIC + (40).to_bytes(4, 'little') + b'{"version": 1, "count"')
+    fds = _open_fds()
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            StationStore(broken)
+    # Bozuk başlıkta dosya tanıtıcısı açık kalmaz
+    assert _open_fds() == fds
+
+
+def test_writer_rejects_non_canonical_ids(tmp_path, stations):
+    writer = ColumnarWriter(tmp_path / 'x.zcol')
+    for bad in ('ZES12', 'ZES00012', 'X0001'):
+        with pytest.raises(ValueError):
+            writer.add({**stations[0], 'id': bad})
+    assert len(writer) == 0
+
+
+def test_columnar_path():
+    assert columnar_path('out/real_zes_stations.ndjson.gz') == 'out/real_zes_stations.zcol'
@@ -0,0 +1,44 @@
+"""ZES istasyon veri seti üretimi ve analiz araçları.
+
+İçe aktarma yan etkisizdir; üretim için generate_distributed_stations()'ı,
+komut satırı için python -m zes_stations'ı kullanın. numpy gerektiren analiz
+modülleri (spatial, charging, coverage, placement, audit) ayrıca içe aktarılır.
+"""
+from .aggregates import StationAggregator, aggregates_path, split_station_name
+from .data import DETAILED_LOCATIONS, EV_DISTRIBUTION_2025
+from .formats import OUTPUT_FORMATS, iter_station_file, output_stem, write_stations
+from .generator import (
+    ENGINES,
+    PLACEMENTS,
+    POWER_TIERS,
+    city_rng,
+    generate_distributed_stations,
+    iter_city_stations,
+    iter_city_stations_vectorized,
+    scale_distribution,
+)
+from .hooks import ConsoleHooks, Hooks, MetricsRecorder, MultiHooks
+
+__all__ = [
+    'DETAILED_LOCATIONS',
+    'ENGINES',
+    'EV_DISTRIBUTION_2025',
+    'OUTPUT_FORMATS',
+    'PLACEMENTS',
+    'POWER_TIERS',
+    'ConsoleHooks',
+    'Hooks',
+    'MetricsRecorder',
+    'MultiHooks',
+    'StationAggregator',
+    'aggregates_path',
+    'city_rng',
+    'generate_distributed_stations',
+    'iter_city_stations',
+    'iter_city_stations_vectorized',
+    'iter_station_file',
+    'output_stem',
+    'scale_distribution',
+    'split_station_name',
+    'write_stations',
+]
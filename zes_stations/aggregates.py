@@ -0,0 +1,123 @@
+"""Üretim sırasında artımlı tutulan şehir/ilçe toplamları (API sidecar dosyası)."""
+import datetime
+import json
+import os
+
+from .formats import output_stem
+from .generator import POWER_TIERS, TIER_POWER
+
+
+def aggregates_path(output):
+    """Çıktının yanına yazılan şehir/ilçe özet dosyasının adı."""
+    return output_stem(output) + '.aggregates.json'
+
+
+def file_fingerprint(path):
+    """Özetin ait olduğu istasyon dosyasının kimliği (ad, boyut, değişiklik zamanı).
+
+    server/index.js bunu dosyanın fs.stat() sonucuyla karşılaştırır; aynı
+    sayıda istasyonlu ama farklı bir üretimin özeti böylece sunulmaz.
+    """
+    st = os.stat(path)
+    # Nanosaniye değeri JSON sayısı olarak hassasiyet kaybeder; metin olarak yazılır
+    return {'file': os.path.basename(path), 'size': st.st_size, 'mtimeNs': str(st.st_mtime_ns)}
+
+
+def split_station_name(name):
+    """"İstanbul - Bağcılar - Bağcılar Meydan AVM" -> ('İstanbul', 'Bağcılar').
+
+    Ad yalnızca ' - ' ayracından bölünür; çok kelimeli şehir/ilçe adları korunur.
+    İlçesi olmayan adlarda ilçe boş döner.
+    """
+    parts = name.split(' - ')
+    if len(parts) >= 3:
+        return parts[0], parts[1]
+    return parts[0], ''
+
+
+_POWER_TIER_NAMES = dict(zip(TIER_POWER, POWER_TIERS))
+
+
+def _new_bucket(**labels):
+    return {**labels, 'zesStations': 0, 'acSockets': 0, 'dcSockets': 0, 'totalSockets': 0,
+            'powerMix': {tier: 0 for tier in POWER_TIERS}}
+
+
+def _add_to_bucket(bucket, ac, dc, tier):
+    bucket['zesStations'] += 1
+    bucket['acSockets'] += ac
+    bucket['dcSockets'] += dc
+    bucket['totalSockets'] += ac + dc
+    mix = bucket['powerMix']
+    mix[tier] = mix.get(tier, 0) + 1
+
+
+class StationAggregator:
+    """İstasyonlar üretilirken şehir ve ilçe toplamlarını artımlı olarak tutar.
+
+    Toplamlar server/index.js'deki aggregateByCity()/getSummary() ile aynı
+    alanları kullanır; to_sidecar() API'nin doğrudan sunabileceği, şehir adına
+    göre indekslenmiş bir belge döndürür.
+    """
+
+    def __init__(self):
+        self.cities = {}
+        self._districts = {}
+
+    def add(self, station):
+        city, district = split_station_name(station['name'])
+        ac = int(station.get('acSockets') or 0)
+        dc = int(station.get('dcSockets') or 0)
+        tier = _POWER_TIER_NAMES.get(station.get('power'), station.get('power'))
+
+        entry = self.cities.get(city)
+        if entry is None:
+            entry = self.cities[city] = _new_bucket(city=city)
+            self._districts[city] = {}
+        _add_to_bucket(entry, ac, dc, tier)
+
+        districts = self._districts[city]
+        bucket = districts.get(district)
+        if bucket is None:
+            bucket = districts[district] = _new_bucket(district=district)
+        _add_to_bucket(bucket, ac, dc, tier)
+
+    def city_rows(self):
+        """Şehirler, istasyon sayısına göre azalan sırada."""
+        return sorted(self.cities.values(), key=lambda e: e['zesStations'], reverse=True)
+
+    def summary(self, top=10):
+        rows = self.city_rows()
+        ac = sum(e['acSockets'] for e in rows)
+        dc = sum(e['dcSockets'] for e in rows)
+        return {
+            'totalStations': sum(e['zesStations'] for e in rows),
+            'totalACSockets': ac,
+            'totalDCSockets': dc,
+            'totalSockets': ac + dc,
+            'cityCount': len(rows),
+            'topCities': rows[:top],
+        }
+
+    def to_sidecar(self, source=None):
+        """source: file_fingerprint() sonucu; verilmezse API özeti doğrulayamaz ve kullanmaz."""
+        cities = []
+        for entry in self.city_rows():
+            districts = sorted(self._districts[entry['city']].values(),
+                               key=lambda e: e['zesStations'], reverse=True)
+            cities.append({**entry, 'districts': districts})
+        return {
+            'version': 2,
+            'generatedAt': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            'source': source,
+            'summary': self.summary(),
+            'cities': cities,
+            # Küçük harfli şehir adı -> cities içindeki sıra
+            'index': {entry['city'].lower(): i for i, entry in enumerate(cities)},
+        }
+
+    def write(self, path, source=None):
+        """Özeti yazar; source, istasyon dosyasının yolu (yazımı bittikten sonra)."""
+        fingerprint = file_fingerprint(source) if source else None
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_sidecar(fingerprint), f, ensure_ascii=False, separators=(',', ':'))
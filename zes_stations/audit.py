@@ -0,0 +1,349 @@
+"""İstasyon veri setleri için tek geçişli tutarlılık denetimi.
+
+Dosya bir kez akıtılır; her kayıtta yalnızca sabit süreli işler yapılır:
+
+- kimlik tekilliği (ZESnnnn kimlikleri bit dizisinde, diğerleri kümede; bit
+  dizisi ID_BITMAP_BITS ile sınırlıdır, daha büyük numaralar kümeye gider),
+- aynı adı taşıyan kayıtlar,
+- şehir/koordinat uyumu: koordinata en yakın referans noktası (il merkezleri
+  ve DETAILED_LOCATIONS lokasyonları) başka bir şehre aitse ve addaki şehrin
+  en yakın referansı bundan CITY_MATCH_SLACK_KM'den fazla uzaksa kayıt
+  uyumsuzdur (ör. lokasyonu olmayan şehirler için üretilen 39 + U(-2, 4)
+  koordinatları veya komşu ile karıştırılmış şehir).
+
+Koordinatlar ve şehir kodları geçiş sırasında dizilere alınır; şehir uyumu
+sonunda bloklar halinde vektörel olarak hesaplanır. Yakın kopyalar
+(aralarında near_m'den az mesafe olan çiftler) ikili karşılaştırma
+yapılmadan mekânsal karma ile bulunur. Her nokta near_m boyutlu hücresine düşer ve
+yalnızca kendi hücresindeki ve komşu hücrelerdeki noktalarla karşılaştırılır.
+"""
+import argparse
+import json
+import math
+import time
+from array import array
+
+import numpy as np
+
+from .aggregates import split_station_name
+from .data import CITY_CENTERS, DETAILED_LOCATIONS
+from .spatial import haversine_km
+
+NEAR_DUPLICATE_M = 10.0
+# Şehrin en yakın referansı, en yakın başka şehir referansından bu kadar
+# uzak olabilir (il sınırındaki istasyonlar için pay)
+CITY_MATCH_SLACK_KM = 5.0
+MAX_EXAMPLES = 20
+# ZESnnnn bit dizisinin üst sınırı (16 MB); daha büyük numaralar kümede tutulur
+ID_BITMAP_BITS = 1 << 27
+
+M_PER_DEG_LAT = 111_195.0
+# Komşu hücre aramasında aynı anda açılan en fazla aday çifti
+_PAIR_BLOCK = 1 << 22
+# Şehir uyumu hesabında aynı anda işlenen istasyon sayısı
+_MATCH_CHUNK = 8192
+
+
+def city_references(centers=None, locations=None):
+    """Şehir uyumu için referans noktaları: (lats, lngs, şehir kodları, şehir adları).
+
+    Her il merkezi ve her lokasyon, ait olduğu şehrin kodunu taşır.
+    """
+    if centers is None:
+        centers = CITY_CENTERS
+    if locations is None:
+        locations = DETAILED_LOCATIONS
+    names = list(dict.fromkeys([*centers, *locations]))
+    codes = {city: code for code, city in enumerate(names)}
+    lats, lngs, owners = [], [], []
+    for city, (lat, lng) in centers.items():
+        lats.append(lat)
+        lngs.append(lng)
+        owners.append(codes[city])
+    for city, anchors in locations.items():
+        for a in anchors:
+            lats.append(a['lat'])
+            lngs.append(a['lng'])
+            owners.append(codes[city])
+    return np.asarray(lats, dtype=np.float64), np.asarray(lngs, dtype=np.float64), np.asarray(owners, np.int32), names
+
+
+def city_mismatches(lats, lngs, codes, references=None, slack_km=CITY_MATCH_SLACK_KM):
+    """Şehriyle uyumsuz noktalar: (indeksler, en yakın referansın şehir kodu).
+
+    Kodu -1 olan (şehri bilinmeyen) noktalar ve geçersiz koordinatlar atlanır.
+    """
+    if references is None:
+        references = city_references()
+    r_lat, r_lng, r_code, _ = references
+    lats = np.asarray(lats, dtype=np.float64)
+    lngs = np.asarray(lngs, dtype=np.float64)
+    codes = np.asarray(codes, dtype=np.int32)
+    out_i, out_near = [], []
+    for start in range(0, len(lats), _MATCH_CHUNK):
+        stop = start + _MATCH_CHUNK
+        lat = lats[start:stop]
+        lng = lngs[start:stop]
+        code = codes[start:stop]
+        check = np.flatnonzero((code >= 0) & np.isfinite(lat) & np.isfinite(lng))
+        if not len(check):
+            continue
+        dist = haversine_km(lat[check, None], lng[check, None], r_lat[None, :], r_lng[None, :])
+        own = r_code[None, :] == code[check, None]
+        own_km = np.where(own, dist, np.inf).min(axis=1)
+        other = np.where(own, np.inf, dist)
+        nearest = other.argmin(axis=1)
+        other_km = other[np.arange(len(check)), nearest]
+        bad = own_km > other_km + slack_km
+        out_i.append(start + check[bad])
+        out_near.append(r_code[nearest[bad]])
+    if not out_i:
+        return np.empty(0, np.int64), np.empty(0, np.int32)
+    return np.concatenate(out_i), np.concatenate(out_near)
+
+
+def near_duplicate_pairs(lats, lngs, near_m=NEAR_DUPLICATE_M):
+    """Aralarında near_m metreden az mesafe olan nokta çiftleri: (i, j, metre), i < j.
+
+    Hücre kenarı near_m olduğundan yakın bir çift ya aynı ya da komşu
+    hücrelerdedir. Komşuların yarısına (doğu ve kuzey) bakmak her çifti bir
+    kez bulmaya yeter. Geçersiz (NaN) koordinatlar atlanır.
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lngs = np.asarray(lngs, dtype=np.float64)
+    valid = np.flatnonzero(np.isfinite(lats) & np.isfinite(lngs))
+    empty = np.empty(0, np.int64)
+    if len(valid) < 2:
+        return empty, empty, np.empty(0)
+    lat = lats[valid]
+    lng = lngs[valid]
+    lat_cell = near_m / M_PER_DEG_LAT
+    # Boylam hücresi en yüksek enlemde bile near_m'den dar olmamalı
+    lng_cell = lat_cell / max(math.cos(math.radians(min(float(np.abs(lat).max()), 89.9))), 1e-6)
+    rows = np.floor(lat / lat_cell).astype(np.int64)
+    cols = np.floor(lng / lng_cell).astype(np.int64)
+    cols -= cols.min() - 1
+    width = int(cols.max()) + 2
+    keys = (rows - rows.min()) * width + cols
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    n = len(order)
+    positions = np.arange(n)
+
+    out_i, out_j, out_m = [], [], []
+    for offset in (0, 1, width - 1, width, width + 1):
+        target = sorted_keys + offset
+        lo = np.searchsorted(sorted_keys, target, side='left')
+        hi = np.searchsorted(sorted_keys, target, side='right')
+        if offset == 0:
+            # Aynı hücrede yalnızca sıralamada sonra gelenler
+            lo = np.maximum(lo, positions + 1)
+        counts = np.maximum(hi - lo, 0)
+        # Aday çiftleri bloklar halinde aç; bellek çift sayısıyla sınırlı kalır
+        ends = np.cumsum(counts)
+        start = 0
+        while start < n:
+            base = ends[start - 1] if start else 0
+            stop = max(int(np.searchsorted(ends, base + _PAIR_BLOCK, side='right')), start + 1)
+            c = counts[start:stop]
+            total = int(c.sum())
+            if total:
+                a = np.repeat(positions[start:stop], c)
+                b = np.arange(total) + np.repeat(lo[start:stop] - (np.cumsum(c) - c), c)
+                ia = order[a]
+                ib = order[b]
+                meters = haversine_km(lat[ia], lng[ia], lat[ib], lng[ib]) * 1000
+                close = meters < near_m
+                out_i.append(valid[np.minimum(ia, ib)[close]])
+                out_j.append(valid[np.maximum(ia, ib)[close]])
+                out_m.append(meters[close])
+            start = stop
+    if not out_i:
+        return empty, empty, np.empty(0)
+    i = np.concatenate(out_i)
+    j = np.concatenate(out_j)
+    meters = np.concatenate(out_m)
+    by_pair = np.lexsort((j, i))
+    return i[by_pair], j[by_pair], meters[by_pair]
+
+
+class StationAudit:
+    """İstasyon akışını tek geçişte denetler; add() kayıt kayıt çağrılır, report() sonucu verir."""
+
+    def __init__(self, near_m=NEAR_DUPLICATE_M, references=None, max_examples=MAX_EXAMPLES):
+        self.near_m = float(near_m)
+        self.references = city_references() if references is None else references
+        self._city_codes = {city: code for code, city in enumerate(self.references[3])}
+        self.max_examples = max_examples
+        self.count = 0
+        self.ids = []
+        self.lats = array('d')
+        self.lngs = array('d')
+        self.codes = array('i')
+        self._seen_numbers = bytearray()
+        self._seen_ids = set()
+        self._seen_names = set()
+        self.duplicate_ids = []
+        self.duplicate_id_count = 0
+        self.duplicate_name_count = 0
+        self.duplicate_names = []
+        self.unknown_cities = {}
+        self.invalid_count = 0
+        self.invalid = []
+
+    def _id_seen(self, station_id):
+        # ZESnnnn kimlikleri bit dizisinde, diğerleri kümede tutulur
+        digits = station_id[3:] if isinstance(station_id, str) and station_id.startswith('ZES') else ''
+        number = int(digits) if digits.isdigit() else -1
+        # Yalnızca kanonik biçim (ZES0012 gibi); ZES012 ayrı bir kimlik olarak kümeye gider.
+        # Bit dizisi ID_BITMAP_BITS ile sınırlıdır; tek bir ZES99999999999 kaydı onu şişiremez
+        if 0 <= number < ID_BITMAP_BITS and len(digits) == max(4, len(str(number))):
+            byte, bit = divmod(number, 8)
+            seen = self._seen_numbers
+            if byte >= len(seen):
+                seen.extend(bytes(min(max(byte + 1, 2 * len(seen)), ID_BITMAP_BITS // 8) - len(seen)))
+            if seen[byte] >> bit & 1:
+                return True
+            seen[byte] |= 1 << bit
+            return False
+        if station_id in self._seen_ids:
+            return True
+        self._seen_ids.add(station_id)
+        return False
+
+    def add(self, station):
+        self.count += 1
+        station_id = station.get('id')
+        name = station.get('name') or ''
+        self.ids.append(station_id)
+
+        if self._id_seen(station_id):
+            self.duplicate_id_count += 1
+            if len(self.duplicate_ids) < self.max_examples:
+                self.duplicate_ids.append({'id': station_id, 'name': name})
+
+        key = hash(name)
+        if key in self._seen_names:
+            self.duplicate_name_count += 1
+            if len(self.duplicate_names) < self.max_examples:
+                self.duplicate_names.append({'id': station_id, 'name': name})
+        else:
+            self._seen_names.add(key)
+
+        coords = station.get('coordinates') or {}
+        try:
+            lat = float(coords['lat'])
+            lng = float(coords['lng'])
+        except (KeyError, TypeError, ValueError):
+            lat = lng = math.nan
+        if not (-90 <= lat <= 90 and -180 <= lng <= 180):
+            lat = lng = math.nan
+            self.invalid_count += 1
+            if len(self.invalid) < self.max_examples:
+                self.invalid.append({'id': station_id, 'name': name, 'coordinates': station.get('coordinates')})
+        self.lats.append(lat)
+        self.lngs.append(lng)
+
+        city, _ = split_station_name(name)
+        code = self._city_codes.get(city, -1)
+        if code < 0 and lat == lat:
+            self.unknown_cities[city] = self.unknown_cities.get(city, 0) + 1
+        self.codes.append(code)
+
+    def report(self):
+        """Denetim sonucu; yakın kopya çiftleri burada, biriken koordinatlardan bulunur."""
+        i, j, meters = near_duplicate_pairs(self.lats, self.lngs, self.near_m)
+        involved = np.zeros(self.count, dtype=bool)
+        involved[i] = True
+        involved[j] = True
+        examples = [{'ids': [self.ids[a], self.ids[b]], 'distanceM': round(float(m), 2)}
+                    for a, b, m in zip(i[:self.max_examples].tolist(), j[:self.max_examples].tolist(),
+                                       meters[:self.max_examples].tolist())]
+
+        bad, nearest = city_mismatches(self.lats, self.lngs, self.codes, self.references)
+        names = self.references[3]
+        codes = np.asarray(self.codes, dtype=np.int32)
+        by_city = {}
+        for code, count in zip(*(a.tolist() for a in np.unique(codes[bad], return_counts=True))):
+            by_city[names[code]] = count
+        mismatches = [{'id': self.ids[k], 'city': names[self.codes[k]],
+                       'coordinates': {'lat': self.lats[k], 'lng': self.lngs[k]},
+                       'nearestCity': names[n]}
+                      for k, n in zip(bad[:self.max_examples].tolist(), nearest[:self.max_examples].tolist())]
+        return {
+            'stations': self.count,
+            'duplicateIds': {'count': self.duplicate_id_count, 'examples': self.duplicate_ids},
+            'duplicateNames': {'count': self.duplicate_name_count, 'examples': self.duplicate_names},
+            'nearDuplicates': {
+                'thresholdM': self.near_m,
+                'pairs': int(len(i)),
+                'exactPairs': int((meters == 0).sum()),
+                'stations': int(involved.sum()),
+                'examples': examples,
+            },
+            'cityMismatches': {
+                'slackKm': CITY_MATCH_SLACK_KM,
+                'count': int(len(bad)),
+                'byCity': dict(sorted(by_city.items(), key=lambda item: item[1], reverse=True)),
+                'examples': mismatches,
+            },
+            'unknownCities': self.unknown_cities,
+            'invalidCoordinates': {'count': self.invalid_count, 'examples': self.invalid},
+        }
+
+
+def audit_stations(stations, near_m=NEAR_DUPLICATE_M, references=None, max_examples=MAX_EXAMPLES):
+    """Bir istasyon akışını denetler ve report() sonucunu döndürür."""
+    audit = StationAudit(near_m, references, max_examples)
+    for station in stations:
+        audit.add(station)
+    return audit.report()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='İstasyon veri seti için kimlik, yakın kopya ve şehir/koordinat denetimi')
+    parser.add_argument('input', help='real_zes_stations.json, .ndjson veya .ndjson.gz')
+    parser.add_argument('--near', type=float, default=NEAR_DUPLICATE_M, metavar='METRE',
+                        help=f'yakın kopya eşiği (varsayılan: {NEAR_DUPLICATE_M:g} m)')
+    parser.add_argument('-o', '--output', help='denetim sonucunu JSON olarak yaz')
+    parser.add_argument('--strict', action='store_true',
+                        help='yinelenen kimlik, yakın kopya veya şehir uyumsuzluğu varsa hata koduyla çık')
+    args = parser.parse_args(argv)
+
+    if args.near <= 0:
+        parser.error('--near pozitif olmalı')
+
+    from .formats import iter_station_file
+
+    t0 = time.perf_counter()
+    report = audit_stations(iter_station_file(args.input), args.near)
+    elapsed = time.perf_counter() - t0
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    near = report['nearDuplicates']
+    mismatches = report['cityMismatches']
+    print(f"🔎 {report['stations']} istasyon denetlendi ({elapsed:.2f} sn)")
+    print(f"  Yinelenen kimlik: {report['duplicateIds']['count']}")
+    print(f"  Yinelenen ad: {report['duplicateNames']['count']}")
+    print(f"  {near['thresholdM']:g} m'den yakın çift: {near['pairs']} "
+          f"({near['exactPairs']} birebir aynı, {near['stations']} istasyon)")
+    print(f"  Şehriyle uyumsuz koordinat: {mismatches['count']}")
+    for city, count in list(mismatches['byCity'].items())[:10]:
+        print(f"    {city}: {count}")
+    if report['unknownCities']:
+        print(f"  Referansı olmayan şehirler: {', '.join(sorted(report['unknownCities']))}")
+    print(f"  Geçersiz koordinat: {report['invalidCoordinates']['count']}")
+    if args.output:
+        print(f"📝 {args.output}")
+
+    failed = (report['duplicateIds']['count'] or near['pairs'] or mismatches['count']
+              or report['invalidCoordinates']['count'])
+    if args.strict and failed:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
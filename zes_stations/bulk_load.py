@@ -0,0 +1,397 @@
+"""Üretilen istasyonları doğrudan MySQL uyumlu şemaya toplu yükler.
+
+scripts/seed-mysql.mjs ve server/index.js'in beklediği bolgeler, sehirler,
+istasyonlar, istasyon_soketleri ve sehir_metrikleri tablolarını oluşturur ve
+istasyonları JSON'a yazmadan, üreticiden akıtarak yükler:
+
+- çok satırlı INSERT'ler, büyük işlemler (transaction) içinde,
+- ikincil indeksler ve yabancı anahtarlar yükleme bittikten sonra bir kez.
+
+sehirler.nufus ve sehir_metrikleri, seed-mysql.mjs ile aynı referans
+verilerinden (REAL_POPULATIONS, REAL_EV_DATA, ZES_STATIONS) ve aynı
+formüllerle doldurulur; iki yolla yüklenen veritabanları API'de aynı
+şehir metriklerini verir.
+
+Testler ve yerel analiz için SQLite dosyası, sunucu için MySQL (pymysql) desteklenir.
+"""
+import argparse
+import math
+import os
+import sqlite3
+import time
+
+from .aggregates import StationAggregator, split_station_name
+from .data import (
+    DEFAULT_POPULATION,
+    EV_DISTRIBUTION_2025,
+    REAL_EV_DATA,
+    REAL_POPULATIONS,
+    SEASONALITY,
+    ZES_STATIONS,
+)
+from .formats import iter_station_file
+from .generator import ENGINES, generate_distributed_stations, scale_distribution
+from .hooks import ConsoleHooks
+
+try:
+    import pymysql
+except ImportError:  # yalnızca --mysql için gerekli
+    pymysql = None
+
+# scripts/seed-mysql.mjs ile aynı bölge -> şehir eşlemesi
+BOLGE_SEHIRLERI = {
+    'Marmara': ['İstanbul', 'Bursa', 'Kocaeli', 'Tekirdağ', 'Balıkesir', 'Çanakkale', 'Sakarya', 'Bilecik',
+                'Yalova', 'Edirne', 'Kırklareli'],
+    'Ege': ['İzmir', 'Manisa', 'Aydın', 'Denizli', 'Muğla', 'Afyonkarahisar', 'Kütahya', 'Uşak'],
+    'Akdeniz': ['Antalya', 'Adana', 'Mersin', 'Hatay', 'Kahramanmaraş', 'Osmaniye', 'Isparta', 'Burdur'],
+    'İç Anadolu': ['Ankara', 'Konya', 'Kayseri', 'Eskişehir', 'Sivas', 'Kırıkkale', 'Aksaray', 'Karaman',
+                   'Kırşehir', 'Niğde', 'Nevşehir', 'Yozgat', 'Çankırı'],
+    'Karadeniz': ['Samsun', 'Trabzon', 'Ordu', 'Giresun', 'Rize', 'Artvin', 'Gümüşhane', 'Bayburt', 'Tokat',
+                  'Amasya', 'Çorum', 'Sinop', 'Kastamonu', 'Bartın', 'Zonguldak', 'Karabük', 'Düzce', 'Bolu'],
+    'Doğu Anadolu': ['Erzurum', 'Malatya', 'Elazığ', 'Van', 'Erzincan', 'Kars', 'Ağrı', 'Iğdır', 'Ardahan',
+                     'Muş', 'Bitlis', 'Hakkari', 'Bingöl', 'Tunceli'],
+    'Güneydoğu Anadolu': ['Gaziantep', 'Şanlıurfa', 'Diyarbakır', 'Mardin', 'Batman', 'Adıyaman', 'Siirt',
+                          'Şırnak', 'Kilis'],
+}
+
+TABLES = ('sehir_metrikleri', 'istasyon_soketleri', 'istasyonlar', 'sehirler', 'bolgeler')
+
+# Tek INSERT deyimindeki satır sayısı ve işlem (commit) aralığı
+ROWS_PER_STATEMENT = 500
+STATIONS_PER_TRANSACTION = 250_000
+
+
+class SQLiteDialect:
+    placeholder = '?'
+    pk = 'INTEGER PRIMARY KEY'
+    socket_type = "VARCHAR(2) NOT NULL CHECK (tur IN ('AC','DC'))"
+    table_suffix = ''
+
+    def references(self, table):
+        # SQLite ALTER TABLE ile yabancı anahtar ekleyemez; tanımda yer alır
+        return f' REFERENCES {table}(id)'
+
+    def prepare(self, cur):
+        cur.execute('PRAGMA journal_mode = MEMORY')
+        cur.execute('PRAGMA synchronous = OFF')
+        cur.execute('PRAGMA temp_store = MEMORY')
+        cur.execute('PRAGMA cache_size = -262144')
+
+    def finish(self, cur):
+        pass
+
+    def foreign_keys(self):
+        return []
+
+
+class MySQLDialect:
+    placeholder = '%s'
+    pk = 'INT AUTO_INCREMENT PRIMARY KEY'
+    socket_type = "ENUM('AC','DC') NOT NULL"
+    table_suffix = ' ENGINE=InnoDB DEFAULT CHARSET=utf8mb4'
+
+    def references(self, table):
+        return ''
+
+    def prepare(self, cur):
+        cur.execute('SET NAMES utf8mb4')
+        cur.execute('SET FOREIGN_KEY_CHECKS=0')
+        cur.execute('SET UNIQUE_CHECKS=0')
+
+    def finish(self, cur):
+        cur.execute('SET UNIQUE_CHECKS=1')
+        cur.execute('SET FOREIGN_KEY_CHECKS=1')
+
+    def foreign_keys(self):
+        # seed-mysql.mjs ile aynı kısıtlar; yükleme sonrası eklenir
+        return [
+            'ALTER TABLE sehirler ADD CONSTRAINT fk_sehir_bolge FOREIGN KEY (bolge_id) REFERENCES bolgeler(id) '
+            'ON DELETE RESTRICT ON UPDATE CASCADE',
+            'ALTER TABLE istasyonlar ADD CONSTRAINT fk_istasyon_sehir FOREIGN KEY (sehir_id) REFERENCES sehirler(id) '
+            'ON DELETE CASCADE ON UPDATE CASCADE',
+            'ALTER TABLE istasyon_soketleri ADD CONSTRAINT fk_soket_istasyon FOREIGN KEY (istasyon_id) '
+            'REFERENCES istasyonlar(id) ON DELETE CASCADE ON UPDATE CASCADE',
+            'ALTER TABLE sehir_metrikleri ADD CONSTRAINT fk_metric_sehir FOREIGN KEY (sehir_id) REFERENCES sehirler(id) '
+            'ON DELETE CASCADE ON UPDATE CASCADE',
+        ]
+
+
+def _schema(d):
+    return [
+        f'CREATE TABLE bolgeler (id {d.pk}, ad VARCHAR(64) UNIQUE NOT NULL){d.table_suffix}',
+        f'CREATE TABLE sehirler (id {d.pk}, ad VARCHAR(128) UNIQUE NOT NULL, '
+        f'bolge_id INT NOT NULL{d.references("bolgeler")}, nufus INT DEFAULT 0){d.table_suffix}',
+        f'CREATE TABLE istasyonlar (id {d.pk}, ad VARCHAR(255) NOT NULL, '
+        f'sehir_id INT NOT NULL{d.references("sehirler")}){d.table_suffix}',
+        f'CREATE TABLE istasyon_soketleri (id {d.pk}, istasyon_id INT NOT NULL{d.references("istasyonlar")}, '
+        f'tur {d.socket_type}, adet INT NOT NULL DEFAULT 0){d.table_suffix}',
+        f'CREATE TABLE sehir_metrikleri (sehir_id INT PRIMARY KEY{d.references("sehirler")}, ev_sayisi INT, '
+        f'ev_buyume_orani INT, sarj_talebi INT, ag_kapsami INT, zes_pazar_pay INT, '
+        f'mevsimsellik_katsayi DECIMAL(3,1), ac_soket INT, dc_soket INT, toplam_soket INT, '
+        f'zes_istasyon INT){d.table_suffix}',
+    ]
+
+
+# Yükleme bittikten sonra bir kez oluşturulan indeksler
+INDEXES = [
+    'CREATE INDEX idx_bolge ON sehirler (bolge_id)',
+    'CREATE INDEX idx_sehir ON istasyonlar (sehir_id)',
+    'CREATE INDEX idx_istasyon_ad ON istasyonlar (ad)',
+    'CREATE INDEX idx_soket_istasyon ON istasyon_soketleri (istasyon_id)',
+]
+
+
+def _js_round(x):
+    # JavaScript Math.round: yarımlar yukarı yuvarlanır (Python round çifte yuvarlar)
+    return math.floor(x + 0.5)
+
+
+def city_metrics(city, zes, ac, dc):
+    """seed-mysql.mjs ile aynı sehir_metrikleri satırı (sehir_id hariç).
+
+    zes/ac/dc yüklenen istasyonlardan gelir; REAL_EV_DATA'da olan şehirlerde
+    soketler ve ZES sayısı gerçek pazar verisiyle değiştirilir.
+    """
+    ev = REAL_EV_DATA.get(city)
+    if ev:
+        total = ev['totalStations']
+        ac = _js_round(total * 0.6)
+        dc = total - ac
+        zes = ZES_STATIONS.get(city, zes)
+    ev_count = ev['evCount'] if ev else 0
+    demand = (ev and ev['totalStations']) or max(10, ac + dc)
+    growth = min(100, max(20, _js_round(((ev and ev['stationChangePercent']) or 3) * 10)))
+    coverage = min(95, _js_round((ac + dc) / max(ev_count, 1) * 100))
+    market_share = min(100, _js_round(zes / ev['totalStations'] * 100)) if ev else 35
+    return (ev_count, growth, demand, coverage, market_share, SEASONALITY.get(city, 1.0),
+            ac, dc, ac + dc, zes)
+
+
+class _BatchInserter:
+    """Satırları biriktirip ROWS_PER_STATEMENT satırlık INSERT'lerle yazar."""
+
+    def __init__(self, cur, dialect, table, columns, rows_per_statement=ROWS_PER_STATEMENT):
+        self.cur = cur
+        self.rows_per_statement = rows_per_statement
+        self.head = f"INSERT INTO {table} ({', '.join(columns)}) VALUES "
+        self.row_sql = '(' + ', '.join([dialect.placeholder] * len(columns)) + ')'
+        self.full_sql = self._sql(rows_per_statement)
+        self.params = []
+        self.pending = 0
+        self.total = 0
+
+    def _sql(self, rows):
+        return self.head + ', '.join([self.row_sql] * rows)
+
+    def add(self, *row):
+        self.params.extend(row)
+        self.pending += 1
+        if self.pending == self.rows_per_statement:
+            self.cur.execute(self.full_sql, self.params)
+            self.total += self.pending
+            self.params = []
+            self.pending = 0
+
+    def flush(self):
+        if self.pending:
+            self.cur.execute(self._sql(self.pending), self.params)
+            self.total += self.pending
+            self.params = []
+            self.pending = 0
+
+
+def bulk_load(conn, stations, dialect=None, stations_per_transaction=STATIONS_PER_TRANSACTION):
+    """Tabloları yeniden oluşturur ve istasyon akışını yükler.
+
+    Dönen sözlükte yüklenen/atlanan istasyon sayıları ve toplamlar bulunur.
+    """
+    if dialect is None:
+        dialect = SQLiteDialect()
+    cur = conn.cursor()
+    dialect.prepare(cur)
+
+    for table in TABLES:
+        cur.execute(f'DROP TABLE IF EXISTS {table}')
+    for ddl in _schema(dialect):
+        cur.execute(ddl)
+
+    # Bölge ve şehirler: kimlikler sabit sırayla verilir, yeniden sorgulama gerekmez
+    sehir_ids = {}
+    bolgeler = _BatchInserter(cur, dialect, 'bolgeler', ('id', 'ad'))
+    sehirler = _BatchInserter(cur, dialect, 'sehirler', ('id', 'ad', 'bolge_id', 'nufus'))
+    for bolge_id, (bolge, cities) in enumerate(BOLGE_SEHIRLERI.items(), start=1):
+        bolgeler.add(bolge_id, bolge)
+        for city in cities:
+            sehir_ids[city] = len(sehir_ids) + 1
+            sehirler.add(sehir_ids[city], city, bolge_id, REAL_POPULATIONS.get(city) or DEFAULT_POPULATION)
+    bolgeler.flush()
+    sehirler.flush()
+    conn.commit()
+
+    aggregator = StationAggregator()
+    istasyonlar = _BatchInserter(cur, dialect, 'istasyonlar', ('id', 'ad', 'sehir_id'))
+    soketler = _BatchInserter(cur, dialect, 'istasyon_soketleri', ('istasyon_id', 'tur', 'adet'))
+    skipped = 0
+    in_transaction = 0
+
+    for s in stations:
+        city, _ = split_station_name(s['name'])
+        sehir_id = sehir_ids.get(city)
+        # Eğer haritada olmayan bir şehir çıkar ise atla
+        if sehir_id is None:
+            skipped += 1
+            continue
+        istasyon_id = int(s['id'][3:])
+        istasyonlar.add(istasyon_id, s['name'], sehir_id)
+        soketler.add(istasyon_id, 'AC', int(s.get('acSockets') or 0))
+        soketler.add(istasyon_id, 'DC', int(s.get('dcSockets') or 0))
+        aggregator.add(s)
+
+        in_transaction += 1
+        if in_transaction >= stations_per_transaction:
+            istasyonlar.flush()
+            soketler.flush()
+            conn.commit()
+            in_transaction = 0
+
+    istasyonlar.flush()
+    soketler.flush()
+
+    metrikler = _BatchInserter(cur, dialect, 'sehir_metrikleri',
+                               ('sehir_id', 'ev_sayisi', 'ev_buyume_orani', 'sarj_talebi', 'ag_kapsami',
+                                'zes_pazar_pay', 'mevsimsellik_katsayi', 'ac_soket', 'dc_soket', 'toplam_soket',
+                                'zes_istasyon'))
+    for city, sehir_id in sehir_ids.items():
+        entry = aggregator.cities.get(city) or {'zesStations': 0, 'acSockets': 0, 'dcSockets': 0}
+        metrikler.add(sehir_id, *city_metrics(city, entry['zesStations'], entry['acSockets'], entry['dcSockets']))
+    metrikler.flush()
+    conn.commit()
+
+    for ddl in INDEXES + dialect.foreign_keys():
+        cur.execute(ddl)
+    dialect.finish(cur)
+    conn.commit()
+
+    return {'stations': istasyonlar.total, 'sockets': soketler.total, 'skipped': skipped,
+            'summary': aggregator.summary()}
+
+
+def read_dotenv(path='.env'):
+    """dotenv biçimindeki dosyayı (KEY=VALUE satırları) sözlük olarak okur; dosya yoksa boş döner.
+
+    seed-mysql.mjs'in kullandığı dotenv ile aynı temel kurallar: # ile başlayan
+    satırlar ve boş satırlar atlanır, 'export ' öneki kabul edilir, tırnaklı
+    değerlerin tırnakları kaldırılır, tırnaksız değerlerde ' #' sonrası yorumdur.
+    """
+    values = {}
+    try:
+        f = open(path, encoding='utf-8')
+    except FileNotFoundError:
+        return values
+    with f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#') or '=' not in line:
+                continue
+            key, value = line.split('=', 1)
+            key = key.strip()
+            if key.startswith('export '):
+                key = key[len('export '):].strip()
+            value = value.strip()
+            if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'`':
+                value = value[1:-1]
+            else:
+                value = value.split(' #', 1)[0].rstrip()
+            values[key] = value
+    return values
+
+
+def mysql_settings(env_file='.env'):
+    """MYSQL_* ayarları: .env dosyası, üzerine ortam değişkenleri (dotenv gibi ortam önceliklidir)."""
+    settings = {**read_dotenv(env_file), **os.environ}
+    missing = [k for k in ('MYSQL_USER', 'MYSQL_PASSWORD', 'MYSQL_DATABASE') if not settings.get(k)]
+    if missing:
+        raise RuntimeError(f"Eksik MySQL env değişkenleri: {', '.join(missing)} (.env veya ortam)")
+    return {
+        'host': settings.get('MYSQL_HOST') or '127.0.0.1',
+        'port': int(settings.get('MYSQL_PORT') or 3306),
+        'user': settings['MYSQL_USER'],
+        'password': settings['MYSQL_PASSWORD'],
+        'database': settings['MYSQL_DATABASE'],
+    }
+
+
+def connect_mysql(settings=None):
+    """.env / ortamdaki MYSQL_* değişkenleriyle pymysql bağlantısı açar.
+
+    Veritabanı yoksa seed-mysql.mjs'teki gibi önce oluşturulur, böylece iki
+    yükleyici de boş bir sunucuda çalışır.
+    """
+    if pymysql is None:
+        raise RuntimeError("MySQL yüklemesi için pymysql kurulu olmalı (pip install pymysql)")
+    if settings is None:
+        settings = mysql_settings()
+    database = settings['database']
+    conn = pymysql.connect(host=settings['host'], port=settings['port'], user=settings['user'],
+                           password=settings['password'], charset='utf8mb4', autocommit=False)
+    try:
+        with conn.cursor() as cur:
+            name = database.replace('`', '``')
+            cur.execute(f"CREATE DATABASE IF NOT EXISTS `{name}` CHARACTER SET utf8mb4 COLLATE utf8mb4_general_ci")
+        conn.select_db(database)
+    except Exception:
+        conn.close()
+        raise
+    return conn
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='İstasyonları SQLite/MySQL şemasına toplu yükler')
+    parser.add_argument('database', nargs='?', default='zes_kdss.sqlite',
+                        help='SQLite dosyası (varsayılan: zes_kdss.sqlite)')
+    parser.add_argument('--mysql', action='store_true', help='SQLite yerine MYSQL_* ile MySQL\'e yükle')
+    parser.add_argument('--input', help='üretmek yerine bu JSON/NDJSON dosyasından yükle')
+    parser.add_argument('--engine', choices=ENGINES, default='python')
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help='EV_DISTRIBUTION_2025 hedeflerini bu katsayıyla çarp')
+    args = parser.parse_args(argv)
+
+    if args.scale <= 0:
+        parser.error('--scale pozitif olmalı')
+    if args.workers < 1:
+        parser.error('--workers en az 1 olmalı')
+
+    if args.input:
+        stations = iter_station_file(args.input)
+    else:
+        stations = generate_distributed_stations(scale_distribution(EV_DISTRIBUTION_2025, args.scale),
+                                                 engine=args.engine, seed=args.seed, workers=args.workers,
+                                                 hooks=ConsoleHooks())
+
+    if args.mysql:
+        try:
+            settings = mysql_settings()
+            conn = connect_mysql(settings)
+        except RuntimeError as exc:
+            raise SystemExit(f"❌ {exc}")
+        dialect, target = MySQLDialect(), settings['database']
+    else:
+        conn, dialect, target = sqlite3.connect(args.database), SQLiteDialect(), args.database
+
+    t0 = time.perf_counter()
+    try:
+        result = bulk_load(conn, stations, dialect)
+    finally:
+        conn.close()
+    elapsed = time.perf_counter() - t0
+
+    print(f"\n✅ {result['stations']} istasyon, {result['sockets']} soket satırı {target} hedefine "
+          f"{elapsed:.1f} sn'de yüklendi ({result['stations'] / max(elapsed, 1e-9):,.0f} istasyon/sn)")
+    if result['skipped']:
+        print(f"⚠️ Bölge eşlemesinde olmayan şehirlerden {result['skipped']} istasyon atlandı")
+
+
+if __name__ == '__main__':
+    main()
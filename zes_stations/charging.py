@@ -0,0 +1,380 @@
+"""İstasyon soketlerinin bir yıllık, saatlik doluluk ve kuyruk simülasyonu.
+
+Talep şehir başına REAL_EV_DATA araç sayısından türetilir: günlük halka açık
+şarj oturumu, ZES'in şehirdeki pazar payı kadar ZES istasyonlarına düşer ve
+istasyonlara soket sayısı ve güç kademesiyle orantılı dağıtılır. Saatlik
+oturum gelişleri günün saati, haftanın günü ve (sahil şehirleri için) mevsim
+profiliyle ölçeklenmiş Poisson çekilişleridir.
+
+Her istasyonun DC ve AC soketleri ayrı havuzlardır. Bir oturum, süresi
+boyunca soketi saat dilimlerine yayılarak meşgul eder. Kapasiteyi aşan
+talep bir sonraki saate devreden akışkan (fluid) kuyrukta bekler. Hesap
+istasyon grupları (batch) üzerinde, istasyon x saat dizileriyle yapılır.
+Saat döngüsü yalnızca kapasitesi aşılan istasyonlar için çalışır.
+
+Bellek: bir grup için aynı anda yaklaşık 12 adet BATCH_SIZE x 8784 float64
+dizi tutulur. Bu, varsayılan 256 istasyonda yaklaşık 200 MB eder ve filo
+boyutundan bağımsızdır. --hourly çıktıları diske mmap ile yazılır.
+"""
+import argparse
+import calendar
+import json
+import math
+import time
+from datetime import date
+
+import numpy as np
+
+from .aggregates import split_station_name
+from .data import EV_DISTRIBUTION_2025, REAL_EV_DATA, SEASONALITY
+from .generator import POWER_TIERS, TIER_POWER
+
+# Bir aracın günde ortalama halka açık şarj oturumu sayısı
+SESSIONS_PER_EV_DAY = 0.12
+# Oturumların DC soketleri tercih eden payı
+DC_SESSION_SHARE = 0.7
+# Güç kademesine göre DC oturum süresi ve AC oturum süresi (saat)
+DC_SESSION_HOURS = {'HPC': 0.5, 'DC': 0.6, 'AC': 0.9}
+AC_SESSION_HOURS = 2.5
+# Soket başına talep çekme ağırlığı; hızlı istasyonlar daha çok tercih edilir
+TIER_WEIGHT = {'HPC': 1.5, 'DC': 1.2, 'AC': 0.8}
+
+# Saat (0-23) ve haftanın günü (Pzt-Paz) talep profilleri; ortalamaları 1'e ölçeklenir
+HOURLY_PROFILE = (0.25, 0.15, 0.1, 0.1, 0.1, 0.2, 0.5, 0.9, 1.3, 1.4, 1.3, 1.3,
+                  1.3, 1.3, 1.3, 1.4, 1.5, 1.7, 1.8, 1.7, 1.4, 1.1, 0.8, 0.5)
+WEEKDAY_PROFILE = (0.95, 0.95, 0.95, 0.97, 1.05, 1.1, 1.03)
+# Mevsimsel (SEASONALITY) talebin zirve yaptığı gün
+SEASON_PEAK_DAY = 200
+
+# Yılın en az bu payında dolu ve kuyruklu olan istasyon darboğaz sayılır;
+# istasyonlarının en az CITY_BOTTLENECK_SHARE'i darboğaz olan şehir de öyle
+STATION_BOTTLENECK_HOURS_SHARE = 0.05
+CITY_BOTTLENECK_SHARE = 0.1
+
+# Grup boyutu; tepe bellek bununla doğrusal büyür (bkz. modül açıklaması)
+BATCH_SIZE = 256
+
+_TIER_CODES = {power: i for i, power in enumerate(TIER_POWER)}
+
+
+def hours_in_year(year):
+    return 24 * (366 if calendar.isleap(year) else 365)
+
+
+def demand_profile(year, seasonality=1.0):
+    """Yılın her saati için ortalaması 1 olan talep çarpanı."""
+    n_hours = hours_in_year(year)
+    hour = np.arange(n_hours)
+    day = hour // 24
+    hourly = np.asarray(HOURLY_PROFILE) / np.mean(HOURLY_PROFILE)
+    weekly = np.asarray(WEEKDAY_PROFILE) / np.mean(WEEKDAY_PROFILE)
+    first_weekday = date(year, 1, 1).weekday()
+    profile = hourly[hour % 24] * weekly[(day + first_weekday) % 7]
+    if seasonality != 1.0:
+        # Yaz zirvesinde seasonality, kışın 2 - seasonality katı talep
+        days = n_hours // 24
+        profile = profile * (1 + (seasonality - 1) * np.cos(2 * np.pi * (day - SEASON_PEAK_DAY) / days))
+    return profile / profile.mean()
+
+
+class Fleet:
+    """Simülasyon için istasyon dizileri (kimlik, şehir, kademe, soketler)."""
+
+    def __init__(self, ids, city_names, city_codes, tiers, dc_sockets, ac_sockets):
+        self.ids = np.asarray(ids)
+        self.city_names = list(city_names)
+        self.city_codes = np.asarray(city_codes, dtype=np.int32)
+        self.tiers = np.asarray(tiers, dtype=np.int8)
+        self.dc_sockets = np.asarray(dc_sockets, dtype=np.float64)
+        self.ac_sockets = np.asarray(ac_sockets, dtype=np.float64)
+
+    def __len__(self):
+        return len(self.ids)
+
+    @classmethod
+    def from_stations(cls, stations):
+        ids, codes, tiers, dc, ac = [], [], [], [], []
+        cities = {}
+        for s in stations:
+            city, _ = split_station_name(s['name'])
+            ids.append(s['id'])
+            codes.append(cities.setdefault(city, len(cities)))
+            tiers.append(_TIER_CODES.get(s.get('power'), len(POWER_TIERS) - 1))
+            dc.append(s.get('dcSockets') or 0)
+            ac.append(s.get('acSockets') or 0)
+        return cls(ids, list(cities), codes, tiers, dc, ac)
+
+    @classmethod
+    def from_file(cls, path):
+        """real_zes_stations.json, .ndjson(.gz) veya .zcol dosyasından okur."""
+        if str(path).endswith('.zcol'):
+            from .store import StationStore
+
+            with StationStore(path) as store:
+                refs, codes = np.unique(np.asarray(store.column('city')), return_inverse=True)
+                tier_of_enum = np.asarray([_TIER_CODES.get(p, len(POWER_TIERS) - 1)
+                                           for p in store.enums['power']] or [0], dtype=np.int8)
+                return cls(
+                    np.char.add('ZES', np.char.zfill(np.asarray(store.column('id')).astype(str), 4)),
+                    [store.string(int(r)) for r in refs],
+                    codes,
+                    tier_of_enum[np.asarray(store.column('power'))],
+                    np.asarray(store.column('dc_sockets')),
+                    np.asarray(store.column('ac_sockets')),
+                )
+        from .formats import iter_station_file
+
+        return cls.from_stations(iter_station_file(path))
+
+
+def _occupancy(arrivals, hours):
+    # Saat başında gelen oturumların soket-saat olarak saat dilimlerine yayılması (yıl döngüsel)
+    occ = np.zeros_like(arrivals)
+    n_hours = arrivals.shape[1]
+    for k in range(int(math.ceil(hours.max()))):
+        w = np.clip(hours - k, 0.0, 1.0)[:, None]
+        if k == 0:
+            occ += w * arrivals
+        else:
+            occ[:, k:] += w * arrivals[:, :n_hours - k]
+            occ[:, :k] += w * arrivals[:, n_hours - k:]
+    return occ
+
+
+def _serve(occ, capacity):
+    """Kapasite sınırıyla hizmet: (hizmet verilen soket-saat, kuyrukta bekleyen soket-saat)."""
+    served = occ.copy()
+    backlog = np.zeros_like(occ)
+    over = np.flatnonzero((occ > capacity[:, None]).any(axis=1))
+    if len(over):
+        # Kapasitesi aşılan istasyonlarda fazlalık sonraki saatlere devreder
+        cap = capacity[over]
+        demand = occ[over]
+        out_served = np.empty_like(demand)
+        out_backlog = np.empty_like(demand)
+        waiting = np.zeros(len(over))
+        for t in range(demand.shape[1]):
+            queue = waiting + demand[:, t]
+            np.minimum(queue, cap, out=out_served[:, t])
+            waiting = queue - out_served[:, t]
+            out_backlog[:, t] = waiting
+        served[over] = out_served
+        backlog[over] = out_backlog
+    return served, backlog
+
+
+class SimulationResult:
+    """İstasyon başına yıllık özetler ve şehir bazında toplamlar."""
+
+    def __init__(self, fleet, year, n_hours):
+        n = len(fleet)
+        self.fleet = fleet
+        self.year = year
+        self.n_hours = n_hours
+        self.sessions = np.zeros(n)
+        self.dc_utilization = np.zeros(n)
+        self.ac_utilization = np.zeros(n)
+        self.peak_utilization = np.zeros(n)
+        self.saturated_hours = np.zeros(n, dtype=np.int32)
+        self.mean_queue = np.zeros(n)
+        self.max_queue = np.zeros(n)
+        self.mean_wait_minutes = np.zeros(n)
+
+    @property
+    def bottleneck(self):
+        return self.saturated_hours >= STATION_BOTTLENECK_HOURS_SHARE * self.n_hours
+
+    def city_rows(self):
+        fleet = self.fleet
+        sockets = fleet.dc_sockets + fleet.ac_sockets
+        rows = []
+        for code, city in enumerate(fleet.city_names):
+            mask = fleet.city_codes == code
+            if not mask.any():
+                continue
+            weights = sockets[mask]
+            util = (self.dc_utilization[mask] * fleet.dc_sockets[mask]
+                    + self.ac_utilization[mask] * fleet.ac_sockets[mask]) / np.maximum(weights, 1)
+            bottleneck_share = float(self.bottleneck[mask].mean())
+            rows.append({
+                'city': city,
+                'stations': int(mask.sum()),
+                'sessions': int(round(self.sessions[mask].sum())),
+                'utilization': round(float(np.average(util, weights=np.maximum(weights, 1))), 4),
+                'p95StationUtilization': round(float(np.percentile(util, 95)), 4),
+                'saturatedStationHoursShare': round(float(self.saturated_hours[mask].sum()
+                                                          / (mask.sum() * self.n_hours)), 4),
+                'bottleneckStationShare': round(bottleneck_share, 4),
+                'meanWaitMinutes': round(float(np.average(self.mean_wait_minutes[mask],
+                                                          weights=np.maximum(self.sessions[mask], 1e-9))), 2),
+                'projectedBottleneck': bottleneck_share >= CITY_BOTTLENECK_SHARE,
+            })
+        return sorted(rows, key=lambda r: r['utilization'], reverse=True)
+
+    def station_rows(self):
+        fleet = self.fleet
+        return [
+            {
+                'id': str(fleet.ids[i]),
+                'city': fleet.city_names[fleet.city_codes[i]],
+                'sessions': int(round(self.sessions[i])),
+                'dcUtilization': round(float(self.dc_utilization[i]), 4),
+                'acUtilization': round(float(self.ac_utilization[i]), 4),
+                'peakUtilization': round(float(self.peak_utilization[i]), 4),
+                'saturatedHours': int(self.saturated_hours[i]),
+                'meanQueue': round(float(self.mean_queue[i]), 4),
+                'maxQueue': round(float(self.max_queue[i]), 2),
+                'meanWaitMinutes': round(float(self.mean_wait_minutes[i]), 2),
+            }
+            for i in range(len(fleet))
+        ]
+
+    def to_dict(self, stations=True):
+        doc = {'version': 1, 'year': self.year, 'hours': self.n_hours, 'cities': self.city_rows()}
+        if stations:
+            doc['stations'] = self.station_rows()
+        return doc
+
+
+def simulate(fleet, year=2025, seed=None, ev_data=None, market_share=None, growth=0.0,
+             sessions_per_ev_day=SESSIONS_PER_EV_DAY, dc_share=DC_SESSION_SHARE,
+             batch_size=BATCH_SIZE, hourly_prefix=None):
+    """Filo için bir yıllık saatlik simülasyon; SimulationResult döndürür.
+
+    market_share verilmezse ZES'in şehirdeki payı, filodaki istasyon sayısının
+    REAL_EV_DATA totalStations'a oranıdır (en fazla 1). growth araç sayısını
+    (1 + growth) ile çarpar, ör. 2026 projeksiyonu için. hourly_prefix
+    verilirse istasyon x saat doluluk ve kuyruk dizileri
+    <prefix>.utilization.npy ve <prefix>.queue.npy dosyalarına (float16,
+    mmap) yazılır. Sonuç seed'e bağlıdır, batch_size'a bağlı değildir.
+    """
+    if ev_data is None:
+        ev_data = REAL_EV_DATA
+    n = len(fleet)
+    n_hours = hours_in_year(year)
+    result = SimulationResult(fleet, year, n_hours)
+    # DC ve AC gelişleri ayrı akışlardan; gruplar sırayla çekildiği için grup boyutu sonucu değiştirmez
+    dc_rng, ac_rng = (np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(2))
+
+    # Şehir başına saatlik talep (oturum/saat, istasyon ağırlığı 1 için) ve istasyon ağırlıkları
+    tier_weight = np.asarray([TIER_WEIGHT[t] for t in POWER_TIERS])[fleet.tiers]
+    weights = tier_weight * (fleet.dc_sockets + fleet.ac_sockets)
+    n_cities = len(fleet.city_names)
+    city_weight = np.bincount(fleet.city_codes, weights=weights, minlength=n_cities)
+    city_count = np.bincount(fleet.city_codes, minlength=n_cities)
+    city_rate = np.zeros((n_cities, n_hours))
+    profiles = {}
+    for code, city in enumerate(fleet.city_names):
+        data = ev_data.get(city)
+        if data is None or not city_weight[code]:
+            continue
+        share = market_share
+        if share is None:
+            share = min(1.0, city_count[code] / max(data['totalStations'], 1))
+        daily = data['evCount'] * (1 + growth) * sessions_per_ev_day * share
+        seasonality = SEASONALITY.get(city, 1.0)
+        if seasonality not in profiles:
+            profiles[seasonality] = demand_profile(year, seasonality)
+        city_rate[code] = daily / 24 * profiles[seasonality] / city_weight[code]
+
+    dc_hours = np.asarray([DC_SESSION_HOURS[t] for t in POWER_TIERS])[fleet.tiers]
+    has_dc = fleet.dc_sockets > 0
+    has_ac = fleet.ac_sockets > 0
+    # Soketi olmayan havuza yönelen talep diğer havuza gider
+    p_dc = np.where(has_dc & has_ac, dc_share, has_dc.astype(np.float64))
+
+    hourly_util = hourly_queue = None
+    if hourly_prefix is not None:
+        open_memmap = np.lib.format.open_memmap
+        hourly_util = open_memmap(f'{hourly_prefix}.utilization.npy', mode='w+', dtype=np.float16,
+                                  shape=(n, n_hours))
+        hourly_queue = open_memmap(f'{hourly_prefix}.queue.npy', mode='w+', dtype=np.float16,
+                                   shape=(n, n_hours))
+
+    for start in range(0, n, batch_size):
+        rows = slice(start, min(start + batch_size, n))
+        lam = city_rate[fleet.city_codes[rows]] * weights[rows, None]
+        dc_arrivals = dc_rng.poisson(lam * p_dc[rows, None]).astype(np.float64)
+        ac_arrivals = ac_rng.poisson(lam * (1 - p_dc[rows, None])).astype(np.float64)
+        dc_cap = fleet.dc_sockets[rows]
+        ac_cap = fleet.ac_sockets[rows]
+        ac_hours = np.full(len(dc_cap), AC_SESSION_HOURS)
+
+        dc_served, dc_backlog = _serve(_occupancy(dc_arrivals, dc_hours[rows]), dc_cap)
+        ac_served, ac_backlog = _serve(_occupancy(ac_arrivals, ac_hours), ac_cap)
+
+        sockets = np.maximum(dc_cap + ac_cap, 1)
+        util = (dc_served + ac_served) / sockets[:, None]
+        # Bekleyen araç sayısı: kuyruktaki soket-saat / oturum süresi
+        queue = dc_backlog / dc_hours[rows, None] + ac_backlog / AC_SESSION_HOURS
+        sessions = dc_arrivals.sum(axis=1) + ac_arrivals.sum(axis=1)
+
+        result.sessions[rows] = sessions
+        result.dc_utilization[rows] = dc_served.mean(axis=1) / np.maximum(dc_cap, 1)
+        result.ac_utilization[rows] = ac_served.mean(axis=1) / np.maximum(ac_cap, 1)
+        result.peak_utilization[rows] = util.max(axis=1)
+        result.saturated_hours[rows] = ((dc_backlog > 1e-9) | (ac_backlog > 1e-9)).sum(axis=1)
+        result.mean_queue[rows] = queue.mean(axis=1)
+        result.max_queue[rows] = queue.max(axis=1)
+        # Little yasası: ortalama bekleme = ortalama kuyruk / geliş hızı
+        arrival_rate = sessions / n_hours
+        result.mean_wait_minutes[rows] = np.divide(result.mean_queue[rows] * 60, arrival_rate,
+                                                   out=np.zeros(len(sessions)), where=arrival_rate > 0)
+        if hourly_util is not None:
+            hourly_util[rows] = util
+            hourly_queue[rows] = queue
+
+    if hourly_util is not None:
+        hourly_util.flush()
+        hourly_queue.flush()
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Soket doluluğu ve kuyruk için yıllık şarj oturumu simülasyonu')
+    parser.add_argument('input', nargs='?',
+                        help='real_zes_stations.json, .ndjson(.gz) veya .zcol (verilmezse --seed ile üretilir)')
+    parser.add_argument('-o', '--output', default='charging_simulation.json', help='sonuç JSON dosyası')
+    parser.add_argument('--year', type=int, default=2025)
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--growth', type=float, default=0.0,
+                        help='araç sayısı artışı, ör. 2026 projeksiyonu için 0.35')
+    parser.add_argument('--market-share', type=float,
+                        help='ZES pazar payı (varsayılan: şehirdeki istasyon payı)')
+    parser.add_argument('--sessions-per-ev', type=float, default=SESSIONS_PER_EV_DAY,
+                        help=f'araç başına günlük halka açık oturum (varsayılan: {SESSIONS_PER_EV_DAY})')
+    parser.add_argument('--scale', type=float, default=1.0, help='girdi yoksa üretilecek dağılımın katsayısı')
+    parser.add_argument('--hourly', metavar='ÖNEK',
+                        help='istasyon x saat doluluk/kuyruk dizilerini <ÖNEK>.utilization.npy / .queue.npy yaz')
+    parser.add_argument('--no-stations', action='store_true', help='sonuca istasyon satırlarını ekleme')
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    if args.input:
+        fleet = Fleet.from_file(args.input)
+    else:
+        from .generator import generate_distributed_stations, scale_distribution
+
+        distribution = scale_distribution(EV_DISTRIBUTION_2025, args.scale)
+        fleet = Fleet.from_stations(generate_distributed_stations(distribution, engine='numpy', seed=args.seed))
+    t_load = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    result = simulate(fleet, year=args.year, seed=args.seed, market_share=args.market_share, growth=args.growth,
+                      sessions_per_ev_day=args.sessions_per_ev, hourly_prefix=args.hourly)
+    elapsed = time.perf_counter() - t0
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(result.to_dict(stations=not args.no_stations), f, ensure_ascii=False, separators=(',', ':'))
+
+    print(f"🔌 {len(fleet)} istasyon x {result.n_hours} saat simüle edildi "
+          f"({elapsed:.2f} sn, yükleme {t_load:.2f} sn) -> {args.output}")
+    print("\n📊 EN YOĞUN ŞEHİRLER (soket doluluğu):")
+    for row in result.city_rows()[:10]:
+        flag = ' ⚠️ darboğaz' if row['projectedBottleneck'] else ''
+        print(f"  {row['city']}: %{row['utilization'] * 100:.1f} doluluk, "
+              f"ort. bekleme {row['meanWaitMinutes']:.1f} dk{flag}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,158 @@
+"""Veri seti üretici komut satırı: python -m zes_stations [seçenekler]"""
+import argparse
+
+from .aggregates import StationAggregator, aggregates_path
+from .data import DETAILED_LOCATIONS, EV_DISTRIBUTION_2025
+from .formats import OUTPUT_FORMATS, write_stations
+from .generator import ENGINES, PLACEMENTS, generate_distributed_stations, scale_distribution
+from .hooks import ConsoleHooks, MetricsRecorder, MultiHooks, TimedConsumer, TimedSink, phase
+
+
+def _tee(stations, sink):
+    # Aynı akışı ikinci bir yazıcıya da aktar
+    for s in stations:
+        sink(s)
+        yield s
+
+
+def _collect_samples(stations, samples, sample_city='İstanbul', sample_size=15):
+    # Yazma sırasında örnek istasyon adlarını topla, istasyonları olduğu gibi aktar
+    for s in stations:
+        if len(samples) < sample_size and s['name'].startswith(sample_city + ' - '):
+            samples.append(s['name'])
+        yield s
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='ZES istasyon veri seti üretici')
+    parser.add_argument('--format', choices=sorted(OUTPUT_FORMATS), default='json',
+                        help='çıktı biçimi (varsayılan: kompakt json)')
+    parser.add_argument('-o', '--output', help='çıktı dosyası (varsayılan biçime göre belirlenir)')
+    parser.add_argument('--engine', choices=ENGINES, default='python',
+                        help='üretim motoru: python (varsayılan) veya numpy (toplu/vektörel)')
+    parser.add_argument('--seed', type=int,
+                        help='tekrarlanabilir üretim için tohum (şehir başına bağımsız akış)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='paralel üretimde süreç sayısı (--seed gerektirir)')
+    parser.add_argument('--columnar', action='store_true',
+                        help='çıktının yanına mmap ile okunabilen sütunlu .zcol dosyası da yaz')
+    parser.add_argument('--min-spacing', type=float, metavar='METRE',
+                        help='lokasyon çevresinde istasyonlar arası en az mesafe (Poisson-disk yerleşim)')
+    parser.add_argument('--placement', choices=PLACEMENTS, default='random',
+                        help='yerleşim: random (varsayılan) veya greedy (kapsanan talebi en çoklayan yerler)')
+    parser.add_argument('--cache', metavar='DİZİN',
+                        help='artımlı üretim: yalnızca değişen şehirleri yeniden üret, '
+                             'kimlikleri koru ve <çıktı>.delta.json yaz')
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help='şehir hedeflerini bu katsayıyla çarp (ör. 100 ile milyonlarca istasyon)')
+    parser.add_argument('--metrics', metavar='DOSYA',
+                        help='şehir/aşama süreleri, sayaçlar ve rastgele çekiliş adetlerini JSON olarak yaz')
+    parser.add_argument('-q', '--quiet', action='store_true', help='şehir başına ilerleme satırlarını yazma')
+    args = parser.parse_args(argv)
+
+    if args.workers < 1:
+        parser.error('--workers en az 1 olmalı')
+    if args.min_spacing is not None and not args.min_spacing > 0:
+        parser.error('--min-spacing pozitif olmalı')
+    if args.workers > 1 and args.seed is None:
+        parser.error('--workers > 1 için --seed gerekli')
+    if args.workers > 1 and args.cache:
+        parser.error('--cache ile --workers birlikte kullanılamaz')
+
+    if args.placement == 'greedy' and args.min_spacing:
+        parser.error('--min-spacing yalnızca random yerleşimde kullanılır')
+    if args.scale <= 0:
+        parser.error('--scale pozitif olmalı')
+
+    output = args.output or OUTPUT_FORMATS[args.format]
+    distribution = scale_distribution(EV_DISTRIBUTION_2025, args.scale)
+    recorder = MetricsRecorder() if args.metrics else None
+    hooks = MultiHooks(None if args.quiet else ConsoleHooks(), recorder)
+
+    # Oluştur ve kaydet
+    print("⚡ İstasyonlar gerçekçi şekilde dağıtılıyor...\n")
+    istanbul_samples = []
+    placement_report = []
+    aggregator = StationAggregator()
+    incremental = None
+    if args.cache:
+        from .incremental import IncrementalRun
+        incremental = IncrementalRun(args.cache, distribution, DETAILED_LOCATIONS,
+                                     engine=args.engine, seed=args.seed, min_spacing_m=args.min_spacing,
+                                     placement_report=placement_report, hooks=hooks, placement=args.placement)
+        generated = incremental.stations()
+    else:
+        generated = generate_distributed_stations(distribution, engine=args.engine, seed=args.seed,
+                                                  workers=args.workers, min_spacing_m=args.min_spacing,
+                                                  placement_report=placement_report, hooks=hooks,
+                                                  placement=args.placement)
+    stations = _collect_samples(generated, istanbul_samples)
+    aggregate_sink = TimedSink(aggregator.add)
+    stations = _tee(stations, aggregate_sink)
+
+    columnar = columnar_sink = None
+    if args.columnar:
+        from .store import ColumnarWriter, columnar_path
+        columnar = ColumnarWriter(columnar_path(output))
+        columnar_sink = TimedSink(columnar.add)
+        stations = _tee(stations, columnar_sink)
+
+    # Akış tek geçişte üretilip yazılır; yazma süresi yalnızca yazıcıda geçen süredir
+    # (paralel üretimde işçileri beklemek ve dinleyiciler dahil değil)
+    stream = TimedConsumer(stations)
+    total = write_stations(stream, output, args.format)
+    write_seconds = stream.finish()
+    if recorder is not None:
+        hooks.phase_finished('aggregation', aggregate_sink.seconds)
+        if columnar_sink is not None:
+            hooks.phase_finished('columnar', columnar_sink.seconds)
+        hooks.phase_finished('write', write_seconds)
+
+    print(f"\n✅ Toplam {total} istasyon oluşturuldu ve {output} dosyasına kaydedildi!")
+    with phase(hooks, 'sidecar'):
+        aggregator.write(aggregates_path(output), source=output)
+    print(f"📈 Şehir/ilçe özetleri: {aggregates_path(output)}")
+    if columnar is not None:
+        with phase(hooks, 'columnar'):
+            columnar.close()
+        print(f"🗂️ Sütunlu kopya: {columnar.path}")
+    if incremental is not None:
+        from .incremental import delta_path
+        with phase(hooks, 'incremental'):
+            delta = incremental.commit(delta_path(output))
+        print(f"♻️ {len(incremental.reused)} şehir önbellekten, {len(incremental.regenerated)} şehir yeniden üretildi")
+        if incremental.baseline:
+            print("🔀 İlk artımlı çalıştırma: delta yazılmadı (veritabanını tam yükleyin: npm run seed:mysql)")
+        else:
+            print(f"🔀 Delta ({delta_path(output)}): +{len(delta['added'])} / -{len(delta['removed'])} / "
+                  f"~{len(delta['changed'])} istasyon")
+
+    if placement_report:
+        if args.placement == 'greedy':
+            print("\n⚠️ Yeterli aday yer bulunamayan şehirler:")
+        else:
+            print(f"\n⚠️ {args.min_spacing:g} m aralıkla kotasını alamayan lokasyonlar:")
+        for entry in placement_report:
+            anchor = entry['anchor'] or 'ŞEHİR TOPLAMI'
+            print(f"  {entry['city']} / {anchor}: {entry['placed']}/{entry['quota']}")
+
+    # İstatistikler
+    print("\n📊 ŞEHİR DAĞILIMI:")
+    for entry in aggregator.city_rows()[:10]:
+        print(f"  {entry['city']}: {entry['zesStations']} istasyon")
+
+    # İstanbul örnekleri
+    print("\n🏙️ İSTANBUL ÖRNEKLERİ (İlk 15):")
+    for name in istanbul_samples:
+        parts = name.split(' - ')
+        if len(parts) >= 2:
+            location = parts[1]
+            print(f"  ✓ {location}")
+        else:
+            print(f"  ✓ {name}")
+
+    if recorder is not None:
+        recorder.write(args.metrics)
+        phases = ', '.join(f"{name} {seconds:.2f} sn" for name, seconds in recorder.phases.items())
+        print(f"\n⏱️ Aşamalar: {phases}")
+        print(f"📏 Metrikler: {args.metrics}")
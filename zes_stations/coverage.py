@@ -0,0 +1,332 @@
+"""Türkiye üzerinde en yakın istasyon mesafesi rasterı (kapsama yüzeyi).
+
+Raster sabit enlem/boylam adımlı bir ızgaradır. Varsayılan 500 m
+çözünürlükte ulusal raster yaklaşık 1400 x 3300 hücredir ve float32 olarak
+mmap'li bir .npy dosyasına yazılır. Hesap karolar (tile) halinde yapılır:
+karo merkezine en yakın istasyon uzamsal indeksle bulunur. Karodaki her
+hücrenin en yakın istasyonu, merkezden (bu mesafe + 2 x karo yarıçapı)
+içindeki adaylar arasındadır. En küçük büyük çember mesafesi, birim
+vektörlerin en büyük iç çarpımına karşılık gelir. Bu yüzden karo başına
+tek bir matris çarpımı yeterlidir.
+
+Şehir özetleri istasyonlara dönmeden yalnızca rasterdan okunur. Nüfus
+yüzeyi istasyon lokasyonlarından bağımsızdır ve 81 ilin tamamını kapsar. Her
+hücre en yakın il merkezine (CITY_CENTERS) atanır. İl nüfusunun
+URBAN_SHARE kadarı il merkezi çevresine Gauss çekirdeğiyle, kalanı ilin
+PROVINCE_REACH_KM içindeki hücrelerine eşit yayılır. Kara maskesi
+olmadığından kıyı illerinin kırsal payının bir kısmı denize düşer.
+"""
+import argparse
+import json
+import math
+import time
+
+import numpy as np
+
+from .data import CITY_CENTERS, DEFAULT_POPULATION, REAL_POPULATIONS
+from .spatial import EARTH_RADIUS_KM, KM_PER_DEG_LAT, StationIndex, haversine_km
+
+# lat_min, lng_min, lat_max, lng_max
+TURKEY_BBOX = (35.8, 25.6, 42.2, 44.9)
+RESOLUTION_M = 500
+# Karo kenarı (hücre); 500 m'de 16 km
+TILE_CELLS = 32
+# İl nüfusunun merkez çevresindeki (kentsel) payı ve çekirdeğin standart
+# sapması; çekirdek 3 sigmada kesilir
+URBAN_SHARE = 0.6
+URBAN_SIGMA_KM = 6.0
+# Kırsal payın yayıldığı, il merkezine en büyük uzaklık
+PROVINCE_REACH_KM = 75.0
+# Nüfus yüzeyinin örnekleme aralığı (raster hücresinden küçükse her hücre)
+POPULATION_STEP_M = 2000
+BEYOND_KM = (5, 10, 25, 50)
+
+# Matris çarpımında aynı anda tutulan en fazla hücre x aday öğesi
+_BLOCK_ELEMENTS = 1 << 22
+# Hücre x aday sayısı bunu aşan karo dörde bölünür
+_SPLIT_WORK = 1 << 20
+
+
+def _unit_vectors(lats, lngs):
+    lat = np.radians(np.asarray(lats, dtype=np.float64))
+    lng = np.radians(np.asarray(lngs, dtype=np.float64))
+    cos_lat = np.cos(lat)
+    return np.stack([cos_lat * np.cos(lng), cos_lat * np.sin(lng), np.sin(lat)], axis=-1)
+
+
+def _dot_to_km(dot):
+    # Birim vektörlerin iç çarpımı -> kiriş -> büyük çember mesafesi
+    chord = np.sqrt(np.maximum(2.0 - 2.0 * dot, 0.0))
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.minimum(chord / 2, 1.0))
+
+
+class CoverageRaster:
+    """En yakın istasyon mesafesi (km); satır 0 güney, sütun 0 batı kenarıdır.
+
+    distances bellekte bir dizi veya mmap'li .npy olabilir. Hiç istasyon
+    yoksa hücreler inf değerini taşır.
+    """
+
+    def __init__(self, distances, lat0, lng0, dlat, dlng, meta=None):
+        self.distances = distances
+        self.lat0 = float(lat0)
+        self.lng0 = float(lng0)
+        self.dlat = float(dlat)
+        self.dlng = float(dlng)
+        self.meta = dict(meta or {})
+
+    @property
+    def shape(self):
+        return self.distances.shape
+
+    @staticmethod
+    def grid(bbox=TURKEY_BBOX, resolution_m=RESOLUTION_M):
+        """bbox için ızgara: (lat0, lng0, dlat, dlng, satır, sütun)."""
+        lat_min, lng_min, lat_max, lng_max = bbox
+        dlat = resolution_m / 1000 / KM_PER_DEG_LAT
+        # Boylam adımı orta enlemde dlat ile aynı metreye karşılık gelir
+        dlng = dlat / math.cos(math.radians((lat_min + lat_max) / 2))
+        n_rows = int(math.ceil((lat_max - lat_min) / dlat))
+        n_cols = int(math.ceil((lng_max - lng_min) / dlng))
+        return lat_min, lng_min, dlat, dlng, n_rows, n_cols
+
+    @classmethod
+    def open(cls, prefix):
+        """<prefix>.npy ve <prefix>.json ile yazılmış rasterı mmap ile açar."""
+        with open(f'{prefix}.json', encoding='utf-8') as f:
+            meta = json.load(f)
+        g = meta['grid']
+        distances = np.load(f'{prefix}.npy', mmap_mode='r')
+        return cls(distances, g['lat0'], g['lng0'], g['dlat'], g['dlng'], meta)
+
+    def cell_lats(self, rows):
+        return self.lat0 + (np.asarray(rows) + 0.5) * self.dlat
+
+    def cell_lngs(self, cols):
+        return self.lng0 + (np.asarray(cols) + 0.5) * self.dlng
+
+    def window(self, lat, lng, radius_km):
+        """(lat, lng) çevresindeki radius_km kutusunun raster dilimleri (satırlar, sütunlar)."""
+        dlat = radius_km / KM_PER_DEG_LAT
+        dlng = dlat / max(math.cos(math.radians(lat)), 1e-6)
+        n_rows, n_cols = self.shape
+        r0 = max(int((lat - dlat - self.lat0) // self.dlat), 0)
+        r1 = min(int((lat + dlat - self.lat0) // self.dlat) + 1, n_rows)
+        c0 = max(int((lng - dlng - self.lng0) // self.dlng), 0)
+        c1 = min(int((lng + dlng - self.lng0) // self.dlng) + 1, n_cols)
+        return slice(r0, max(r0, r1)), slice(c0, max(c0, c1))
+
+    def value_at(self, lat, lng):
+        """Noktanın düştüğü hücrenin mesafesi (km); raster dışında None."""
+        row = int((lat - self.lat0) // self.dlat)
+        col = int((lng - self.lng0) // self.dlng)
+        n_rows, n_cols = self.shape
+        if not (0 <= row < n_rows and 0 <= col < n_cols):
+            return None
+        return float(self.distances[row, col])
+
+    def write_meta(self, prefix, **extra):
+        """Izgara tanımını ve ek alanları (ör. şehir özetleri) <prefix>.json'a yazar."""
+        n_rows, n_cols = self.shape
+        meta = {**self.meta, 'version': 1,
+                'grid': {'lat0': self.lat0, 'lng0': self.lng0, 'dlat': self.dlat, 'dlng': self.dlng,
+                         'rows': n_rows, 'cols': n_cols},
+                **extra}
+        with open(f'{prefix}.json', 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2)
+        self.meta = meta
+
+
+def _tile_distances(index, xyz, lats, lngs):
+    # Karodaki hücre merkezleri için en yakın istasyon mesafesi
+    lat_c = float(lats[0] + lats[-1]) / 2
+    lng_c = float(lngs[0] + lngs[-1]) / 2
+    shape = (len(lats), len(lngs))
+    _, nearest_km = index.nearest(lat_c, lng_c)
+    if not len(nearest_km):
+        return np.full(shape, np.inf)
+    reach = float(haversine_km(lat_c, lng_c, np.repeat([lats[0], lats[-1]], 2),
+                               np.tile([lngs[0], lngs[-1]], 2)).max())
+    # Üçgen eşitsizliği: her hücrenin en yakın istasyonu bu yarıçap içindedir
+    # (küçük pay kayan nokta yuvarlaması için)
+    cand, _ = index.query_radius(lat_c, lng_c, float(nearest_km[0]) + 2 * reach + 1e-3, sort=False)
+    if len(cand) * len(lats) * len(lngs) > _SPLIT_WORK and nearest_km[0] < reach and min(shape) >= 4:
+        # İstasyonların içinde olduğu yoğun karolarda küçük karoların aday
+        # kümesi belirgin biçimde küçülür (uzak karolarda küme halkaya sığar)
+        out = np.empty(shape)
+        half_r, half_c = shape[0] // 2, shape[1] // 2
+        for rs in (slice(0, half_r), slice(half_r, None)):
+            for cs in (slice(0, half_c), slice(half_c, None)):
+                out[rs, cs] = _tile_distances(index, xyz, lats[rs], lngs[cs])
+        return out
+    grid_lat, grid_lng = np.meshgrid(lats, lngs, indexing='ij')
+    cells = _unit_vectors(grid_lat.ravel(), grid_lng.ravel())
+    best = np.full(len(cells), -1.0)
+    step = max(_BLOCK_ELEMENTS // len(cells), 1)
+    for start in range(0, len(cand), step):
+        np.maximum(best, (cells @ xyz[cand[start:start + step]].T).max(axis=1), out=best)
+    return _dot_to_km(best).reshape(shape)
+
+
+def build_coverage(index, prefix=None, bbox=TURKEY_BBOX, resolution_m=RESOLUTION_M, tile_cells=TILE_CELLS):
+    """StationIndex için kapsama rasterı kurar.
+
+    Aday sayısı yüksek (yoğun) karolar dörde bölünerek işlenir.
+
+    prefix verilirse mesafeler <prefix>.npy dosyasına (float32, mmap) karo
+    karo yazılır ve bellek kullanımı raster boyutundan bağımsız kalır.
+    Izgara tanımı için ardından write_meta(prefix) çağrılmalıdır.
+    """
+    lat0, lng0, dlat, dlng, n_rows, n_cols = CoverageRaster.grid(bbox, resolution_m)
+    if prefix is not None:
+        out = np.lib.format.open_memmap(f'{prefix}.npy', mode='w+', dtype=np.float32, shape=(n_rows, n_cols))
+    else:
+        out = np.empty((n_rows, n_cols), dtype=np.float32)
+    raster = CoverageRaster(out, lat0, lng0, dlat, dlng,
+                            {'stations': len(index), 'resolutionM': resolution_m, 'bbox': list(bbox)})
+    xyz = _unit_vectors(index.lats, index.lngs)
+    for r0 in range(0, n_rows, tile_cells):
+        r1 = min(r0 + tile_cells, n_rows)
+        lats = raster.cell_lats(np.arange(r0, r1))
+        for c0 in range(0, n_cols, tile_cells):
+            c1 = min(c0 + tile_cells, n_cols)
+            out[r0:r1, c0:c1] = _tile_distances(index, xyz, lats, raster.cell_lngs(np.arange(c0, c1)))
+    if prefix is not None:
+        out.flush()
+    return raster
+
+
+def city_summary(raster, beyond_km=BEYOND_KM, populations=None, centers=None,
+                 urban_share=URBAN_SHARE, sigma_km=URBAN_SIGMA_KM, reach_km=PROVINCE_REACH_KM):
+    """İl başına nüfus ağırlıklı mesafe özetleri; yalnızca rasterı okur.
+
+    Her satır: nüfus, ortalama ve medyan mesafe ve beyond_km eşiklerinin her
+    biri için o mesafeden uzakta kalan nüfus payı. Son eleman tüm illerin
+    toplamıdır ('city': 'TOPLAM').
+    """
+    if populations is None:
+        populations = REAL_POPULATIONS
+    if centers is None:
+        centers = CITY_CENTERS
+    thresholds = np.asarray(beyond_km, dtype=np.float64)
+    names = list(centers)
+    c_lat, c_lng = (np.asarray(v, dtype=np.float64) for v in zip(*centers.values()))
+    c_xyz = _unit_vectors(c_lat, c_lng)
+
+    # Örneklenen hücreler: en yakın il, il merkezine mesafe ve istasyon mesafesi
+    n_rows, n_cols = raster.shape
+    resolution_m = raster.dlat * KM_PER_DEG_LAT * 1000
+    step = max(int(round(POPULATION_STEP_M / resolution_m)), 1)
+    rows = np.arange(step // 2, n_rows, step)
+    cols = np.arange(step // 2, n_cols, step)
+    lngs = raster.cell_lngs(cols)
+    block = max(_BLOCK_ELEMENTS // (len(cols) * len(names)), 1)
+    codes, d_center, dists = [], [], []
+    for start in range(0, len(rows), block):
+        r = rows[start:start + block]
+        grid_lat, grid_lng = np.meshgrid(raster.cell_lats(r), lngs, indexing='ij')
+        dot = _unit_vectors(grid_lat.ravel(), grid_lng.ravel()) @ c_xyz.T
+        nearest = dot.argmax(axis=1)
+        km = _dot_to_km(dot[np.arange(len(nearest)), nearest])
+        keep = km <= reach_km
+        codes.append(nearest[keep])
+        d_center.append(km[keep])
+        dists.append(np.asarray(raster.distances[r][:, cols], dtype=np.float64).ravel()[keep])
+    code = np.concatenate(codes)
+    d_center = np.concatenate(d_center)
+    dist = np.concatenate(dists)
+
+    population = np.asarray([populations.get(city, DEFAULT_POPULATION) for city in names], dtype=np.float64)
+    kernel = np.where(d_center <= 3 * sigma_km, np.exp(-0.5 * (d_center / sigma_km) ** 2), 0.0)
+    kernel_sum = np.bincount(code, kernel, minlength=len(names))
+    cell_count = np.bincount(code, minlength=len(names)).astype(np.float64)
+    urban = np.divide(urban_share * kernel, kernel_sum[code], out=np.zeros_like(kernel), where=kernel_sum[code] > 0)
+    weight = population[code] * (urban + (1 - urban_share) / cell_count[code])
+
+    out = []
+    order = np.argsort(code, kind='stable')
+    bounds = np.searchsorted(code[order], np.arange(len(names) + 1))
+    for i, city in enumerate(names):
+        members = order[bounds[i]:bounds[i + 1]]
+        if len(members) and weight[members].sum() > 0:
+            out.append(_summary_row(city, dist[members], weight[members], thresholds))
+    out.sort(key=lambda r: r['shareBeyondKm'][_km_key(thresholds[0])] if len(thresholds) else 0, reverse=True)
+    if len(dist):
+        out.append(_summary_row('TOPLAM', dist, weight, thresholds))
+    return out
+
+
+def _km_key(km):
+    return f'{km:g}'
+
+
+def _summary_row(city, dist, weight, thresholds):
+    total = weight.sum()
+    order = np.argsort(dist, kind='stable')
+    cum = np.cumsum(weight[order])
+    median = float(dist[order][min(np.searchsorted(cum, total / 2), len(cum) - 1)])
+    finite = np.isfinite(dist)
+    mean = float(np.average(dist[finite], weights=weight[finite])) if finite.all() else None
+    return {
+        'city': city,
+        'population': int(round(total)),
+        'meanKm': round(mean, 2) if mean is not None else None,
+        'medianKm': round(median, 2) if math.isfinite(median) else None,
+        'shareBeyondKm': {_km_key(km): round(float(weight[dist > km].sum() / total), 4) for km in thresholds},
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Türkiye için en yakın istasyon mesafesi rasterı ve şehir özetleri')
+    parser.add_argument('input', nargs='?',
+                        help='real_zes_stations.json, .ndjson(.gz) veya .zcol (verilmezse --seed ile üretilir)')
+    parser.add_argument('-o', '--output', default='coverage',
+                        help='çıktı öneki: <önek>.npy raster ve <önek>.json ızgara + şehir özetleri')
+    parser.add_argument('--dc', action='store_true', help='yalnızca DC/HPC istasyonları')
+    parser.add_argument('--resolution', type=float, default=RESOLUTION_M, metavar='METRE',
+                        help=f'hücre boyu (varsayılan: {RESOLUTION_M} m)')
+    parser.add_argument('--beyond', type=float, nargs='+', default=list(BEYOND_KM), metavar='KM',
+                        help='nüfus payı hesaplanacak mesafe eşikleri')
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--scale', type=float, default=1.0, help='girdi yoksa üretilecek dağılımın katsayısı')
+    args = parser.parse_args(argv)
+
+    if args.resolution <= 0:
+        parser.error('--resolution pozitif olmalı')
+
+    t0 = time.perf_counter()
+    if args.input:
+        index = StationIndex.from_file(args.input)
+    else:
+        from .data import EV_DISTRIBUTION_2025
+        from .generator import generate_distributed_stations, scale_distribution
+
+        distribution = scale_distribution(EV_DISTRIBUTION_2025, args.scale)
+        index = StationIndex.from_stations(generate_distributed_stations(distribution, engine='numpy',
+                                                                         seed=args.seed))
+    if args.dc:
+        index = index.dc_only()
+    t_index = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    raster = build_coverage(index, args.output, resolution_m=args.resolution)
+    elapsed = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    cities = city_summary(raster, args.beyond)
+    t_summary = time.perf_counter() - t0
+    raster.write_meta(args.output, dcOnly=args.dc, beyondKm=args.beyond, cities=cities)
+
+    n_rows, n_cols = raster.shape
+    print(f"🗺️ {len(index)} istasyon, {n_rows} x {n_cols} hücre ({args.resolution:g} m): "
+          f"raster {elapsed:.2f} sn, indeks {t_index:.2f} sn, özet {t_summary:.2f} sn")
+    print(f"💾 {args.output}.npy, {args.output}.json")
+    threshold = _km_key(args.beyond[0])
+    print(f"\n📊 {threshold} km'den uzakta kalan nüfus payı (en kötü 15 il ve toplam):")
+    for row in cities[:-1][:15] + cities[-1:]:
+        mean = f"{row['meanKm']:.1f} km" if row['meanKm'] is not None else '-'
+        print(f"  {row['city']}: %{row['shareBeyondKm'][threshold] * 100:.1f} (ort. {mean})")
+
+
+if __name__ == '__main__':
+    main()
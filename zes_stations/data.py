@@ -0,0 +1,431 @@
+"""Şehir hedefleri, gerçek lokasyon verileri, il merkezleri ve şehir başına EV/istasyon/nüfus sayıları."""
+
+# 2025 Türkiye EV dağılımına göre şehir yoğunlukları
+EV_DISTRIBUTION_2025 = {
+    'İstanbul': 350,  # Artırdık - büyük şehir
+    'Ankara': 150,    # Artırdık
+    'İzmir': 120,     # Artırdık
+    'Antalya': 80,
+    'Bursa': 70,
+    'Kocaeli': 60,
+    'Muğla': 55,
+    'Adana': 50,
+    'Mersin': 45,
+    'Konya': 40,
+    'Aydın': 35,
+    'Balıkesir': 30,
+    'Eskişehir': 30,
+    'Denizli': 25,
+    'Gaziantep': 25,
+    'Kayseri': 20,
+    'Tekirdağ': 20,
+    'Manisa': 18,
+    'Sakarya': 18,
+    'Çanakkale': 15
+}
+
+# Her şehir için GERÇEK mahalle, ilçe ve lokasyonlar
+DETAILED_LOCATIONS = {
+    'İstanbul': [
+        # Avrupa Yakası - Farklı İlçeler
+        {'name': 'Bağcılar Meydan AVM', 'lat': 41.0392, 'lng': 28.8576, 'district': 'Bağcılar'},
+        {'name': 'Güngören Güven Park', 'lat': 41.0234, 'lng': 28.8734, 'district': 'Güngören'},
+        {'name': 'Bahçelievler Metro İstasyonu', 'lat': 41.0012, 'lng': 28.8523, 'district': 'Bahçelievler'},
+        {'name': 'Esenler Otobüs Terminali', 'lat': 41.0478, 'lng': 28.8812, 'district': 'Esenler'},
+        {'name': 'Küçükçekmece Halkalı', 'lat': 41.0156, 'lng': 28.6234, 'district': 'Küçükçekmece'},
+        {'name': 'Avcılar Ambarlı Yolu', 'lat': 40.9834, 'lng': 28.7312, 'district': 'Avcılar'},
+        {'name': 'Beylikdüzü Migros AVM', 'lat': 41.0042, 'lng': 28.6499, 'district': 'Beylikdüzü'},
+        {'name': 'Esenyurt Marmara Park AVM', 'lat': 41.0312, 'lng': 28.6734, 'district': 'Esenyurt'},
+        {'name': 'Büyükçekmece Mimarsinan', 'lat': 41.0223, 'lng': 28.5845, 'district': 'Büyükçekmece'},
+        {'name': 'Bakırköy Capacity AVM', 'lat': 40.9807, 'lng': 28.8734, 'district': 'Bakırköy'},
+        {'name': 'Zeytinburnu Olivium AVM', 'lat': 41.0045, 'lng': 28.9012, 'district': 'Zeytinburnu'},
+        {'name': 'Fatih Çapa', 'lat': 41.0189, 'lng': 28.9423, 'district': 'Fatih'},
+        {'name': 'Eyüpsultan Çırçır', 'lat': 41.0567, 'lng': 28.9189, 'district': 'Eyüpsultan'},
+        {'name': 'Gaziosmanpaşa Metro İstasyonu', 'lat': 41.0678, 'lng': 28.9056, 'district': 'Gaziosmanpaşa'},
+        {'name': 'Sultangazi Cebeci', 'lat': 41.1012, 'lng': 28.8623, 'district': 'Sultangazi'},
+        {'name': 'Başakşehir Metrokent', 'lat': 41.0923, 'lng': 28.8045, 'district': 'Başakşehir'},
+        {'name': 'Arnavutköy Hadımköy', 'lat': 41.1456, 'lng': 28.6234, 'district': 'Arnavutköy'},
+        {'name': 'Çatalca Merkez', 'lat': 41.1423, 'lng': 28.4612, 'district': 'Çatalca'},
+        {'name': 'Silivri Selimpaşa', 'lat': 41.0734, 'lng': 28.2456, 'district': 'Silivri'},
+        {'name': 'Beyoğlu Taksim', 'lat': 41.0370, 'lng': 28.9857, 'district': 'Beyoğlu'},
+        {'name': 'Şişli Mecidiyeköy', 'lat': 41.0649, 'lng': 28.9938, 'district': 'Şişli'},
+        {'name': 'Beşiktaş Barbaros', 'lat': 41.0426, 'lng': 29.0076, 'district': 'Beşiktaş'},
+        {'name': 'Sarıyer İstinye Park', 'lat': 41.1089, 'lng': 29.0550, 'district': 'Sarıyer'},
+        {'name': 'Kağıthane Çağlayan', 'lat': 41.0756, 'lng': 28.9789, 'district': 'Kağıthane'},
+        {'name': 'Beylikdüzü Yaşam Vadisi', 'lat': 41.0123, 'lng': 28.6678, 'district': 'Beylikdüzü'},
+        
+        # Anadolu Yakası - Farklı İlçeler
+        {'name': 'Kadıköy Moda', 'lat': 40.9920, 'lng': 29.0270, 'district': 'Kadıköy'},
+        {'name': 'Maltepe Park Mavişehir', 'lat': 40.9356, 'lng': 29.1456, 'district': 'Maltepe'},
+        {'name': 'Kartal Yakacık', 'lat': 40.9089, 'lng': 29.1823, 'district': 'Kartal'},
+        {'name': 'Pendik Kaynarca', 'lat': 40.8718, 'lng': 29.2361, 'district': 'Pendik'},
+        {'name': 'Tuzla DESİAD', 'lat': 40.8234, 'lng': 29.2978, 'district': 'Tuzla'},
+        {'name': 'Ümraniye Finans Merkezi', 'lat': 41.0256, 'lng': 29.1089, 'district': 'Ümraniye'},
+        {'name': 'Ataşehir Palladium', 'lat': 40.9823, 'lng': 29.1245, 'district': 'Ataşehir'},
+        {'name': 'Üsküdar Kısıklı', 'lat': 41.0234, 'lng': 29.0312, 'district': 'Üsküdar'},
+        {'name': 'Beykoz Çubuklu', 'lat': 41.1234, 'lng': 29.0923, 'district': 'Beykoz'},
+        {'name': 'Çekmeköy Merkez', 'lat': 41.0323, 'lng': 29.1734, 'district': 'Çekmeköy'},
+        {'name': 'Sancaktepe Samandıra', 'lat': 41.0145, 'lng': 29.2156, 'district': 'Sancaktepe'},
+        {'name': 'Sultanbeyli Merkez', 'lat': 40.9612, 'lng': 29.2634, 'district': 'Sultanbeyli'},
+        {'name': 'Şile Merkez', 'lat': 41.1756, 'lng': 29.6178, 'district': 'Şile'},
+        {'name': 'Adalar Büyükada', 'lat': 40.8623, 'lng': 29.1234, 'district': 'Adalar'},
+        {'name': 'Kartal Soğanlık', 'lat': 40.8934, 'lng': 29.2045, 'district': 'Kartal'},
+        
+        # Otoyol ve Kavşaklar
+        {'name': 'TEM Otoyolu Hadımköy', 'lat': 41.1234, 'lng': 28.6512, 'district': 'Arnavutköy'},
+        {'name': 'E-5 Kartal Kavşağı', 'lat': 40.9145, 'lng': 29.1934, 'district': 'Kartal'},
+        {'name': 'Kuzey Marmara Otoyolu Göktürk', 'lat': 41.1678, 'lng': 28.8634, 'district': 'Eyüpsultan'},
+        {'name': 'Büyükçekmece TEM', 'lat': 41.0456, 'lng': 28.5612, 'district': 'Büyükçekmece'},
+        {'name': 'Avcılar E-5', 'lat': 40.9868, 'lng': 28.7197, 'district': 'Avcılar'},
+    ],
+    
+    'Ankara': [
+        {'name': 'Çankaya Kızılay', 'lat': 39.9194, 'lng': 32.8540, 'district': 'Çankaya'},
+        {'name': 'Keçiören Merkez', 'lat': 39.9678, 'lng': 32.8712, 'district': 'Keçiören'},
+        {'name': 'Yenimahalle Demetevler', 'lat': 39.9456, 'lng': 32.7834, 'district': 'Yenimahalle'},
+        {'name': 'Etimesgut Eryaman', 'lat': 39.9512, 'lng': 32.6834, 'district': 'Etimesgut'},
+        {'name': 'Mamak Durali Alıç', 'lat': 39.9234, 'lng': 32.9123, 'district': 'Mamak'},
+        {'name': 'Sincan Organize Sanayi', 'lat': 39.9723, 'lng': 32.5812, 'district': 'Sincan'},
+        {'name': 'Pursaklar Saray', 'lat': 40.0312, 'lng': 32.9045, 'district': 'Pursaklar'},
+        {'name': 'Altındağ Ulus', 'lat': 39.9447, 'lng': 32.8597, 'district': 'Altındağ'},
+        {'name': 'Gölbaşı Mogan Gölü', 'lat': 39.7923, 'lng': 32.8156, 'district': 'Gölbaşı'},
+        {'name': 'Polatlı Merkez', 'lat': 39.5812, 'lng': 32.1423, 'district': 'Polatlı'},
+        {'name': 'Çamlıdere Yolu', 'lat': 40.0456, 'lng': 32.4678, 'district': 'Çamlıdere'},
+        {'name': 'Beypazarı Merkez', 'lat': 40.1689, 'lng': 31.9212, 'district': 'Beypazarı'},
+        {'name': 'Çubuk Merkez', 'lat': 40.2378, 'lng': 33.0234, 'district': 'Çubuk'},
+        {'name': 'Elmadağ Merkez', 'lat': 39.9212, 'lng': 33.2345, 'district': 'Elmadağ'},
+        {'name': 'Ankara Garı', 'lat': 39.9369, 'lng': 32.8519, 'district': 'Altındağ'},
+    ],
+    
+    'İzmir': [
+        {'name': 'Konak Alsancak', 'lat': 38.4392, 'lng': 27.1478, 'district': 'Konak'},
+        {'name': 'Karşıyaka İskelesi', 'lat': 38.4623, 'lng': 27.1089, 'district': 'Karşıyaka'},
+        {'name': 'Bornova Forum', 'lat': 38.4489, 'lng': 27.2134, 'district': 'Bornova'},
+        {'name': 'Buca Evka 3', 'lat': 38.3923, 'lng': 27.1756, 'district': 'Buca'},
+        {'name': 'Gaziemir İzmir Ekonomi Üniversitesi', 'lat': 38.3234, 'lng': 27.1512, 'district': 'Gaziemir'},
+        {'name': 'Balçova Teleferik', 'lat': 38.3812, 'lng': 27.0456, 'district': 'Balçova'},
+        {'name': 'Çiğli Sasalı', 'lat': 38.5023, 'lng': 27.0312, 'district': 'Çiğli'},
+        {'name': 'Bayraklı Mavişehir', 'lat': 38.4756, 'lng': 27.1612, 'district': 'Bayraklı'},
+        {'name': 'Urla Merkez', 'lat': 38.3234, 'lng': 26.7645, 'district': 'Urla'},
+        {'name': 'Çeşme Ilıca', 'lat': 38.3267, 'lng': 26.3689, 'district': 'Çeşme'},
+        {'name': 'Karabağlar Metro İstasyonu', 'lat': 38.3745, 'lng': 27.1234, 'district': 'Karabağlar'},
+        {'name': 'Narlıdere Sahil', 'lat': 38.3956, 'lng': 27.0234, 'district': 'Narlıdere'},
+    ],
+    
+    'Antalya': [
+        {'name': 'Muratpaşa Migros AVM', 'lat': 36.8978, 'lng': 30.7123, 'district': 'Muratpaşa'},
+        {'name': 'Kepez TerraCity', 'lat': 36.9456, 'lng': 30.7345, 'district': 'Kepez'},
+        {'name': 'Konyaaltı Sahil', 'lat': 36.8745, 'lng': 30.6289, 'district': 'Konyaaltı'},
+        {'name': 'Alanya Cleopatra Beach', 'lat': 36.5439, 'lng': 32.0000, 'district': 'Alanya'},
+        {'name': 'Manavgat Şelale', 'lat': 36.7889, 'lng': 31.4423, 'district': 'Manavgat'},
+        {'name': 'Serik Belek', 'lat': 36.8634, 'lng': 31.0823, 'district': 'Serik'},
+        {'name': 'Aksu Lara', 'lat': 36.8345, 'lng': 30.8456, 'district': 'Aksu'},
+        {'name': 'Döşemealtı Korkuteli Yolu', 'lat': 36.9912, 'lng': 30.5923, 'district': 'Döşemealtı'},
+    ],
+    
+    'Bursa': [
+        {'name': 'Osmangazi Korupark', 'lat': 40.2089, 'lng': 29.0234, 'district': 'Osmangazi'},
+        {'name': 'Nilüfer Görükle', 'lat': 40.1826, 'lng': 29.0665, 'district': 'Nilüfer'},
+        {'name': 'Yıldırım Setbaşı', 'lat': 40.1789, 'lng': 29.1123, 'district': 'Yıldırım'},
+        {'name': 'Mudanya Sahil', 'lat': 40.3756, 'lng': 28.8834, 'district': 'Mudanya'},
+        {'name': 'Gemlik Liman', 'lat': 40.4312, 'lng': 29.1567, 'district': 'Gemlik'},
+        {'name': 'İnegöl Merkez', 'lat': 40.0789, 'lng': 29.5123, 'district': 'İnegöl'},
+        {'name': 'Kestel Organize Sanayi', 'lat': 40.1956, 'lng': 29.2134, 'district': 'Kestel'},
+        {'name': 'Osmangazi Zafer Plaza', 'lat': 40.1923, 'lng': 29.0612, 'district': 'Osmangazi'},
+        {'name': 'Nilüfer Özlüce', 'lat': 40.2123, 'lng': 28.9845, 'district': 'Nilüfer'},
+        {'name': 'Yıldırım Heykel', 'lat': 40.1845, 'lng': 29.0678, 'district': 'Yıldırım'},
+    ],
+    
+    'Kocaeli': [
+        {'name': 'İzmit Center AVM', 'lat': 40.7654, 'lng': 29.9403, 'district': 'İzmit'},
+        {'name': 'Gebze Gebze AVM', 'lat': 40.8023, 'lng': 29.4312, 'district': 'Gebze'},
+        {'name': 'Gölcük Marinası', 'lat': 40.7156, 'lng': 29.8178, 'district': 'Gölcük'},
+        {'name': 'Derince Liman', 'lat': 40.7523, 'lng': 29.8512, 'district': 'Derince'},
+        {'name': 'Körfez Merkez', 'lat': 40.7712, 'lng': 29.7534, 'district': 'Körfez'},
+        {'name': 'Çayırova OSB', 'lat': 40.8234, 'lng': 29.3812, 'district': 'Çayırova'},
+        {'name': 'Kartepe Kayak Merkezi', 'lat': 40.7234, 'lng': 30.0812, 'district': 'Kartepe'},
+        {'name': 'Başiskele Yuvacık', 'lat': 40.7812, 'lng': 29.8945, 'district': 'Başiskele'},
+    ],
+    
+    'Muğla': [
+        {'name': 'Bodrum Merkez', 'lat': 37.0344, 'lng': 27.4305, 'district': 'Bodrum'},
+        {'name': 'Marmaris İskele', 'lat': 36.8535, 'lng': 28.2744, 'district': 'Marmaris'},
+        {'name': 'Fethiye Çalış', 'lat': 36.6223, 'lng': 29.1134, 'district': 'Fethiye'},
+        {'name': 'Milas Havalimanı', 'lat': 37.2506, 'lng': 27.6639, 'district': 'Milas'},
+        {'name': 'Dalaman Havalimanı', 'lat': 36.7131, 'lng': 28.7925, 'district': 'Dalaman'},
+        {'name': 'Ortaca Merkez', 'lat': 36.8389, 'lng': 28.7644, 'district': 'Ortaca'},
+        {'name': 'Köyceğiz Merkez', 'lat': 36.9689, 'lng': 28.6844, 'district': 'Köyceğiz'},
+        {'name': 'Ula Merkez', 'lat': 37.1123, 'lng': 28.4112, 'district': 'Ula'},
+    ],
+    
+    'Adana': [
+        {'name': 'Seyhan Optimum AVM', 'lat': 37.0000, 'lng': 35.3213, 'district': 'Seyhan'},
+        {'name': 'Çukurova M1 AVM', 'lat': 36.9834, 'lng': 35.3567, 'district': 'Çukurova'},
+        {'name': 'Yüreğir Merkez', 'lat': 36.9456, 'lng': 35.3989, 'district': 'Yüreğir'},
+        {'name': 'Sarıçam OSB', 'lat': 37.0823, 'lng': 35.3645, 'district': 'Sarıçam'},
+        {'name': 'Ceyhan Merkez', 'lat': 37.0289, 'lng': 35.8156, 'district': 'Ceyhan'},
+        {'name': 'Kozan Merkez', 'lat': 37.4456, 'lng': 35.8178, 'district': 'Kozan'},
+        {'name': 'İmamoğlu Merkez', 'lat': 37.2645, 'lng': 35.6734, 'district': 'İmamoğlu'},
+    ],
+    
+    'Mersin': [
+        {'name': 'Akdeniz Forum Mersin', 'lat': 36.8121, 'lng': 34.6415, 'district': 'Akdeniz'},
+        {'name': 'Mezitli Marina', 'lat': 36.7623, 'lng': 34.5789, 'district': 'Mezitli'},
+        {'name': 'Toroslar Merkez', 'lat': 36.8234, 'lng': 34.6789, 'district': 'Toroslar'},
+        {'name': 'Yenişehir Cumhuriyet Meydanı', 'lat': 36.7945, 'lng': 34.6234, 'district': 'Yenişehir'},
+        {'name': 'Tarsus Merkez', 'lat': 36.9178, 'lng': 34.8967, 'district': 'Tarsus'},
+        {'name': 'Erdemli Sahil', 'lat': 36.6045, 'lng': 34.3067, 'district': 'Erdemli'},
+        {'name': 'Silifke Merkez', 'lat': 36.3789, 'lng': 33.9345, 'district': 'Silifke'},
+    ],
+    
+    'Konya': [
+        {'name': 'Selçuklu Kulesite', 'lat': 37.8756, 'lng': 32.4945, 'district': 'Selçuklu'},
+        {'name': 'Meram Meram Park', 'lat': 37.8534, 'lng': 32.4678, 'district': 'Meram'},
+        {'name': 'Karatay Alaeddin Tepesi', 'lat': 37.8712, 'lng': 32.4823, 'district': 'Karatay'},
+        {'name': 'Ereğli Merkez', 'lat': 37.5123, 'lng': 34.0467, 'district': 'Ereğli'},
+        {'name': 'Akşehir Merkez', 'lat': 38.3578, 'lng': 31.4156, 'district': 'Akşehir'},
+        {'name': 'Beyşehir Gölü', 'lat': 37.6789, 'lng': 31.7234, 'district': 'Beyşehir'},
+    ],
+    
+    'Aydın': [
+        {'name': 'Efeler Merkez', 'lat': 37.8456, 'lng': 27.8423, 'district': 'Efeler'},
+        {'name': 'Kuşadası Marina', 'lat': 37.8585, 'lng': 27.2617, 'district': 'Kuşadası'},
+        {'name': 'Nazilli Merkez', 'lat': 37.9134, 'lng': 28.3245, 'district': 'Nazilli'},
+        {'name': 'Didim Altınkum', 'lat': 37.3723, 'lng': 27.2678, 'district': 'Didim'},
+        {'name': 'Söke Merkez', 'lat': 37.7512, 'lng': 27.4089, 'district': 'Söke'},
+        {'name': 'Germencik Merkez', 'lat': 37.8712, 'lng': 27.6034, 'district': 'Germencik'},
+    ],
+    
+    'Balıkesir': [
+        {'name': 'Altıeylül Merkez', 'lat': 39.6489, 'lng': 27.8856, 'district': 'Altıeylül'},
+        {'name': 'Karesi 10 Temmuz', 'lat': 39.6534, 'lng': 27.8923, 'district': 'Karesi'},
+        {'name': 'Edremit Akçay', 'lat': 39.5934, 'lng': 27.0234, 'district': 'Edremit'},
+        {'name': 'Ayvalık Merkez', 'lat': 39.3189, 'lng': 26.6934, 'district': 'Ayvalık'},
+        {'name': 'Bandırma Liman', 'lat': 40.3523, 'lng': 27.9778, 'district': 'Bandırma'},
+        {'name': 'Gönen Kaplıcaları', 'lat': 40.1067, 'lng': 27.6478, 'district': 'Gönen'},
+    ],
+    
+    'Eskişehir': [
+        {'name': 'Odunpazarı Espark', 'lat': 39.7767, 'lng': 30.5256, 'district': 'Odunpazarı'},
+        {'name': 'Tepebaşı Porsuk', 'lat': 39.7645, 'lng': 30.5434, 'district': 'Tepebaşı'},
+        {'name': 'Sivrihisar Merkez', 'lat': 39.4489, 'lng': 31.5378, 'district': 'Sivrihisar'},
+        {'name': 'Çifteler Merkez', 'lat': 39.3856, 'lng': 31.0445, 'district': 'Çifteler'},
+        {'name': 'Mahmudiye Merkez', 'lat': 39.4923, 'lng': 31.2334, 'district': 'Mahmudiye'},
+    ],
+    
+    'Denizli': [
+        {'name': 'Pamukkale Forum AVM', 'lat': 37.7742, 'lng': 29.0847, 'district': 'Pamukkale'},
+        {'name': 'Merkezefendi Merkez', 'lat': 37.7623, 'lng': 29.1023, 'district': 'Merkezefendi'},
+        {'name': 'Çivril Merkez', 'lat': 38.2989, 'lng': 29.7367, 'district': 'Çivril'},
+        {'name': 'Acıpayam Merkez', 'lat': 37.4278, 'lng': 29.3456, 'district': 'Acıpayam'},
+        {'name': 'Tavas Merkez', 'lat': 37.5745, 'lng': 29.0678, 'district': 'Tavas'},
+    ],
+    
+    'Gaziantep': [
+        {'name': 'Şahinbey Sanko Park', 'lat': 37.0662, 'lng': 37.3833, 'district': 'Şahinbey'},
+        {'name': 'Şehitkamil Forum', 'lat': 37.0456, 'lng': 37.3545, 'district': 'Şehitkamil'},
+        {'name': 'Nizip Merkez', 'lat': 37.0089, 'lng': 37.7956, 'district': 'Nizip'},
+        {'name': 'İslahiye Merkez', 'lat': 37.0278, 'lng': 36.6323, 'district': 'İslahiye'},
+        {'name': 'Nurdağı Merkez', 'lat': 37.1756, 'lng': 37.1645, 'district': 'Nurdağı'},
+    ],
+    
+    'Kayseri': [
+        {'name': 'Kocasinan Forum', 'lat': 38.7312, 'lng': 35.4856, 'district': 'Kocasinan'},
+        {'name': 'Melikgazi Park AVM', 'lat': 38.7234, 'lng': 35.4678, 'district': 'Melikgazi'},
+        {'name': 'Talas Merkez', 'lat': 38.6823, 'lng': 35.5545, 'district': 'Talas'},
+        {'name': 'Develi Merkez', 'lat': 38.3889, 'lng': 35.4912, 'district': 'Develi'},
+    ],
+    
+    'Tekirdağ': [
+        {'name': 'Süleymanpaşa Merkez', 'lat': 40.9778, 'lng': 27.5123, 'district': 'Süleymanpaşa'},
+        {'name': 'Çorlu Merkez', 'lat': 41.1595, 'lng': 27.8006, 'district': 'Çorlu'},
+        {'name': 'Çerkezköy OSB', 'lat': 41.2889, 'lng': 28.0134, 'district': 'Çerkezköy'},
+        {'name': 'Malkara Merkez', 'lat': 40.8889, 'lng': 26.9012, 'district': 'Malkara'},
+        {'name': 'Muratlı Merkez', 'lat': 41.1756, 'lng': 27.4989, 'district': 'Muratlı'},
+    ],
+    
+    'Manisa': [
+        {'name': 'Yunusemre Merkez', 'lat': 38.6191, 'lng': 27.4289, 'district': 'Yunusemre'},
+        {'name': 'Şehzadeler Forum', 'lat': 38.6078, 'lng': 27.4567, 'district': 'Şehzadeler'},
+        {'name': 'Turgutlu Merkez', 'lat': 38.5023, 'lng': 27.7023, 'district': 'Turgutlu'},
+        {'name': 'Akhisar Merkez', 'lat': 38.9189, 'lng': 27.8378, 'district': 'Akhisar'},
+        {'name': 'Salihli Merkez', 'lat': 38.4823, 'lng': 28.1389, 'district': 'Salihli'},
+    ],
+    
+    'Sakarya': [
+        {'name': 'Adapazarı Kent Meydanı', 'lat': 40.7569, 'lng': 30.4058, 'district': 'Adapazarı'},
+        {'name': 'Serdivan Merkez', 'lat': 40.7812, 'lng': 30.3645, 'district': 'Serdivan'},
+        {'name': 'Akyazı Merkez', 'lat': 40.6856, 'lng': 30.6245, 'district': 'Akyazı'},
+        {'name': 'Geyve Merkez', 'lat': 40.5078, 'lng': 30.2934, 'district': 'Geyve'},
+        {'name': 'Hendek Merkez', 'lat': 40.7978, 'lng': 30.7489, 'district': 'Hendek'},
+    ],
+    
+    'Çanakkale': [
+        {'name': 'Merkez Kordon', 'lat': 40.1553, 'lng': 26.4142, 'district': 'Merkez'},
+        {'name': 'Biga Merkez', 'lat': 40.2289, 'lng': 27.2456, 'district': 'Biga'},
+        {'name': 'Gelibolu Liman', 'lat': 40.4078, 'lng': 26.6712, 'district': 'Gelibolu'},
+        {'name': 'Çan Merkez', 'lat': 40.0356, 'lng': 27.0534, 'district': 'Çan'},
+        {'name': 'Ayvacık Merkez', 'lat': 39.6012, 'lng': 26.4045, 'district': 'Ayvacık'},
+    ],
+}
+
+# Şehir başına elektrikli araç ve (tüm operatörler) şarj istasyonu sayıları ve
+# istasyon sayısındaki değişim (%), scripts/seed-mysql.mjs içindeki REAL_EV_DATA ile aynı kaynak
+REAL_EV_DATA = {
+    'Adana': {'evCount': 8487, 'totalStations': 199, 'stationChangePercent': 4.74},
+    'Adıyaman': {'evCount': 1317, 'totalStations': 28, 'stationChangePercent': 0.0},
+    'Afyonkarahisar': {'evCount': 2199, 'totalStations': 159, 'stationChangePercent': 0.0},
+    'Ağrı': {'evCount': 211, 'totalStations': 15, 'stationChangePercent': 0.0},
+    'Aksaray': {'evCount': 1645, 'totalStations': 52, 'stationChangePercent': 0.0},
+    'Amasya': {'evCount': 1434, 'totalStations': 46, 'stationChangePercent': 0.0},
+    'Ankara': {'evCount': 40504, 'totalStations': 1627, 'stationChangePercent': 3.17},
+    'Antalya': {'evCount': 14142, 'totalStations': 872, 'stationChangePercent': 0.69},
+    'Ardahan': {'evCount': 93, 'totalStations': 8, 'stationChangePercent': 0.0},
+    'Artvin': {'evCount': 402, 'totalStations': 24, 'stationChangePercent': 0.0},
+    'Aydın': {'evCount': 4493, 'totalStations': 196, 'stationChangePercent': 1.55},
+    'Balıkesir': {'evCount': 5208, 'totalStations': 283, 'stationChangePercent': 0.35},
+    'Bartın': {'evCount': 665, 'totalStations': 18, 'stationChangePercent': -5.26},
+    'Batman': {'evCount': 451, 'totalStations': 65, 'stationChangePercent': 0.0},
+    'Bayburt': {'evCount': 168, 'totalStations': 12, 'stationChangePercent': 0.0},
+    'Bilecik': {'evCount': 806, 'totalStations': 34, 'stationChangePercent': 0.0},
+    'Bingöl': {'evCount': 254, 'totalStations': 17, 'stationChangePercent': 0.0},
+    'Bitlis': {'evCount': 220, 'totalStations': 23, 'stationChangePercent': 0.0},
+    'Bolu': {'evCount': 1365, 'totalStations': 98, 'stationChangePercent': -1.01},
+    'Burdur': {'evCount': 1291, 'totalStations': 40, 'stationChangePercent': 2.56},
+    'Bursa': {'evCount': 13486, 'totalStations': 646, 'stationChangePercent': 1.25},
+    'Çanakkale': {'evCount': 2412, 'totalStations': 166, 'stationChangePercent': 0.61},
+    'Çankırı': {'evCount': 505, 'totalStations': 31, 'stationChangePercent': 0.0},
+    'Çorum': {'evCount': 1892, 'totalStations': 65, 'stationChangePercent': 3.17},
+    'Denizli': {'evCount': 4882, 'totalStations': 204, 'stationChangePercent': 5.15},
+    'Diyarbakır': {'evCount': 1649, 'totalStations': 160, 'stationChangePercent': 8.84},
+    'Düzce': {'evCount': 1387, 'totalStations': 59, 'stationChangePercent': 3.51},
+    'Edirne': {'evCount': 1631, 'totalStations': 77, 'stationChangePercent': 2.67},
+    'Elazığ': {'evCount': 1917, 'totalStations': 57, 'stationChangePercent': 1.79},
+    'Erzincan': {'evCount': 694, 'totalStations': 19, 'stationChangePercent': 5.56},
+    'Erzurum': {'evCount': 1465, 'totalStations': 56, 'stationChangePercent': 1.82},
+    'Eskişehir': {'evCount': 4084, 'totalStations': 144, 'stationChangePercent': 0.7},
+    'Gaziantep': {'evCount': 6071, 'totalStations': 115, 'stationChangePercent': 1.77},
+    'Giresun': {'evCount': 1074, 'totalStations': 43, 'stationChangePercent': 2.38},
+    'Gümüşhane': {'evCount': 269, 'totalStations': 23, 'stationChangePercent': 4.55},
+    'Hakkari': {'evCount': 62, 'totalStations': 13, 'stationChangePercent': 0.0},
+    'Hatay': {'evCount': 5266, 'totalStations': 56, 'stationChangePercent': 1.82},
+    'Iğdır': {'evCount': 154, 'totalStations': 10, 'stationChangePercent': 0.0},
+    'Isparta': {'evCount': 1978, 'totalStations': 67, 'stationChangePercent': 3.08},
+    'İstanbul': {'evCount': 76063, 'totalStations': 3687, 'stationChangePercent': 3.1},
+    'İzmir': {'evCount': 20334, 'totalStations': 631, 'stationChangePercent': 2.27},
+    'Kahramanmaraş': {'evCount': 3641, 'totalStations': 65, 'stationChangePercent': 10.17},
+    'Karabük': {'evCount': 906, 'totalStations': 29, 'stationChangePercent': 0.0},
+    'Karaman': {'evCount': 866, 'totalStations': 29, 'stationChangePercent': 0.0},
+    'Kars': {'evCount': 297, 'totalStations': 15, 'stationChangePercent': 7.14},
+    'Kastamonu': {'evCount': 1462, 'totalStations': 49, 'stationChangePercent': 0.0},
+    'Kayseri': {'evCount': 5895, 'totalStations': 287, 'stationChangePercent': 0.7},
+    'Kilis': {'evCount': 261, 'totalStations': 6, 'stationChangePercent': 20.0},
+    'Kırıkkale': {'evCount': 888, 'totalStations': 39, 'stationChangePercent': 2.63},
+    'Kırklareli': {'evCount': 1437, 'totalStations': 45, 'stationChangePercent': 4.65},
+    'Kırşehir': {'evCount': 900, 'totalStations': 19, 'stationChangePercent': 5.56},
+    'Kocaeli': {'evCount': 6666, 'totalStations': 341, 'stationChangePercent': 2.71},
+    'Konya': {'evCount': 8785, 'totalStations': 311, 'stationChangePercent': 1.3},
+    'Kütahya': {'evCount': 2427, 'totalStations': 83, 'stationChangePercent': 2.47},
+    'Malatya': {'evCount': 2484, 'totalStations': 52, 'stationChangePercent': 10.64},
+    'Manisa': {'evCount': 5175, 'totalStations': 133, 'stationChangePercent': 2.31},
+    'Mardin': {'evCount': 684, 'totalStations': 63, 'stationChangePercent': 1.61},
+    'Mersin': {'evCount': 7234, 'totalStations': 256, 'stationChangePercent': 0.79},
+    'Muğla': {'evCount': 5302, 'totalStations': 424, 'stationChangePercent': 0.95},
+    'Muş': {'evCount': 251, 'totalStations': 22, 'stationChangePercent': 0.0},
+    'Nevşehir': {'evCount': 1356, 'totalStations': 108, 'stationChangePercent': 3.85},
+    'Niğde': {'evCount': 1204, 'totalStations': 37, 'stationChangePercent': 0.0},
+    'Ordu': {'evCount': 2051, 'totalStations': 76, 'stationChangePercent': 1.33},
+    'Osmaniye': {'evCount': 2103, 'totalStations': 31, 'stationChangePercent': 3.33},
+    'Rize': {'evCount': 890, 'totalStations': 52, 'stationChangePercent': 0.0},
+    'Sakarya': {'evCount': 3903, 'totalStations': 201, 'stationChangePercent': 3.08},
+    'Samsun': {'evCount': 4832, 'totalStations': 201, 'stationChangePercent': 1.01},
+    'Şanlıurfa': {'evCount': 2190, 'totalStations': 69, 'stationChangePercent': 2.99},
+    'Siirt': {'evCount': 186, 'totalStations': 13, 'stationChangePercent': 0.0},
+    'Sinop': {'evCount': 738, 'totalStations': 26, 'stationChangePercent': 4.0},
+    'Sivas': {'evCount': 2110, 'totalStations': 84, 'stationChangePercent': 3.7},
+    'Şırnak': {'evCount': 170, 'totalStations': 19, 'stationChangePercent': 0.0},
+    'Tekirdağ': {'evCount': 3592, 'totalStations': 154, 'stationChangePercent': 1.32},
+    'Tokat': {'evCount': 2083, 'totalStations': 49, 'stationChangePercent': 0.0},
+    'Trabzon': {'evCount': 3042, 'totalStations': 199, 'stationChangePercent': 5.85},
+    'Tunceli': {'evCount': 104, 'totalStations': 11, 'stationChangePercent': 0.0},
+    'Uşak': {'evCount': 1598, 'totalStations': 32, 'stationChangePercent': 0.0},
+    'Van': {'evCount': 699, 'totalStations': 48, 'stationChangePercent': 0.0},
+    'Yalova': {'evCount': 920, 'totalStations': 69, 'stationChangePercent': 1.47},
+    'Yozgat': {'evCount': 1107, 'totalStations': 35, 'stationChangePercent': 2.94},
+    'Zonguldak': {'evCount': 2169, 'totalStations': 54, 'stationChangePercent': 1.89},
+}
+
+# seed-mysql.mjs'deki mevsimsellik_katsayi: yaz zirvesindeki talep çarpanı
+SEASONALITY = {'Antalya': 1.2, 'Muğla': 1.2, 'Aydın': 1.2}
+
+# Şehir başına ZES istasyon sayıları, scripts/seed-mysql.mjs içindeki ZES_STATIONS ile aynı kaynak
+ZES_STATIONS = {
+    'Adana': 56, 'Adıyaman': 8, 'Afyonkarahisar': 51, 'Ağrı': 5, 'Aksaray': 18, 'Amasya': 16, 'Ankara': 630,
+    'Antalya': 309, 'Ardahan': 3, 'Artvin': 7, 'Aydın': 62, 'Balıkesir': 84, 'Bartın': 5, 'Batman': 20,
+    'Bayburt': 4, 'Bilecik': 11, 'Bingöl': 5, 'Bitlis': 8, 'Bolu': 35, 'Burdur': 12, 'Bursa': 239,
+    'Çanakkale': 58, 'Çankırı': 10, 'Çorum': 20, 'Denizli': 75, 'Diyarbakır': 43, 'Düzce': 18, 'Edirne': 24,
+    'Elazığ': 20, 'Erzincan': 7, 'Erzurum': 20, 'Eskişehir': 52, 'Gaziantep': 32, 'Giresun': 16,
+    'Gümüşhane': 8, 'Hakkari': 4, 'Hatay': 16, 'Iğdır': 3, 'Isparta': 24, 'İstanbul': 1412, 'İzmir': 232,
+    'Kahramanmaraş': 16, 'Karabük': 9, 'Karaman': 9, 'Kars': 5, 'Kastamonu': 15, 'Kayseri': 81, 'Kilis': 2,
+    'Kırıkkale': 13, 'Kırklareli': 15, 'Kırşehir': 6, 'Kocaeli': 100, 'Konya': 91, 'Kütahya': 30,
+    'Malatya': 18, 'Manisa': 46, 'Mardin': 20, 'Mersin': 92, 'Muğla': 128, 'Muş': 7, 'Nevşehir': 40,
+    'Niğde': 13, 'Ordu': 26, 'Osmaniye': 11, 'Rize': 19, 'Sakarya': 73, 'Samsun': 53, 'Şanlıurfa': 17,
+    'Siirt': 4, 'Sinop': 8, 'Sivas': 26, 'Şırnak': 7, 'Tekirdağ': 56, 'Tokat': 16, 'Trabzon': 56,
+    'Tunceli': 4, 'Uşak': 12, 'Van': 16, 'Yalova': 22, 'Yozgat': 11, 'Zonguldak': 18,
+}
+
+# Şehir nüfusları, scripts/seed-mysql.mjs içindeki REAL_POPULATIONS ile aynı kaynak
+# (listede olmayan iller için seed-mysql.mjs de DEFAULT_POPULATION kullanır)
+DEFAULT_POPULATION = 100_000
+REAL_POPULATIONS = {
+    'İstanbul': 15907951, 'Ankara': 5803482, 'İzmir': 4462056, 'Bursa': 3194720, 'Antalya': 2688004,
+    'Adana': 2274106, 'Konya': 2277017, 'Gaziantep': 2154051, 'Şanlıurfa': 2155805,
+    'Mersin': 1938389, 'Diyarbakır': 1804880, 'Kocaeli': 2079072, 'Hatay': 1686043,
+    'Manisa': 1468279, 'Kayseri': 1441523, 'Samsun': 1368488, 'Balıkesir': 1257590,
+    'Kahramanmaraş': 1177436, 'Van': 1136757, 'Aydın': 1148241, 'Denizli': 1061142,
+    'Sakarya': 1114045, 'Tekirdağ': 1143432, 'Muğla': 1054394, 'Mardin': 880116, 'Trabzon': 818023,
+    'Erzurum': 749754, 'Elazığ': 597696, 'Malatya': 812580, 'Batman': 634491, 'Ağrı': 510626,
+    'Sivas': 638956, 'Ordu': 773086, 'Çorum': 521970, 'Afyonkarahisar': 747555, 'Kütahya': 579966,
+    'Tokat': 593990, 'Edirne': 413903, 'Çanakkale': 564157, 'Kırklareli': 368869, 'Uşak': 375454,
+    'Düzce': 405929, 'Osmaniye': 560946, 'Kırıkkale': 286602, 'Aksaray': 433735, 'Yalova': 296525,
+    'Giresun': 453912, 'Rize': 348608, 'Kırşehir': 250543, 'Niğde': 364707, 'Nevşehir': 309327,
+    'Isparta': 444914, 'Burdur': 273799, 'Sinop': 220799, 'Amasya': 338267, 'Kastamonu': 383373,
+    'Zonguldak': 588510, 'Bartın': 200708, 'Karabük': 248014, 'Bolu': 320824, 'Yozgat': 418650,
+    'Çankırı': 195766, 'Karaman': 265409, 'Kilis': 147541, 'Adıyaman': 632459, 'Siirt': 353542,
+    'Şırnak': 542743, 'Bitlis': 353988, 'Muş': 408728, 'Hakkari': 287625, 'Iğdır': 204536,
+    'Erzincan': 234747, 'Artvin': 170875, 'Ardahan': 94603, 'Gümüşhane': 164521, 'Bayburt': 84843,
+    'Bingöl': 282556, 'Tunceli': 88198, 'Eskişehir': 906877, 'Kars': 282464,
+}
+
+# İl merkezlerinin koordinatları (lat, lng), src/data/realData.ts içindeki REAL_COORDINATES ile aynı kaynak.
+# REAL_COORDINATES'te olmayan Bilecik elle eklenmiştir.
+CITY_CENTERS = {
+    'İstanbul': (41.0082, 28.9784), 'Ankara': (39.9334, 32.8597), 'İzmir': (38.4237, 27.1428),
+    'Bursa': (40.1826, 29.0665), 'Antalya': (36.8969, 30.7133), 'Adana': (37.0000, 35.3213),
+    'Konya': (37.8667, 32.4833), 'Gaziantep': (37.0662, 37.3833), 'Şanlıurfa': (37.1591, 38.7969),
+    'Mersin': (36.8121, 34.6415), 'Diyarbakır': (37.9144, 40.2306), 'Kocaeli': (40.8533, 29.8815),
+    'Hatay': (36.4018, 36.3498), 'Manisa': (38.6191, 27.4289), 'Kayseri': (38.7312, 35.4787),
+    'Samsun': (41.2867, 36.3300), 'Balıkesir': (39.6484, 27.8826),
+    'Kahramanmaraş': (37.5858, 36.9371), 'Van': (38.4942, 43.4008), 'Aydın': (37.8444, 27.8458),
+    'Denizli': (37.7765, 29.0864), 'Sakarya': (40.7569, 30.3783), 'Tekirdağ': (40.9833, 27.5167),
+    'Muğla': (37.2153, 28.3636), 'Mardin': (37.3212, 40.7245), 'Trabzon': (41.0015, 39.7178),
+    'Erzurum': (39.9000, 41.2700), 'Elazığ': (38.6810, 39.2264), 'Malatya': (38.3552, 38.3095),
+    'Batman': (37.8812, 41.1351), 'Ağrı': (39.7191, 43.0503), 'Sivas': (39.7477, 37.0179),
+    'Ordu': (40.9839, 37.8764), 'Çorum': (40.5506, 34.9556), 'Afyonkarahisar': (38.7507, 30.5567),
+    'Kütahya': (39.4167, 29.9833), 'Tokat': (40.3167, 36.5500), 'Edirne': (41.6771, 26.5557),
+    'Çanakkale': (40.1553, 26.4142), 'Kırklareli': (41.7333, 27.2167), 'Uşak': (38.6823, 29.4061),
+    'Düzce': (40.8438, 31.1565), 'Osmaniye': (37.0742, 36.2469), 'Kırıkkale': (39.8468, 33.5153),
+    'Aksaray': (38.3687, 34.0370), 'Yalova': (40.6500, 29.2667), 'Giresun': (40.9128, 38.3895),
+    'Rize': (41.0201, 40.5234), 'Kırşehir': (39.1425, 34.1709), 'Niğde': (37.9667, 34.6833),
+    'Nevşehir': (38.6939, 34.6857), 'Isparta': (37.7648, 30.5566), 'Burdur': (37.7167, 30.2833),
+    'Sinop': (42.0231, 35.1531), 'Amasya': (40.6499, 35.8353), 'Kastamonu': (41.3887, 33.7827),
+    'Zonguldak': (41.4564, 31.7987), 'Bartın': (41.5811, 32.4610), 'Karabük': (41.2061, 32.6204),
+    'Bolu': (40.7339, 31.6061), 'Yozgat': (39.8181, 34.8147), 'Çankırı': (40.6013, 33.6134),
+    'Karaman': (37.1759, 33.2287), 'Kilis': (36.7184, 37.1212), 'Adıyaman': (37.7648, 38.2786),
+    'Siirt': (37.9333, 41.9500), 'Şırnak': (37.4187, 42.4918), 'Bitlis': (38.4008, 42.1232),
+    'Muş': (38.7432, 41.5064), 'Hakkari': (37.5833, 43.7333), 'Iğdır': (39.8880, 44.0048),
+    'Erzincan': (39.7500, 39.5000), 'Artvin': (41.1828, 41.8183), 'Ardahan': (41.1105, 42.7022),
+    'Gümüşhane': (40.4386, 39.5086), 'Bayburt': (40.2552, 40.2249), 'Bingöl': (38.8854, 40.4983),
+    'Tunceli': (39.3074, 39.4388), 'Eskişehir': (39.7767, 30.5206), 'Kars': (40.6167, 43.1000),
+    'Bilecik': (40.1419, 29.9793),
+}
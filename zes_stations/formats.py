@@ -0,0 +1,135 @@
+"""İstasyon dosyası biçimleri: akış halinde yazıcılar ve okuyucular."""
+import gzip
+import io
+import json
+
+# Çıktı biçimleri ve varsayılan dosya adları
+OUTPUT_FORMATS = {
+    'json': 'real_zes_stations.json',
+    'ndjson': 'real_zes_stations.ndjson',
+    'ndjson.gz': 'real_zes_stations.ndjson.gz',
+}
+
+WRITE_BUFFER_SIZE = 1 << 20
+
+_encode = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+
+
+def write_json(stations, path):
+    """İstasyonları tek satırlık kompakt bir JSON dizisi olarak akıtarak yazar."""
+    count = 0
+    with open(path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        f.write('[')
+        for station in stations:
+            if count:
+                f.write(',')
+            f.write(_encode(station))
+            count += 1
+        f.write(']\n')
+    return count
+
+
+def _write_lines(stations, f):
+    count = 0
+    for station in stations:
+        f.write(_encode(station))
+        f.write('\n')
+        count += 1
+    return count
+
+
+def write_ndjson(stations, path):
+    """Her satıra bir istasyon yazar (newline-delimited JSON)."""
+    with open(path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        return _write_lines(stations, f)
+
+
+def write_ndjson_gz(stations, path):
+    """NDJSON çıktısını gzip ile sıkıştırarak yazar."""
+    with gzip.open(path, 'wb', compresslevel=6) as raw:
+        buffered = io.BufferedWriter(raw, buffer_size=WRITE_BUFFER_SIZE)
+        with io.TextIOWrapper(buffered, encoding='utf-8', newline='\n') as f:
+            return _write_lines(stations, f)
+
+
+WRITERS = {
+    'json': write_json,
+    'ndjson': write_ndjson,
+    'ndjson.gz': write_ndjson_gz,
+}
+
+
+def write_stations(stations, path, fmt='json'):
+    """İstasyonları seçilen biçimde artımlı olarak yazar; yazılan adedi döndürür."""
+    try:
+        writer = WRITERS[fmt]
+    except KeyError:
+        raise ValueError(f"Bilinmeyen çıktı biçimi: {fmt}") from None
+    return writer(stations, path)
+
+
+def _iter_json_array(f, chunk_size=WRITE_BUFFER_SIZE):
+    # Büyük JSON dizilerini tamamını belleğe almadan, parça parça çözer
+    decode = json.JSONDecoder().raw_decode
+    buf = f.read(chunk_size).lstrip()
+    if not buf.startswith('['):
+        raise ValueError("JSON dizisi bekleniyordu")
+    pos = 1
+    while True:
+        while True:
+            while pos < len(buf) and buf[pos] in ' \t\r\n,':
+                pos += 1
+            if pos < len(buf):
+                break
+            buf, pos = f.read(chunk_size), 0
+            if not buf:
+                raise ValueError("JSON dizisi beklenmedik şekilde bitti")
+        if buf[pos] == ']':
+            return
+        try:
+            station, end = decode(buf, pos)
+        except json.JSONDecodeError:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                raise
+            buf, pos = buf[pos:] + chunk, 0
+            continue
+        if end == len(buf) or buf[end] not in ' \t\r\n,]':
+            # Değerden sonra ayraç yok: parçalar arasında bölünmüş bir sayının
+            # yalnızca başı çözülmüş olabilir ("12" + "3", "4.5" + "e1");
+            # devamı okunup yeniden çözülür
+            chunk = f.read(chunk_size)
+            if chunk:
+                buf, pos = buf[pos:] + chunk, 0
+                continue
+            if end < len(buf):
+                raise ValueError("Geçersiz JSON dizisi")
+        pos = end
+        yield station
+
+
+def iter_station_file(path):
+    """write_stations ile yazılmış (veya indent'li eski) bir dosyadan istasyonları tek tek okur."""
+    path = str(path)
+    if path.endswith('.gz'):
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    elif path.endswith(('.ndjson', '.jsonl')):
+        with open(path, encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        with open(path, encoding='utf-8') as f:
+            yield from _iter_json_array(f)
+
+
+def output_stem(path):
+    """real_zes_stations.json / .ndjson / .ndjson.gz -> real_zes_stations"""
+    path = str(path)
+    for suffix in ('.ndjson.gz', '.ndjson', '.jsonl', '.json'):
+        if path.endswith(suffix):
+            return path[:-len(suffix)]
+    return path
@@ -0,0 +1,583 @@
+"""Şehir hedeflerine göre sentetik ZES istasyonu üretimi.
+
+İki motor aynı kayıtları üretir: python (istasyon başına rastgele çekiliş) ve
+numpy (sabit boyutlu bloklar halinde toplu diziler). Üretim akış halindedir;
+istasyonlar tek tek döner ve bellekte liste tutulmaz.
+"""
+import math
+import os
+import pickle
+import random
+import shutil
+import tempfile
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:  # numpy yalnızca vektörel motor için gerekli
+    np = None
+
+from .data import DETAILED_LOCATIONS, EV_DISTRIBUTION_2025
+from .hooks import CountingRNG
+
+# Güç kademeleri: HPC / DC / AC için olasılık, güç ve soket tabloları
+POWER_TIERS = ('HPC', 'DC', 'AC')
+POWER_TIER_WEIGHTS = (0.3, 0.5, 0.2)
+TIER_POWER = ('180 kW', '150 kW', '50 kW')
+TIER_DC_SOCKETS = (6, 4, 2)
+TIER_AC_SOCKETS = (8, 6, 4)
+_TIER_INDEXES = range(len(POWER_TIERS))
+
+STATION_TYPES = ('mall', 'city', 'highway')
+
+# Lokasyon çevresindeki rastgele sapma (derece)
+JITTER_DEG = 0.005
+
+ENGINES = ('python', 'numpy')
+# numpy motorunda aynı anda çekilen istasyon sayısı; daha küçük şehirler tek blokta üretilir
+VECTOR_CHUNK = 8192
+# random: lokasyon çevresine rastgele (veya min_spacing_m ile Poisson-disk);
+# greedy: kapsanan talebi en çoklayan yerler (bkz. placement)
+PLACEMENTS = ('random', 'greedy')
+
+# Minimum aralıklı (Poisson-disk) yerleşim: nokta başına deneme sayısı
+POISSON_MAX_ATTEMPTS = 30
+M_PER_DEG_LAT = 111_195.0
+
+
+def _anchor_quotas(target_count, location_count):
+    # Şehir hedefini lokasyonlara eşit böl; kalanı ilk lokasyonlara birer birer dağıt
+    base, extra = divmod(target_count, location_count)
+    return [base + (1 if i < extra else 0) for i in range(location_count)]
+
+
+def _uniform_pairs(rng, batch=4096):
+    # [-1, 1] aralığında sonsuz (u, v) akışı; numpy üreticisinde toplu çekilir
+    # numpy Generator (veya onu saran CountingRNG) dizi boyutu kabul eder
+    if np is not None and hasattr(rng, 'integers'):
+        while True:
+            yield from map(tuple, rng.uniform(-1.0, 1.0, (batch, 2)).tolist())
+    else:
+        while True:
+            yield rng.uniform(-1.0, 1.0), rng.uniform(-1.0, 1.0)
+
+
+class _PoissonAnchor:
+    """Bir lokasyonun ±JITTER_DEG karesine, aralarında en az min_spacing_m
+    bulunan noktalar yerleştirir (ızgara hızlandırmalı dart atışı).
+
+    Izgara şehirdeki tüm lokasyonlarca paylaşılır; böylece birbirine yakın
+    lokasyonların istasyonları da aralığa uyar. Hücre kenarı min_spacing_m / √2
+    olduğundan her hücrede en fazla bir nokta bulunur ve bir aday için yalnızca
+    çevresindeki 5x5 hücreye bakılır.
+    """
+
+    def __init__(self, grid, origin, lat, lng, min_spacing_m):
+        lat0, lng0, self.m_per_deg_lng = origin
+        # Lokasyon merkezinin şehir düzlemindeki (metre) konumu
+        self.x0 = (lng - lng0) * self.m_per_deg_lng
+        self.y0 = (lat - lat0) * M_PER_DEG_LAT
+        self.half_w = JITTER_DEG * self.m_per_deg_lng
+        self.half_h = JITTER_DEG * M_PER_DEG_LAT
+        self.cell = min_spacing_m / math.sqrt(2)
+        self.r2 = min_spacing_m * min_spacing_m
+        self.grid = grid
+        self.offsets = []
+        self.saturated = False
+
+    def _free(self, x, y, cx, cy):
+        grid = self.grid
+        for gx in range(cx - 2, cx + 3):
+            for gy in range(cy - 2, cy + 3):
+                p = grid.get((gx, gy))
+                if p is not None and (p[0] - x) ** 2 + (p[1] - y) ** 2 < self.r2:
+                    return False
+        return True
+
+    def fill(self, pairs, count, max_attempts=POISSON_MAX_ATTEMPTS):
+        """En fazla count nokta ekler; eklenen adedi döndürür."""
+        added = 0
+        while added < count and not self.saturated:
+            for _ in range(max_attempts):
+                u, v = next(pairs)
+                dx = u * self.half_w
+                dy = v * self.half_h
+                x = self.x0 + dx
+                y = self.y0 + dy
+                cx = int(x // self.cell)
+                cy = int(y // self.cell)
+                if self._free(x, y, cx, cy):
+                    self.grid[(cx, cy)] = (x, y)
+                    self.offsets.append((dy / M_PER_DEG_LAT, dx / self.m_per_deg_lng))
+                    added += 1
+                    break
+            else:
+                # Art arda max_attempts aday reddedildi: lokasyon doldu
+                self.saturated = True
+        return added
+
+
+def _poisson_layout(city, target_count, locations, rng, min_spacing_m, report=None):
+    """Lokasyon başına (lat, lng) sapma listeleri; dolan lokasyonların kalan
+    kotası dolmamış lokasyonlara dağıtılır. Kotasını alamayan lokasyonlar ve
+    şehir genelindeki eksik report listesine eklenir."""
+    pairs = _uniform_pairs(rng)
+    quotas = _anchor_quotas(target_count, len(locations))
+    # Şehir için ortak metrik düzlem ve ızgara
+    lat0, lng0 = locations[0]['lat'], locations[0]['lng']
+    origin = (lat0, lng0, M_PER_DEG_LAT * math.cos(math.radians(lat0)))
+    grid = {}
+    anchors = [_PoissonAnchor(grid, origin, loc['lat'], loc['lng'], min_spacing_m) for loc in locations]
+
+    missing = 0
+    for anchor, quota in zip(anchors, quotas):
+        missing += quota - anchor.fill(pairs, quota)
+
+    if report is not None:
+        for loc, anchor, quota in zip(locations, anchors, quotas):
+            if len(anchor.offsets) < quota:
+                report.append({'city': city, 'anchor': loc['name'], 'quota': quota, 'placed': len(anchor.offsets)})
+
+    # Kalanı, dolmamış lokasyonlara sırayla birer birer dağıt
+    while missing:
+        open_anchors = [a for a in anchors if not a.saturated]
+        if not open_anchors:
+            break
+        for anchor in open_anchors:
+            if missing and anchor.fill(pairs, 1):
+                missing -= 1
+
+    if missing and report is not None:
+        report.append({'city': city, 'anchor': None, 'quota': target_count, 'placed': target_count - missing})
+    return [anchor.offsets for anchor in anchors]
+
+
+def _layout(city, target_count, locations, rng, min_spacing_m, report, placement):
+    # Lokasyon başına sapma listeleri; düz rastgele yerleşimde None (sapmalar istasyon başına çekilir)
+    if placement == 'greedy':
+        if np is None:
+            raise RuntimeError("greedy yerleşim için numpy kurulu olmalı (pip install numpy)")
+        from .placement import greedy_layout
+
+        return greedy_layout(city, target_count, locations, report)
+    if min_spacing_m:
+        return _poisson_layout(city, target_count, locations, rng, min_spacing_m, report)
+    return None
+
+
+def iter_city_stations(city, target_count, start_id, locations=None, rng=random,
+                       min_spacing_m=None, report=None, placement='random'):
+    """Bir şehrin istasyonlarını tek tek üretir (liste tutmaz).
+
+    min_spacing_m verilirse istasyonlar lokasyon çevresine aralarında en az bu
+    kadar metre kalacak şekilde yerleştirilir (bkz. _poisson_layout).
+    placement='greedy' yerleri kapsanan talebe göre seçer (bkz.
+    placement.greedy_layout); kademe ve tip yine rng ile çekilir.
+    """
+    station_id = start_id
+
+    if locations:
+        layout = _layout(city, target_count, locations, rng, min_spacing_m, report, placement)
+        if layout is not None:
+            quotas = [len(offsets) for offsets in layout]
+        else:
+            quotas = _anchor_quotas(target_count, len(locations))
+
+        for a, (base_loc, quota) in enumerate(zip(locations, quotas)):
+            # Her lokasyona kotası kadar istasyon ekle
+            for i in range(quota):
+                if layout is None:
+                    # Küçük offset ekleyerek aynı bölgede farklı noktalar oluştur
+                    lat_offset = rng.uniform(-JITTER_DEG, JITTER_DEG)
+                    lng_offset = rng.uniform(-JITTER_DEG, JITTER_DEG)
+                else:
+                    lat_offset, lng_offset = layout[a][i]
+
+                lat = round(base_loc['lat'] + lat_offset, 6)
+                lng = round(base_loc['lng'] + lng_offset, 6)
+
+                # Güç tipini belirle (HPC / DC / AC)
+                tier = rng.choices(_TIER_INDEXES, weights=POWER_TIER_WEIGHTS)[0]
+
+                # İstasyon tipi
+                station_type = rng.choice(STATION_TYPES)
+
+                # Lokasyon adı - eğer birden fazla istasyon varsa numara ekle
+                location_name = base_loc['name']
+                if i > 0:
+                    location_name += f" {i+1}. İstasyon"
+
+                # Format: "İstanbul - Bağcılar - Bağcılar Meydan AVM"
+                district = base_loc.get('district', '')
+
+                yield {
+                    'id': f'ZES{station_id:04d}',
+                    'name': f"{city} - {district} - {location_name}" if district else f"{city} - {location_name}",
+                    'address': f"{location_name}, {district}, {city}" if district else f"{location_name}, {city}",
+                    'coordinates': {'lat': lat, 'lng': lng},
+                    'dcSockets': TIER_DC_SOCKETS[tier],
+                    'acSockets': TIER_AC_SOCKETS[tier],
+                    'power': TIER_POWER[tier],
+                    'status': 'active',
+                    'type': station_type
+                }
+                station_id += 1
+    else:
+        # Diğer şehirler için genel üretim
+        for i in range(target_count):
+            lat = 39.0 + rng.uniform(-2, 4)
+            lng = 32.0 + rng.uniform(-5, 5)
+
+            power = TIER_POWER[rng.choice(_TIER_INDEXES)]
+
+            yield {
+                'id': f'ZES{station_id:04d}',
+                'name': f"{city} - {i+1}. Şarj İstasyonu",
+                'address': f"{city} Merkez",
+                'coordinates': {'lat': round(lat, 6), 'lng': round(lng, 6)},
+                'dcSockets': 4,
+                'acSockets': 6,
+                'power': power,
+                'status': 'active',
+                'type': 'city'
+            }
+            station_id += 1
+
+
+def _station_labels(city, base_loc):
+    # Lokasyonun ad ve adres kalıplarını bir kez hazırla
+    location_name = base_loc['name']
+    district = base_loc.get('district', '')
+    if district:
+        return f"{city} - {district} - ", f", {district}, {city}", location_name
+    return f"{city} - ", f", {city}", location_name
+
+
+def iter_city_stations_vectorized(city, target_count, start_id, locations=None, rng=None,
+                                  min_spacing_m=None, report=None, placement='random'):
+    """iter_city_stations ile aynı kayıtları numpy dizileriyle toplu üretir.
+
+    Koordinat sapmaları, güç kademeleri ve istasyon tipleri VECTOR_CHUNK
+    istasyonluk bloklar halinde dizi olarak çekilir; güç/soket değerleri
+    tablolardan eşlenir. Bellek kullanımı şehir boyutundan bağımsızdır.
+    """
+    if np is None:
+        raise RuntimeError("numpy motoru için numpy kurulu olmalı (pip install numpy)")
+    if rng is None:
+        rng = np.random.default_rng()
+    if target_count <= 0:
+        return
+
+    if not locations:
+        # Diğer şehirler için genel üretim
+        for start in range(0, target_count, VECTOR_CHUNK):
+            size = min(VECTOR_CHUNK, target_count - start)
+            powers = [TIER_POWER[t] for t in rng.integers(0, len(POWER_TIERS), size=size).tolist()]
+            lats = np.round(39.0 + rng.uniform(-2, 4, size), 6).tolist()
+            lngs = np.round(32.0 + rng.uniform(-5, 5, size), 6).tolist()
+            for k in range(size):
+                i = start + k
+                yield {
+                    'id': f'ZES{start_id + i:04d}',
+                    'name': f"{city} - {i+1}. Şarj İstasyonu",
+                    'address': f"{city} Merkez",
+                    'coordinates': {'lat': lats[k], 'lng': lngs[k]},
+                    'dcSockets': 4,
+                    'acSockets': 6,
+                    'power': powers[k],
+                    'status': 'active',
+                    'type': 'city'
+                }
+        return
+
+    layout = _layout(city, target_count, locations, rng, min_spacing_m, report, placement)
+    if layout is not None:
+        quotas = np.asarray([len(offsets) for offsets in layout], dtype=np.int64)
+        target_count = int(quotas.sum())
+        layout = [o for anchor in layout for o in anchor]
+    else:
+        quotas = np.asarray(_anchor_quotas(target_count, len(locations)))
+
+    # Lokasyonların şehir içindeki ilk istasyon sırası
+    anchor_end = np.cumsum(quotas)
+    anchor_start = anchor_end - quotas
+    anchor_lat = np.asarray([loc['lat'] for loc in locations])
+    anchor_lng = np.asarray([loc['lng'] for loc in locations])
+    labels = [_station_labels(city, loc) for loc in locations]
+
+    for start in range(0, target_count, VECTOR_CHUNK):
+        size = min(VECTOR_CHUNK, target_count - start)
+        tiers = rng.choice(len(POWER_TIERS), size=size, p=POWER_TIER_WEIGHTS)
+        dc_sockets = np.asarray(TIER_DC_SOCKETS)[tiers].tolist()
+        ac_sockets = np.asarray(TIER_AC_SOCKETS)[tiers].tolist()
+        powers = [TIER_POWER[t] for t in tiers.tolist()]
+        types = rng.integers(0, len(STATION_TYPES), size=size).tolist()
+
+        # Bloktaki her istasyonun bağlı olduğu lokasyon ve lokasyon içindeki sırası
+        positions = np.arange(start, start + size)
+        anchor_idx = np.searchsorted(anchor_end, positions, side='right')
+        ordinals = (positions - anchor_start[anchor_idx]).tolist()
+
+        if layout is None:
+            lat_offsets = rng.uniform(-JITTER_DEG, JITTER_DEG, size)
+            lng_offsets = rng.uniform(-JITTER_DEG, JITTER_DEG, size)
+        else:
+            offsets = np.asarray(layout[start:start + size], dtype=np.float64).reshape(-1, 2)
+            lat_offsets, lng_offsets = offsets[:, 0], offsets[:, 1]
+        lats = np.round(anchor_lat[anchor_idx] + lat_offsets, 6).tolist()
+        lngs = np.round(anchor_lng[anchor_idx] + lng_offsets, 6).tolist()
+        anchor_idx = anchor_idx.tolist()
+
+        for k in range(size):
+            name_prefix, address_suffix, location_name = labels[anchor_idx[k]]
+            i = ordinals[k]
+            if i > 0:
+                location_name = f"{location_name} {i+1}. İstasyon"
+            yield {
+                'id': f'ZES{start_id + start + k:04d}',
+                'name': name_prefix + location_name,
+                'address': location_name + address_suffix,
+                'coordinates': {'lat': lats[k], 'lng': lngs[k]},
+                'dcSockets': dc_sockets[k],
+                'acSockets': ac_sockets[k],
+                'power': powers[k],
+                'status': 'active',
+                'type': STATION_TYPES[types[k]]
+            }
+
+
+def city_rng(seed, city, engine='python'):
+    """Şehre özgü, tohumdan türetilen bağımsız rastgele sayı akışı.
+
+    Akış yalnızca (seed, şehir adı) ikilisine bağlıdır; şehir sırası, işçi
+    sayısı veya PYTHONHASHSEED çıktıyı değiştirmez.
+    """
+    if engine == 'numpy':
+        if np is None:
+            raise RuntimeError("numpy motoru için numpy kurulu olmalı (pip install numpy)")
+        key = zlib.crc32(city.encode('utf-8'))
+        return np.random.default_rng(np.random.SeedSequence([seed, key]))
+    return random.Random(f"{seed}:{city}")
+
+
+def _city_generator(engine):
+    return iter_city_stations_vectorized if engine == 'numpy' else iter_city_stations
+
+
+def _instrumented(stations, city, city_locations, hooks, rng=None, clock=None):
+    # Şehir bitince kancaya bildirir; rng (CountingRNG) verilirse üretimde geçen
+    # süre (tüketicide geçen süre hariç) ve çekiliş sayısı da ölçülür
+    count = 0
+    metrics = {'anchors': len(city_locations or ()), 'cached': False}
+    if rng is None:
+        for count, station in enumerate(stations, 1):
+            yield station
+    else:
+        perf_counter = time.perf_counter
+        seconds = 0.0
+        stations = iter(stations)
+        while True:
+            t0 = perf_counter()
+            station = next(stations, None)
+            seconds += perf_counter() - t0
+            if station is None:
+                break
+            count += 1
+            yield station
+        if clock is not None:
+            clock[0] += seconds
+        metrics.update(seconds=seconds, rngDraws=rng.draws)
+    _report_city(hooks, city, {'stations': count, **metrics})
+
+
+def _report_city(hooks, city, metrics):
+    hooks.city_finished(city, metrics)
+    hooks.count('cities')
+    hooks.count('stations', metrics['stations'])
+    hooks.count('anchors', metrics['anchors'])
+    if 'rngDraws' in metrics:
+        hooks.count('rngDraws', metrics['rngDraws'])
+
+
+def city_stream(engine, city, target_count, start_id, city_locations, rng, min_spacing_m=None,
+                report=None, hooks=None, clock=None, placement='random'):
+    """Tek bir şehrin istasyon akışı; hooks verilirse şehir metrikleri bildirilir.
+
+    clock verilirse ([saniye]) şehrin üretim süresi ona eklenir.
+    """
+    generate = _city_generator(engine)
+    if hooks is None:
+        return generate(city, target_count, start_id, city_locations, rng, min_spacing_m, report, placement)
+    hooks.city_started(city, target_count)
+    if not hooks.instrument:
+        stations = generate(city, target_count, start_id, city_locations, rng, min_spacing_m, report, placement)
+        return _instrumented(stations, city, city_locations, hooks)
+    if rng is None:
+        rng = np.random.default_rng() if engine == 'numpy' and np is not None else random
+    rng = CountingRNG(rng)
+    stations = generate(city, target_count, start_id, city_locations, rng, min_spacing_m, report, placement)
+    return _instrumented(stations, city, city_locations, hooks, rng, clock)
+
+
+def _generate_city(task):
+    # İşçi süreçte tek bir şehri üretir ve VECTOR_CHUNK'lık pickle blokları halinde
+    # geçici dosyaya yazar; ana süreç dosyayı şehir sırasıyla okur. Böylece ne
+    # işçide ne de ana süreçte şehrin tamamı bellekte tutulur.
+    city, target_count, start_id, city_locations, seed, engine, min_spacing_m, placement, instrument, path = task
+    rng = city_rng(seed, city, engine)
+    if instrument:
+        rng = CountingRNG(rng)
+    report = []
+    perf_counter = time.perf_counter
+    t0 = perf_counter()
+    write_seconds = 0.0
+    count = 0
+    stations = _city_generator(engine)(city, target_count, start_id, city_locations, rng,
+                                       min_spacing_m, report, placement)
+    with open(path, 'wb') as f:
+        while True:
+            chunk = list(islice(stations, VECTOR_CHUNK))
+            if not chunk:
+                break
+            t1 = perf_counter()
+            pickle.dump(chunk, f, protocol=pickle.HIGHEST_PROTOCOL)
+            write_seconds += perf_counter() - t1
+            count += len(chunk)
+    metrics = {'stations': count, 'anchors': len(city_locations or ()), 'cached': False}
+    if instrument:
+        metrics.update(seconds=perf_counter() - t0 - write_seconds, rngDraws=rng.draws)
+    return report, metrics
+
+
+def _read_city(path):
+    # _generate_city'nin yazdığı blokları sırayla açar; okunan dosya silinir
+    try:
+        with open(path, 'rb') as f:
+            while True:
+                try:
+                    chunk = pickle.load(f)
+                except EOFError:
+                    return
+                yield from chunk
+    finally:
+        os.remove(path)
+
+
+def scale_distribution(distribution, factor):
+    """Şehir hedeflerini factor ile ölçekler (büyük veri seti denemeleri için).
+
+    Her şehir en az bir istasyon alır; factor=1 dağılımı aynen döndürür.
+    """
+    if factor == 1:
+        return dict(distribution)
+    return {city: max(1, round(target * factor)) for city, target in distribution.items()}
+
+
+def generate_distributed_stations(distribution=None, locations=None, engine='python', seed=None, workers=1,
+                                  min_spacing_m=None, placement_report=None, hooks=None, placement='random'):
+    """Tüm şehirlerin istasyonlarını sırayla, tek tek üretir.
+
+    Şehir kotaları sayaçla tutulur; her şehir tam olarak hedef sayısı kadar
+    istasyon üretir ve bellekte istasyon listesi biriktirilmez. engine='numpy'
+    rastgele değerleri şehir başına toplu dizi olarak çeker.
+
+    seed verildiğinde her şehir kendi akışıyla (city_rng) üretilir ve çıktı
+    işçi sayısından bağımsız olarak birebir aynıdır. workers > 1 şehirleri
+    bir süreç havuzuna dağıtır; sonuçlar yine şehir sırasıyla döner.
+
+    min_spacing_m verilirse lokasyon çevresindeki istasyonlar arasında en az
+    bu kadar metre bırakılır. Kotasını alamayan lokasyonlar placement_report
+    listesine eklenir; şehir yine de dolmazsa o şehrin kimlik bloğunun sonu
+    boş kalır, sonraki şehirlerin kimlikleri değişmez.
+
+    placement='greedy' istasyonları lokasyonlara eşit paylar yerine kapsanan
+    talebi en çoklayan yerlere koyar (bkz. placement; numpy gerekir).
+
+    hooks (bkz. hooks.Hooks) şehir başına süre, istasyon/lokasyon sayısı ve
+    rastgele çekiliş adedini alır; üretim sonunda 'generation' aşaması bildirilir.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Bilinmeyen üretim motoru: {engine}")
+    if workers < 1:
+        raise ValueError(f"workers en az 1 olmalı: {workers}")
+    if min_spacing_m is not None and not min_spacing_m > 0:
+        raise ValueError(f"min_spacing_m pozitif olmalı: {min_spacing_m}")
+    if workers > 1 and seed is None:
+        raise ValueError("Paralel üretim için seed verilmeli")
+    if placement not in PLACEMENTS:
+        raise ValueError(f"Bilinmeyen yerleşim: {placement}")
+
+    if distribution is None:
+        distribution = EV_DISTRIBUTION_2025
+    if locations is None:
+        locations = DETAILED_LOCATIONS
+
+    # Kimlikler şehir hedeflerinden önceden hesaplanır, böylece her şehir bağımsız üretilebilir
+    tasks = []
+    station_id = 1
+    for city, target_count in distribution.items():
+        tasks.append((city, target_count, station_id, locations.get(city), seed, engine, min_spacing_m, placement,
+                      hooks is not None and hooks.instrument))
+        station_id += target_count
+
+    if workers > 1:
+        yield from _generate_parallel(tasks, workers, placement_report, hooks)
+        return
+
+    clock = [0.0]
+    for city, target_count, start_id, city_locations, *_ in tasks:
+        if seed is not None:
+            rng = city_rng(seed, city, engine)
+        else:
+            rng = random if engine == 'python' else None
+        yield from city_stream(engine, city, target_count, start_id, city_locations, rng,
+                               min_spacing_m, placement_report, hooks, clock, placement)
+
+    if hooks is not None and hooks.instrument:
+        hooks.phase_finished('generation', clock[0])
+
+
+def _generate_parallel(tasks, workers, placement_report=None, hooks=None):
+    # Şehirler işçilerde geçici dosyalara üretilir; aynı anda en fazla
+    # 2 * workers şehir bekler. Bellekte yalnızca okunan blok tutulur.
+    tmpdir = tempfile.mkdtemp(prefix='zes_stations_')
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+
+            def submit(task):
+                path = os.path.join(tmpdir, f'{task[2]}.pkl')
+                pending.append((task, path, pool.submit(_generate_city, task + (path,))))
+
+            remaining = iter(tasks)
+            for task in remaining:
+                submit(task)
+                if len(pending) >= 2 * workers:
+                    break
+
+            seconds = 0.0
+            while pending:
+                (city, target_count, *_), path, future = pending.popleft()
+                if hooks is not None:
+                    hooks.city_started(city, target_count)
+                report, metrics = future.result()
+                if placement_report is not None:
+                    placement_report.extend(report)
+                if hooks is not None:
+                    _report_city(hooks, city, metrics)
+                    seconds += metrics.get('seconds', 0.0)
+                yield from _read_city(path)
+
+                task = next(remaining, None)
+                if task is not None:
+                    submit(task)
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+    if hooks is not None and hooks.instrument:
+        # İşçilerde geçen şehir sürelerinin toplamı (duvar saati değil)
+        hooks.phase_finished('generation', seconds)
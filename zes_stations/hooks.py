@@ -0,0 +1,195 @@
+"""Üretim sırasında metrik toplamak için takılabilir kancalar.
+
+Üretici ve CLI olayları bir Hooks nesnesine bildirir:
+
+- city_started / city_finished: şehir başına hedef, istasyon ve lokasyon
+  sayısı, üretim süresi ve çekilen rastgele sayı adedi,
+- phase_finished: CLI aşamalarının (üretim, yazma, toplama...) süreleri,
+- count: adlandırılmış sayaçlar.
+
+Hooks tüm olayları yok sayar; alt sınıflar yalnızca ilgilendikleri olayları
+ezer. MetricsRecorder olayları yapılandırılmış bir belgeye toplar,
+ConsoleHooks ilerlemeyi ekrana yazar, MultiHooks birden çok kancayı birleştirir.
+
+Süre ve çekiliş ölçümü istasyon başına ek maliyet getirdiğinden yalnızca
+instrument = True olan kancalar için yapılır; diğerleri yalnızca şehir
+başlangıç/bitiş ve istasyon sayılarını alır.
+"""
+import json
+import time
+from contextlib import contextmanager
+
+
+class Hooks:
+    """Boş (no-op) kanca seti."""
+
+    # True ise üretici şehir sürelerini ve rastgele çekilişleri ölçer
+    instrument = False
+
+    def city_started(self, city, target_count, cached=False):
+        pass
+
+    def city_finished(self, city, metrics):
+        """metrics: stations, anchors, cached; instrument ise seconds ve rngDraws da."""
+
+    def phase_finished(self, phase, seconds):
+        pass
+
+    def count(self, name, n=1):
+        pass
+
+
+class MultiHooks(Hooks):
+    """Olayları sırayla birden çok kancaya iletir."""
+
+    def __init__(self, *hooks):
+        self.hooks = [h for h in hooks if h is not None]
+        self.instrument = any(h.instrument for h in self.hooks)
+
+    def city_started(self, city, target_count, cached=False):
+        for h in self.hooks:
+            h.city_started(city, target_count, cached)
+
+    def city_finished(self, city, metrics):
+        for h in self.hooks:
+            h.city_finished(city, metrics)
+
+    def phase_finished(self, phase, seconds):
+        for h in self.hooks:
+            h.phase_finished(phase, seconds)
+
+    def count(self, name, n=1):
+        for h in self.hooks:
+            h.count(name, n)
+
+
+class ConsoleHooks(Hooks):
+    """Şehir başına ilerleme satırlarını yazar (CLI'nin varsayılan çıktısı)."""
+
+    def city_started(self, city, target_count, cached=False):
+        if not cached:
+            print(f"🏙️ {city}: {target_count} istasyon oluşturuluyor...")
+
+    def city_finished(self, city, metrics):
+        if metrics.get('cached'):
+            print(f"♻️ {city}: önbellekten ({metrics['stations']} istasyon)")
+
+
+class MetricsRecorder(Hooks):
+    """Olayları şehir, aşama ve sayaç metrikleri olarak biriktirir."""
+
+    instrument = True
+
+    def __init__(self):
+        self.cities = []
+        self.phases = {}
+        self.counters = {}
+
+    def city_finished(self, city, metrics):
+        self.cities.append({'city': city, **metrics})
+
+    def phase_finished(self, phase, seconds):
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def to_dict(self):
+        return {
+            'phases': {name: round(seconds, 6) for name, seconds in self.phases.items()},
+            'counters': dict(self.counters),
+            'cities': [{**c, 'seconds': round(c.get('seconds', 0.0), 6)} for c in self.cities],
+        }
+
+    def write(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+
+@contextmanager
+def phase(hooks, name):
+    """with bloğunun süresini hooks.phase_finished ile bildirir."""
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        if hooks is not None:
+            hooks.phase_finished(name, time.perf_counter() - t0)
+
+
+class TimedSink:
+    """Akış dinleyicisini (ör. aggregator.add) sarar ve içinde geçen süreyi toplar."""
+
+    def __init__(self, sink):
+        self.sink = sink
+        self.seconds = 0.0
+
+    def __call__(self, station):
+        t0 = time.perf_counter()
+        self.sink(station)
+        self.seconds += time.perf_counter() - t0
+
+
+class TimedConsumer:
+    """Akışı sarar ve tüketicide (ör. yazıcıda) geçen süreyi doğrudan ölçer.
+
+    Yalnızca istasyonlar teslim edildikten sonra tüketicinin bir sonraki
+    istasyonu isteyene kadar geçen süre sayılır; üreticide, işçileri
+    beklerken veya akıştaki dinleyicilerde geçen süre dahil olmaz. Akış
+    bittikten sonraki iş (ör. dosyanın kapatılması) finish() ile eklenir.
+    """
+
+    def __init__(self, stations):
+        self.stations = stations
+        self.seconds = 0.0
+        self._mark = time.perf_counter()
+
+    def __iter__(self):
+        perf_counter = time.perf_counter
+        # Tüketici akışı istemeden önce yaptığı iş (ör. dosyayı açmak)
+        self.seconds += perf_counter() - self._mark
+        for station in self.stations:
+            t0 = perf_counter()
+            yield station
+            self.seconds += perf_counter() - t0
+        self._mark = perf_counter()
+
+    def finish(self):
+        """Akış bittikten sonra geçen süreyi ekler ve toplamı döndürür."""
+        if self._mark is not None:
+            self.seconds += time.perf_counter() - self._mark
+            self._mark = None
+        return self.seconds
+
+
+class CountingRNG:
+    """random.Random veya numpy Generator'ı sarar; çekilen değer sayısını tutar.
+
+    size/k argümanı verilen çağrılar o kadar, diğerleri bir çekiliş sayılır.
+    """
+
+    def __init__(self, rng):
+        self._rng = rng
+        self.draws = 0
+
+    def __getattr__(self, name):
+        attr = getattr(self._rng, name)
+        if not callable(attr):
+            return attr
+
+        def counted(*args, **kwargs):
+            size = kwargs.get('size', kwargs.get('k'))
+            if size is None and name == 'uniform' and len(args) == 3:
+                size = args[2]
+            if size is None:
+                self.draws += 1
+            elif isinstance(size, (tuple, list)):
+                n = 1
+                for dim in size:
+                    n *= int(dim)
+                self.draws += n
+            else:
+                self.draws += int(size)
+            return attr(*args, **kwargs)
+
+        return counted
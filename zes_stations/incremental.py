@@ -0,0 +1,200 @@
+"""Şehir yapılandırması parmak izine dayalı artımlı yeniden üretim.
+
+Her şehrin girdileri (hedef sayı, DETAILED_LOCATIONS kayıtları, motor, tohum,
+yerleşim ayarı) tek bir özetle parmak izlenir. Parmak izi değişmeyen şehirlerin
+istasyonları önbellekten aynen okunur; yalnızca değişen şehirler yeniden
+üretilir.
+
+Kimlikler istasyon adına bağlı bir kayıt defterinden gelir: aynı ada sahip
+istasyon her çalıştırmada aynı ZESxxxx kimliğini alır, yeni adlar ise en
+yüksek kimliğin arkasından numaralanır. Çalıştırma sonunda eklenen, silinen
+ve değişen istasyonlar bir delta dosyasına yazılır
+(node scripts/seed-mysql.mjs --delta <dosya> ile uygulanır). Önceki bir
+manifest yoksa karşılaştırılacak durum da yoktur; bu ilk çalıştırmada delta
+yazılmaz, veritabanı tam yüklemeyle (seed-mysql.mjs) kurulur.
+"""
+import hashlib
+import json
+import os
+import random
+
+from .formats import _encode, iter_station_file, output_stem, write_ndjson
+from .generator import city_rng, city_stream
+
+MANIFEST_VERSION = 1
+# Üretim algoritması değiştiğinde artırılır; tüm şehirlerin önbelleğini geçersiz kılar
+GENERATOR_VERSION = 2
+
+
+def delta_path(output):
+    """Çıktının yanına yazılan delta dosyasının adı."""
+    return output_stem(output) + '.delta.json'
+
+
+def city_fingerprint(city, target_count, city_locations, engine, seed, min_spacing_m, placement='random'):
+    """Bir şehrin üretimini belirleyen tüm girdilerin SHA-256 özeti."""
+    payload = json.dumps({
+        'generator': GENERATOR_VERSION,
+        'city': city,
+        'target': target_count,
+        'locations': city_locations or [],
+        'engine': engine,
+        'seed': seed,
+        'min_spacing_m': min_spacing_m,
+        'placement': placement,
+    }, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class IncrementalRun:
+    """Önbellek dizinindeki manifest ile tek bir artımlı üretim çalıştırması.
+
+    stations() şehir sırasıyla tüm veri setini akıtır; commit() manifesti
+    kaydeder ve delta'yı döndürür. commit() çağrılmazsa önbellek değişmez.
+    """
+
+    def __init__(self, cache_dir, distribution, locations, engine='python', seed=None,
+                 min_spacing_m=None, placement_report=None, hooks=None, placement='random'):
+        if min_spacing_m is not None and not min_spacing_m > 0:
+            raise ValueError(f"min_spacing_m pozitif olmalı: {min_spacing_m}")
+        self.cache_dir = cache_dir
+        self.distribution = distribution
+        self.locations = locations
+        self.engine = engine
+        self.seed = seed
+        self.min_spacing_m = min_spacing_m
+        self.placement = placement
+        self.placement_report = placement_report
+        self.hooks = hooks
+        self.manifest_path = os.path.join(cache_dir, 'manifest.json')
+        self.manifest = self._load_manifest()
+        # Önceki çalıştırma yok (veya manifest eski sürüm): delta anlamsızdır
+        self.baseline = not self.manifest['cities']
+        self.ids = self.manifest['ids']
+        self.next_id = self.manifest['next_id']
+        self.delta = {'added': [], 'removed': [], 'changed': []}
+        self.reused = []
+        self.regenerated = []
+        self._cities = {}
+
+    def _load_manifest(self):
+        try:
+            with open(self.manifest_path, encoding='utf-8') as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            manifest = None
+        if not manifest or manifest.get('version') != MANIFEST_VERSION:
+            manifest = {'version': MANIFEST_VERSION, 'cities': {}, 'ids': {}, 'next_id': 1}
+        return manifest
+
+    def _city_file(self, city):
+        slug = hashlib.sha1(city.encode('utf-8')).hexdigest()[:12]
+        return os.path.join('cities', f'{slug}.ndjson')
+
+    def _assign_id(self, name):
+        number = self.ids.get(name)
+        if number is None:
+            number = self.ids[name] = self.next_id
+            self.next_id += 1
+        return f'ZES{number:04d}'
+
+    def _regenerate(self, city, target_count, city_locations, clock):
+        if self.seed is not None:
+            rng = city_rng(self.seed, city, self.engine)
+        else:
+            rng = random if self.engine == 'python' else None
+        stations = city_stream(self.engine, city, target_count, self.next_id, city_locations, rng,
+                               self.min_spacing_m, self.placement_report, self.hooks, clock, self.placement)
+        for station in stations:
+            station['id'] = self._assign_id(station['name'])
+            yield station
+
+    def _diff(self, old_path, new_stations):
+        old = {}
+        if old_path and os.path.exists(old_path):
+            old = {s['id']: s for s in iter_station_file(old_path)}
+        for station in new_stations:
+            previous = old.pop(station['id'], None)
+            if previous is None:
+                self.delta['added'].append(station)
+            elif _encode(previous) != _encode(station):
+                self.delta['changed'].append(station)
+        self.delta['removed'].extend({'id': s['id'], 'name': s['name']} for s in old.values())
+
+    def stations(self):
+        os.makedirs(os.path.join(self.cache_dir, 'cities'), exist_ok=True)
+        cached = self.manifest['cities']
+        hooks = self.hooks
+        clock = [0.0]
+
+        for city, target_count in self.distribution.items():
+            city_locations = self.locations.get(city)
+            fingerprint = city_fingerprint(city, target_count, city_locations, self.engine, self.seed,
+                                           self.min_spacing_m, self.placement)
+            entry = cached.get(city)
+            path = os.path.join(self.cache_dir, self._city_file(city))
+
+            if entry and entry['fingerprint'] == fingerprint and os.path.exists(path):
+                self.reused.append(city)
+                self._cities[city] = entry
+                if hooks is not None:
+                    hooks.city_started(city, target_count, cached=True)
+                    hooks.city_finished(city, {'stations': entry['count'], 'anchors': len(city_locations or ()),
+                                               'cached': True})
+                    hooks.count('cachedCities')
+                yield from iter_station_file(path)
+                continue
+
+            self.regenerated.append(city)
+            stations = list(self._regenerate(city, target_count, city_locations, clock))
+            self._diff(path if entry else None, stations)
+
+            # Önbelleği geçici dosyaya yaz; commit() ile yerine taşınır
+            count = write_ndjson(stations, path + '.new')
+            self._cities[city] = {'fingerprint': fingerprint, 'file': self._city_file(city),
+                                  'count': count, 'pending': True}
+            yield from stations
+
+        if hooks is not None and hooks.instrument:
+            hooks.phase_finished('generation', clock[0])
+
+        # Dağılımdan çıkarılan şehirlerin tüm istasyonları silinmiş sayılır
+        for city, entry in cached.items():
+            if city not in self._cities:
+                path = os.path.join(self.cache_dir, entry['file'])
+                if os.path.exists(path):
+                    self.delta['removed'].extend({'id': s['id'], 'name': s['name']}
+                                                 for s in iter_station_file(path))
+
+    def commit(self, delta_file=None):
+        """Önbelleği ve manifesti günceller; delta_file verilirse delta'yı yazar.
+
+        İlk çalıştırmada (baseline) tüm istasyonlar "eklenmiş" görünür. Bu delta
+        tam yüklenmiş bir veritabanına uygulanırsa her istasyonu yineler. Bu
+        yüzden delta_file yazılmaz, önceki bir çalıştırmadan kalan dosya da silinir.
+        """
+        for city, entry in self._cities.items():
+            if entry.pop('pending', False):
+                path = os.path.join(self.cache_dir, entry['file'])
+                os.replace(path + '.new', path)
+        for city, entry in self.manifest['cities'].items():
+            if city not in self._cities:
+                path = os.path.join(self.cache_dir, entry['file'])
+                if os.path.exists(path):
+                    os.remove(path)
+
+        self.manifest['cities'] = self._cities
+        self.manifest['next_id'] = self.next_id
+        tmp = self.manifest_path + '.new'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp, self.manifest_path)
+
+        if delta_file is not None and self.baseline:
+            if os.path.exists(delta_file):
+                os.remove(delta_file)
+        elif delta_file is not None:
+            with open(delta_file, 'w', encoding='utf-8') as f:
+                json.dump({**self.delta, 'regenerated': self.regenerated}, f, ensure_ascii=False,
+                          separators=(',', ':'))
+        return self.delta
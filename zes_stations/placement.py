@@ -0,0 +1,374 @@
+"""Kapsanan talebi en çoklayan yeni istasyon yerleri (tembel açgözlü, CELF).
+
+Talep, şehir nüfusunun (REAL_POPULATIONS) DETAILED_LOCATIONS lokasyonları
+çevresine Gauss çekirdeğiyle yayıldığı ızgara noktalarıdır.
+Bir istasyon COVERAGE_RADIUS_KM içindeki bir talep noktasının bir payını
+karşılar. Bu pay merkezde STATION_CAPTURE'dır ve mesafeyle doğrusal azalır.
+Bir noktanın karşılanmamış payı, istasyonların payları çarpılarak küçülür.
+Bu yüzden kapsanan talep alt-modülerdir (submodular), açgözlü seçim
+(1 - 1/e) yaklaşıklık garantisi verir ve yoğun bölgeler birden çok istasyon
+alabilir.
+
+CELF: adayların kazançları bir öncelik kuyruğunda tutulur. Kazançlar yalnızca
+azalabilir. Kuyruğun başındaki aday bu turda yeniden hesaplanmışsa seçilir,
+değilse yalnızca onun kazancı güncellenip geri konur. Her adayın kapsadığı
+talep noktaları (CSR) bir kez, uzamsal indeksle hesaplanır. Seçimden sonra
+yalnızca seçilen adayın noktalarının karşılanmamış payı güncellenir.
+"""
+import argparse
+import heapq
+import json
+import math
+import random
+import time
+
+import numpy as np
+
+from .data import DETAILED_LOCATIONS, REAL_POPULATIONS
+from .generator import (
+    POWER_TIER_WEIGHTS,
+    STATION_TYPES,
+    TIER_AC_SOCKETS,
+    TIER_DC_SOCKETS,
+    TIER_POWER,
+    _station_labels,
+    _TIER_INDEXES,
+)
+from .spatial import KM_PER_DEG_LAT, StationIndex, haversine_km
+
+COVERAGE_RADIUS_KM = 3.0
+# Lokasyon çevresindeki talep çekirdeğinin standart sapması; 3 sigmada kesilir
+POPULATION_SIGMA_KM = 4.0
+# Bir istasyonun tam üzerindeki talebin karşıladığı pay
+STATION_CAPTURE = 0.5
+DEMAND_SPACING_KM = 0.5
+CANDIDATE_SPACING_KM = 1.0
+# Üreticide aday sayısı hedefin en az bu katı olacak şekilde aralık daraltılır
+_CANDIDATES_PER_PICK = 2
+_MIN_CANDIDATE_SPACING_KM = 0.05
+
+
+def _grid_around(anchors, spacing_km, reach_km):
+    # Lokasyonları reach_km payla çevreleyen kutudaki düzenli ızgara ve lokasyon mesafeleri
+    a_lat = np.asarray([a['lat'] for a in anchors])
+    a_lng = np.asarray([a['lng'] for a in anchors])
+    dlat = spacing_km / KM_PER_DEG_LAT
+    cos_lat = math.cos(math.radians(float(a_lat.mean())))
+    pad = reach_km / KM_PER_DEG_LAT
+    lats = np.arange(a_lat.min() - pad, a_lat.max() + pad + dlat / 2, dlat)
+    lngs = np.arange(a_lng.min() - pad / cos_lat, a_lng.max() + (pad + dlat / 2) / cos_lat, dlat / cos_lat)
+    g_lat, g_lng = (g.ravel() for g in np.meshgrid(lats, lngs, indexing='ij'))
+    return g_lat, g_lng, haversine_km(g_lat[:, None], g_lng[:, None], a_lat[None, :], a_lng[None, :])
+
+
+def demand_points(cities=None, spacing_km=DEMAND_SPACING_KM, populations=None, locations=None,
+                  sigma_km=POPULATION_SIGMA_KM):
+    """Talep noktaları: (lats, lngs, ağırlıklar, şehir kodları, şehir adları).
+
+    Her lokasyon şehir nüfusunun eşit bir payını taşır ve onu 3 sigma ile
+    kesilen bir Gauss çekirdeğiyle ızgaraya yayar.
+    """
+    if populations is None:
+        populations = REAL_POPULATIONS
+    if locations is None:
+        locations = DETAILED_LOCATIONS
+    names, parts = [], []
+    for city in cities or locations:
+        anchors = locations.get(city)
+        population = populations.get(city)
+        if not anchors or not population:
+            continue
+        g_lat, g_lng, dist = _grid_around(anchors, spacing_km, 3 * sigma_km)
+        kernel = np.where(dist <= 3 * sigma_km, np.exp(-0.5 * (dist / sigma_km) ** 2), 0.0)
+        weight = (kernel / kernel.sum(axis=0) * (population / len(anchors))).sum(axis=1)
+        keep = weight > 0
+        parts.append((g_lat[keep], g_lng[keep], weight[keep], np.full(int(keep.sum()), len(names))))
+        names.append(city)
+    if not parts:
+        empty = np.empty(0)
+        return empty, empty, empty, np.empty(0, np.int32), names
+    lats, lngs, weights, codes = (np.concatenate(p) for p in zip(*parts))
+    return lats, lngs, weights, codes.astype(np.int32), names
+
+
+class Candidates:
+    """Aday istasyon yerleri; her aday bir şehrin en yakın lokasyonuna bağlıdır."""
+
+    def __init__(self, lats, lngs, cities, anchors, locations):
+        self.lats = np.asarray(lats, dtype=np.float64)
+        self.lngs = np.asarray(lngs, dtype=np.float64)
+        self.cities = list(cities)
+        self.anchors = list(anchors)
+        self.locations = locations
+
+    def __len__(self):
+        return len(self.lats)
+
+    def anchor(self, i):
+        return self.locations[self.cities[i]][self.anchors[i]]
+
+    @classmethod
+    def around(cls, cities=None, spacing_km=CANDIDATE_SPACING_KM, locations=None, reach_km=None):
+        """Lokasyonların kendisi ve çevrelerindeki (reach_km) spacing_km aralıklı ızgara.
+
+        spacing_km None ise yalnızca lokasyonlar aday olur (ör. elle hazırlanmış
+        aday listesi).
+        """
+        if locations is None:
+            locations = DETAILED_LOCATIONS
+        if reach_km is None:
+            reach_km = 3 * POPULATION_SIGMA_KM
+        lats, lngs, cities_out, anchors_out = [], [], [], []
+        for city in cities or locations:
+            anchors = locations.get(city)
+            if not anchors:
+                continue
+            lats.extend(a['lat'] for a in anchors)
+            lngs.extend(a['lng'] for a in anchors)
+            cities_out.extend([city] * len(anchors))
+            anchors_out.extend(range(len(anchors)))
+            if spacing_km:
+                g_lat, g_lng, dist = _grid_around(anchors, spacing_km, reach_km)
+                keep = dist.min(axis=1) <= reach_km
+                lats.extend(g_lat[keep].tolist())
+                lngs.extend(g_lng[keep].tolist())
+                cities_out.extend([city] * int(keep.sum()))
+                anchors_out.extend(dist[keep].argmin(axis=1).tolist())
+        return cls(lats, lngs, cities_out, anchors_out, locations)
+
+
+def _pair_blocks(index, lats, lngs, radius_km):
+    """Noktaları radius_km hücrelerine gruplar; her grup için (noktalar, hedefler, mesafeler).
+
+    Grup kutusu radius_km genişletilerek indeksten hedefler alınır, mesafeler
+    grup x hedef matrisi olarak tek seferde hesaplanır.
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lngs = np.asarray(lngs, dtype=np.float64)
+    if not len(lats) or not len(index):
+        return
+    cell = radius_km / KM_PER_DEG_LAT
+    keys = np.floor(lats / cell).astype(np.int64) * (1 << 32) + np.floor(lngs / cell).astype(np.int64)
+    order = np.argsort(keys, kind='stable')
+    bounds = np.flatnonzero(np.diff(keys[order])) + 1
+    dlat = radius_km / KM_PER_DEG_LAT
+    for members in np.split(order, bounds):
+        m_lat = lats[members]
+        m_lng = lngs[members]
+        dlng = dlat / max(math.cos(math.radians(float(np.abs(m_lat).max()) + dlat)), 1e-6)
+        targets = index.query_bbox(m_lat.min() - dlat, m_lng.min() - dlng, m_lat.max() + dlat, m_lng.max() + dlng)
+        if len(targets):
+            yield members, targets, haversine_km(m_lat[:, None], m_lng[:, None],
+                                                 index.lats[targets][None, :], index.lngs[targets][None, :])
+
+
+class SiteOptimizer:
+    """Talep noktaları ve adaylar üzerinde CELF seçimi.
+
+    existing (StationIndex) verilirse mevcut istasyonların karşıladığı talep
+    baştan düşülür. select() art arda çağrılarak "sonraki N" yer seçilebilir.
+    """
+
+    def __init__(self, demand_lats, demand_lngs, demand_weights, candidates, radius_km=COVERAGE_RADIUS_KM,
+                 capture=STATION_CAPTURE, existing=None):
+        self.demand_lats = np.asarray(demand_lats, dtype=np.float64)
+        self.demand_lngs = np.asarray(demand_lngs, dtype=np.float64)
+        self.weights = np.asarray(demand_weights, dtype=np.float64)
+        self.candidates = candidates
+        self.radius_km = float(radius_km)
+        self.capture = float(capture)
+        # Talep noktalarının karşılanmamış payı
+        self.uncovered = np.ones(len(self.weights))
+        self.picked = []
+        self._taken = np.zeros(len(candidates), dtype=bool)
+
+        # Aday -> kapsadığı talep noktaları ve karşılama payları (CSR)
+        demand_index = StationIndex(self.demand_lats, self.demand_lngs, cell_deg=self.radius_km / KM_PER_DEG_LAT)
+        rows, cols, shares = [], [], []
+        for members, targets, dist in _pair_blocks(demand_index, candidates.lats, candidates.lngs, self.radius_km):
+            r, c = np.nonzero(dist <= self.radius_km)
+            rows.append(members[r])
+            cols.append(targets[c])
+            shares.append(self._share(dist[r, c]))
+        rows = np.concatenate(rows) if rows else np.empty(0, np.int64)
+        order = np.argsort(rows, kind='stable')
+        self.indices = np.concatenate(cols)[order] if cols else np.empty(0, np.int64)
+        self.shares = np.concatenate(shares)[order] if shares else np.empty(0)
+        self.indptr = np.concatenate([[0], np.cumsum(np.bincount(rows, minlength=len(candidates)))])
+
+        if existing is not None and len(existing):
+            for members, _, dist in _pair_blocks(existing, self.demand_lats, self.demand_lngs, self.radius_km):
+                share = np.where(dist <= self.radius_km, self._share(dist), 0.0)
+                self.uncovered[members] *= np.prod(1.0 - share, axis=1)
+
+    def _share(self, dist):
+        return self.capture * (1.0 - dist / self.radius_km)
+
+    @property
+    def total_demand(self):
+        return float(self.weights.sum())
+
+    @property
+    def covered_demand(self):
+        return float(np.dot(self.weights, 1.0 - self.uncovered))
+
+    def gain(self, c):
+        """Adayın şu anki marjinal kazancı (karşılanacak ek talep)."""
+        a, b = self.indptr[c], self.indptr[c + 1]
+        idx = self.indices[a:b]
+        return float(np.dot(self.weights[idx] * self.uncovered[idx], self.shares[a:b]))
+
+    def _gains(self):
+        # Tüm adayların kazancı tek seferde (seçim başında)
+        rows = np.repeat(np.arange(len(self.candidates)), np.diff(self.indptr))
+        contrib = self.weights[self.indices] * self.uncovered[self.indices] * self.shares
+        return np.bincount(rows, weights=contrib, minlength=len(self.candidates))
+
+    def _take(self, c):
+        a, b = self.indptr[c], self.indptr[c + 1]
+        self.uncovered[self.indices[a:b]] *= 1.0 - self.shares[a:b]
+        self._taken[c] = True
+        self.picked.append(c)
+
+    def select(self, n):
+        """Sonraki en fazla n yeri seçer: [(aday, kazanç)] seçim sırasıyla.
+
+        Kazancı olmayan adaylar seçilmez; her aday en fazla bir kez seçilir.
+        """
+        gains = self._gains()
+        heap = [(-g, c) for c, g in enumerate(gains.tolist()) if g > 0 and not self._taken[c]]
+        heapq.heapify(heap)
+        # Adayın kazancının en son hesaplandığı tur (seçilmiş yer sayısı)
+        fresh = np.full(len(self.candidates), len(self.picked))
+        chosen = []
+        while heap and len(chosen) < n:
+            neg_gain, c = heapq.heappop(heap)
+            if fresh[c] == len(self.picked):
+                self._take(c)
+                chosen.append((c, -neg_gain))
+                continue
+            g = self.gain(c)
+            fresh[c] = len(self.picked)
+            if g > 0:
+                heapq.heappush(heap, (-g, c))
+        return chosen
+
+
+def greedy_layout(city, target_count, locations, report=None, radius_km=COVERAGE_RADIUS_KM):
+    """Üretici için şehir yerleşimi: lokasyon başına (lat, lng) sapma listeleri.
+
+    _poisson_layout ile aynı biçimi döndürür; seçilen her yer en yakın
+    lokasyonuna bağlanır. Aday aralığı, aday sayısı hedefin en az iki katı
+    olacak şekilde daraltılır. Hedefe ulaşılamazsa eksik report'a eklenir.
+    """
+    city_locations = {city: locations}
+    lats, lngs, weights, _, _ = demand_points([city], locations=city_locations)
+    spacing = CANDIDATE_SPACING_KM
+    candidates = Candidates.around([city], spacing, city_locations)
+    if len(candidates) < _CANDIDATES_PER_PICK * target_count:
+        spacing = max(spacing * math.sqrt(len(candidates) / (_CANDIDATES_PER_PICK * target_count)),
+                      _MIN_CANDIDATE_SPACING_KM)
+        candidates = Candidates.around([city], spacing, city_locations)
+
+    picks = SiteOptimizer(lats, lngs, weights, candidates, radius_km).select(target_count)
+    if len(picks) < target_count and report is not None:
+        report.append({'city': city, 'anchor': None, 'quota': target_count, 'placed': len(picks)})
+
+    layout = [[] for _ in locations]
+    for c, _ in picks:
+        a = candidates.anchors[c]
+        layout[a].append((float(candidates.lats[c]) - locations[a]['lat'],
+                          float(candidates.lngs[c]) - locations[a]['lng']))
+    return layout
+
+
+def iter_site_stations(candidates, picks, start_id, rng=random):
+    """Seçilen yerleri üreticiyle aynı biçimde istasyon kayıtlarına çevirir.
+
+    Adlar lokasyon adından türetilir; aynı lokasyona düşen ikinci ve sonraki
+    yerler "N. İstasyon" ekini alır. Güç kademesi ve tip rng ile çekilir.
+    """
+    ordinals = {}
+    for k, (c, _) in enumerate(picks):
+        city = candidates.cities[c]
+        key = (city, candidates.anchors[c])
+        i = ordinals[key] = ordinals.get(key, -1) + 1
+        name_prefix, address_suffix, location_name = _station_labels(city, candidates.anchor(c))
+        if i > 0:
+            location_name = f"{location_name} {i+1}. İstasyon"
+        tier = rng.choices(_TIER_INDEXES, weights=POWER_TIER_WEIGHTS)[0]
+        yield {
+            'id': f'ZES{start_id + k:04d}',
+            'name': name_prefix + location_name,
+            'address': location_name + address_suffix,
+            'coordinates': {'lat': round(float(candidates.lats[c]), 6), 'lng': round(float(candidates.lngs[c]), 6)},
+            'dcSockets': TIER_DC_SOCKETS[tier],
+            'acSockets': TIER_AC_SOCKETS[tier],
+            'power': TIER_POWER[tier],
+            'status': 'active',
+            'type': rng.choice(STATION_TYPES)
+        }
+
+
+def _next_id(ids):
+    numbers = [int(str(i)[3:]) for i in ids if str(i).startswith('ZES') and str(i)[3:].isdigit()]
+    return max(numbers, default=0) + 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Kapsanan talebi en çoklayan yeni istasyon yerleri (CELF)')
+    parser.add_argument('-n', type=int, required=True, help='seçilecek yeni istasyon sayısı')
+    parser.add_argument('--city', nargs='+', help='yalnızca bu şehirler (varsayılan: ülke geneli)')
+    parser.add_argument('--existing', metavar='DOSYA',
+                        help='mevcut istasyonlar (json/ndjson/zcol); karşıladıkları talep düşülür')
+    parser.add_argument('--candidates', metavar='DOSYA',
+                        help='DETAILED_LOCATIONS biçiminde aday lokasyonlar ({şehir: [{name, lat, lng, district}]})')
+    parser.add_argument('--radius', type=float, default=COVERAGE_RADIUS_KM,
+                        help=f'istasyonun talep karşıladığı yarıçap, km (varsayılan: {COVERAGE_RADIUS_KM})')
+    parser.add_argument('--spacing', type=float, default=CANDIDATE_SPACING_KM,
+                        help=f'lokasyonlar çevresindeki aday ızgarası aralığı, km (varsayılan: {CANDIDATE_SPACING_KM})')
+    parser.add_argument('--seed', type=int, help='güç kademesi ve tip çekilişleri için tohum')
+    parser.add_argument('-o', '--output', default='optimized_stations.json')
+    parser.add_argument('--format', default='json', help='çıktı biçimi (json, ndjson, ndjson.gz)')
+    args = parser.parse_args(argv)
+
+    if args.n <= 0:
+        parser.error('-n pozitif olmalı')
+
+    from .formats import write_stations
+
+    t0 = time.perf_counter()
+    if args.candidates:
+        with open(args.candidates, encoding='utf-8') as f:
+            candidate_locations = json.load(f)
+        candidates = Candidates.around(args.city, None, candidate_locations)
+    else:
+        candidates = Candidates.around(args.city, args.spacing)
+    lats, lngs, weights, _, _ = demand_points(args.city or sorted(set(candidates.cities)))
+    existing = StationIndex.from_file(args.existing) if args.existing else None
+    optimizer = SiteOptimizer(lats, lngs, weights, candidates, args.radius, existing=existing)
+    t_setup = time.perf_counter() - t0
+
+    before = optimizer.covered_demand
+    t0 = time.perf_counter()
+    picks = optimizer.select(args.n)
+    elapsed = time.perf_counter() - t0
+
+    start_id = _next_id(existing.ids) if existing is not None else 1
+    rng = random.Random(args.seed) if args.seed is not None else random
+    total = write_stations(iter_site_stations(candidates, picks, start_id, rng), args.output, args.format)
+
+    demand = optimizer.total_demand
+    print(f"🎯 {len(candidates)} aday, {len(weights)} talep noktası: {total} yer seçildi "
+          f"({elapsed:.2f} sn, hazırlık {t_setup:.2f} sn) -> {args.output}")
+    print(f"📈 Karşılanan talep: %{before / demand * 100:.1f} -> %{optimizer.covered_demand / demand * 100:.1f}")
+    by_city = {}
+    for c, _ in picks:
+        by_city[candidates.cities[c]] = by_city.get(candidates.cities[c], 0) + 1
+    print("\n📍 ŞEHİRLERE GÖRE:")
+    for city, count in sorted(by_city.items(), key=lambda item: item[1], reverse=True):
+        print(f"  {city}: {count} istasyon")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,254 @@
+"""Üretilen veya mevcut istasyonlar üzerinde ızgara tabanlı uzamsal indeks.
+
+İstasyonlar sabit boyutlu enlem/boylam hücrelerine (geohash benzeri) ayrılır
+ve hücre anahtarına göre sıralanır. Bir hücre satırındaki aralık sıralı dizide
+tek bir dilime karşılık gelir; sorgular yalnızca ilgili dilimlerdeki adaylar
+için vektörel haversine mesafesi hesaplar.
+"""
+import argparse
+import math
+import time
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEG_LAT = math.pi * EARTH_RADIUS_KM / 180
+
+# DC/HPC kademeleri (150 ve 180 kW) için alt güç sınırı
+DC_MIN_POWER_KW = 150
+
+
+def haversine_km(lat1, lng1, lat2, lng2):
+    """Dizi/skaler girdiler için (broadcast) büyük çember mesafesi, km."""
+    lat1 = np.radians(lat1)
+    lat2 = np.radians(lat2)
+    dlat = lat2 - lat1
+    dlng = np.radians(lng2) - np.radians(lng1)
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlng / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def parse_power_kw(power):
+    # "180 kW" -> 180.0
+    try:
+        return float(str(power).split()[0])
+    except (ValueError, IndexError):
+        return 0.0
+
+
+class StationIndex:
+    """Enlem/boylam ızgarası üzerinde k-en yakın, yarıçap ve kutu sorguları.
+
+    Sorgular girdi sırasındaki istasyon indekslerini döndürür; ids dizisi ile
+    istasyon kimliklerine çevrilebilir.
+    """
+
+    def __init__(self, lats, lngs, ids=None, power_kw=None, dc_sockets=None, cell_deg=0.05):
+        self.lats = np.ascontiguousarray(lats, dtype=np.float64)
+        self.lngs = np.ascontiguousarray(lngs, dtype=np.float64)
+        n = len(self.lats)
+        self.ids = np.asarray(ids) if ids is not None else np.arange(n)
+        self.power_kw = np.asarray(power_kw, dtype=np.float32) if power_kw is not None else np.zeros(n, np.float32)
+        self.dc_sockets = np.asarray(dc_sockets, dtype=np.int16) if dc_sockets is not None else np.zeros(n, np.int16)
+        self.cell_deg = float(cell_deg)
+
+        if n:
+            self.lat0 = float(self.lats.min())
+            self.lng0 = float(self.lngs.min())
+            # Boyutlar _row/_col ile aynı yuvarlamayla hesaplanır; // ile
+            # (ör. 2.0 // 0.05 == 39) son satırdaki istasyonlar dışarıda kalırdı
+            self.n_rows = int(self._row(self.lats.max())) + 1
+            self.n_cols = int(self._col(self.lngs.max())) + 1
+        else:
+            self.lat0 = self.lng0 = 0.0
+            self.n_rows = self.n_cols = 0
+
+        keys = self._row(self.lats) * self.n_cols + self._col(self.lngs)
+        self.order = np.argsort(keys, kind='stable')
+        self._keys = keys[self.order]
+        self._lats = self.lats[self.order]
+        self._lngs = self.lngs[self.order]
+
+    def __len__(self):
+        return len(self.lats)
+
+    @classmethod
+    def from_stations(cls, stations, cell_deg=0.05):
+        """İstasyon kayıtlarından (generator çıktısı dahil) indeks kurar."""
+        ids, lats, lngs, power, dc = [], [], [], [], []
+        for s in stations:
+            ids.append(s['id'])
+            lats.append(s['coordinates']['lat'])
+            lngs.append(s['coordinates']['lng'])
+            power.append(parse_power_kw(s.get('power')))
+            dc.append(s.get('dcSockets', 0))
+        return cls(lats, lngs, np.asarray(ids), power, dc, cell_deg=cell_deg)
+
+    @classmethod
+    def from_file(cls, path, cell_deg=0.05):
+        """real_zes_stations.json, .ndjson(.gz) veya .zcol dosyasından indeks kurar."""
+        if str(path).endswith('.zcol'):
+            from .store import StationStore
+
+            with StationStore(path) as store:
+                power_table = np.asarray([parse_power_kw(p) for p in store.enums['power']], np.float32)
+                return cls(
+                    np.asarray(store.column('lat'), np.float64),
+                    np.asarray(store.column('lng'), np.float64),
+                    np.char.add('ZES', np.char.zfill(np.asarray(store.column('id')).astype(str), 4)),
+                    power_table[np.asarray(store.column('power'))] if len(power_table) else None,
+                    np.asarray(store.column('dc_sockets')),
+                    cell_deg=cell_deg,
+                )
+        from .formats import iter_station_file
+
+        return cls.from_stations(iter_station_file(path), cell_deg=cell_deg)
+
+    def where(self, mask):
+        """Maskeye uyan istasyonlar için yeni bir indeks (ör. yalnızca DC/HPC)."""
+        mask = np.asarray(mask, dtype=bool)
+        return StationIndex(self.lats[mask], self.lngs[mask], self.ids[mask],
+                            self.power_kw[mask], self.dc_sockets[mask], cell_deg=self.cell_deg)
+
+    def dc_only(self):
+        """Yalnızca DC/HPC kademesindeki istasyonları içeren indeks."""
+        return self.where(self.power_kw >= DC_MIN_POWER_KW)
+
+    def _row(self, lat):
+        return np.floor((np.asarray(lat) - self.lat0) / self.cell_deg).astype(np.int64)
+
+    def _col(self, lng):
+        return np.floor((np.asarray(lng) - self.lng0) / self.cell_deg).astype(np.int64)
+
+    def _candidates(self, lat_min, lng_min, lat_max, lng_max):
+        # Kutuyu kesen hücre satırlarının her biri sıralı dizide tek bir dilimdir
+        if not len(self):
+            return np.empty(0, np.int64)
+        r0 = max(int(self._row(lat_min)), 0)
+        r1 = min(int(self._row(lat_max)), self.n_rows - 1)
+        c0 = max(int(self._col(lng_min)), 0)
+        c1 = min(int(self._col(lng_max)), self.n_cols - 1)
+        if r0 > r1 or c0 > c1:
+            return np.empty(0, np.int64)
+        rows = np.arange(r0, r1 + 1) * self.n_cols
+        starts = np.searchsorted(self._keys, rows + c0, side='left')
+        stops = np.searchsorted(self._keys, rows + c1, side='right')
+        if len(starts) == 1:
+            return np.arange(starts[0], stops[0])
+        # Dilimleri Python döngüsü olmadan birleştir
+        lengths = stops - starts
+        offsets = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+        return np.arange(int(lengths.sum())) + offsets
+
+    def _covers_grid(self, lat_min, lng_min, lat_max, lng_max):
+        return (lat_min <= self.lat0 and lat_max >= self.lat0 + self.n_rows * self.cell_deg
+                and lng_min <= self.lng0 and lng_max >= self.lng0 + self.n_cols * self.cell_deg)
+
+    def _radius_box(self, lat, lng, radius_km):
+        dlat = radius_km / KM_PER_DEG_LAT
+        cos_lat = max(math.cos(math.radians(min(abs(lat) + dlat, 89.9))), 1e-6)
+        dlng = min(radius_km / (KM_PER_DEG_LAT * cos_lat), 180.0)
+        return lat - dlat, lng - dlng, lat + dlat, lng + dlng
+
+    def query_bbox(self, lat_min, lng_min, lat_max, lng_max):
+        """Kutu içindeki istasyonların indeksleri."""
+        cand = self._candidates(lat_min, lng_min, lat_max, lng_max)
+        lats = self._lats[cand]
+        lngs = self._lngs[cand]
+        inside = (lats >= lat_min) & (lats <= lat_max) & (lngs >= lng_min) & (lngs <= lng_max)
+        return self.order[cand[inside]]
+
+    def query_radius(self, lat, lng, radius_km, sort=True):
+        """radius_km içindeki istasyonlar: (indeksler, mesafeler km)."""
+        cand = self._candidates(*self._radius_box(lat, lng, radius_km))
+        dist = haversine_km(lat, lng, self._lats[cand], self._lngs[cand])
+        inside = dist <= radius_km
+        cand = cand[inside]
+        dist = dist[inside]
+        if sort:
+            by_dist = np.argsort(dist, kind='stable')
+            cand = cand[by_dist]
+            dist = dist[by_dist]
+        return self.order[cand], dist
+
+    def nearest(self, lat, lng, k=1, max_km=None):
+        """En yakın k istasyon: (indeksler, mesafeler km), mesafeye göre sıralı.
+
+        Arama yarıçapı bir hücreden başlayıp, yarıçap içinde en az k istasyon
+        bulunana kadar ikiye katlanır.
+        """
+        k = min(k, len(self))
+        if k <= 0:
+            return np.empty(0, np.int64), np.empty(0)
+        radius = self.cell_deg * KM_PER_DEG_LAT
+        while True:
+            if max_km is not None:
+                radius = min(radius, max_km)
+            idx, dist = self.query_radius(lat, lng, radius, sort=False)
+            if len(idx) >= k or (max_km is not None and radius >= max_km):
+                break
+            if self._covers_grid(*self._radius_box(lat, lng, radius)):
+                # Arama kutusu tüm ızgarayı kapsıyor (ızgaradan uzak sorgu
+                # noktası): bütün istasyonlar adaydır
+                dist = haversine_km(lat, lng, self._lats, self._lngs)
+                inside = dist <= max_km if max_km is not None else np.ones(len(dist), dtype=bool)
+                idx = self.order[inside]
+                dist = dist[inside]
+                break
+            radius *= 2
+        if len(idx) > k:
+            part = np.argpartition(dist, k - 1)[:k]
+            idx = idx[part]
+            dist = dist[part]
+        by_dist = np.argsort(dist, kind='stable')
+        return idx[by_dist], dist[by_dist]
+
+    def nearest_many(self, lats, lngs, max_km=None):
+        """Birden çok nokta için en yakın istasyon: (indeksler, mesafeler km).
+
+        Bulunamayan noktalar için indeks -1, mesafe inf döner.
+        """
+        lats = np.asarray(lats, dtype=np.float64)
+        lngs = np.asarray(lngs, dtype=np.float64)
+        out_idx = np.full(len(lats), -1, np.int64)
+        out_dist = np.full(len(lats), np.inf)
+        for i, (lat, lng) in enumerate(zip(lats.tolist(), lngs.tolist())):
+            idx, dist = self.nearest(lat, lng, 1, max_km=max_km)
+            if len(idx):
+                out_idx[i] = idx[0]
+                out_dist[i] = dist[0]
+        return out_idx, out_dist
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='İstasyon dosyası üzerinde uzamsal sorgular')
+    parser.add_argument('input', help='real_zes_stations.json, .ndjson(.gz) veya .zcol')
+    parser.add_argument('--near', nargs=2, type=float, metavar=('LAT', 'LNG'), required=True)
+    parser.add_argument('-k', type=int, default=5, help='en yakın kaç istasyon (varsayılan: 5)')
+    parser.add_argument('--radius', type=float, help='bu yarıçaptaki (km) istasyonları listele')
+    parser.add_argument('--dc', action='store_true', help='yalnızca DC/HPC istasyonları')
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    index = StationIndex.from_file(args.input)
+    if args.dc:
+        index = index.dc_only()
+    print(f"🗺️ {len(index)} istasyon indekslendi ({time.perf_counter() - t0:.2f} sn)")
+
+    lat, lng = args.near
+    t0 = time.perf_counter()
+    if args.radius is not None:
+        idx, dist = index.query_radius(lat, lng, args.radius)
+        label = f"{args.radius} km içinde {len(idx)} istasyon"
+    else:
+        idx, dist = index.nearest(lat, lng, args.k)
+        label = f"en yakın {len(idx)} istasyon"
+    elapsed_ms = (time.perf_counter() - t0) * 1000
+
+    print(f"📍 ({lat}, {lng}) için {label} ({elapsed_ms:.3f} ms):")
+    for i, d in zip(idx.tolist(), dist.tolist()):
+        print(f"  {index.ids[i]}  {d:.2f} km")
+
+
+if __name__ == '__main__':
+    main()
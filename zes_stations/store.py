@@ -0,0 +1,365 @@
+"""ZES istasyonları için sütun tabanlı, bellek eşlemli (mmap) ikili depo.
+
+Dosya düzeni (little-endian):
+
+    b'ZESCOL01' | uint32 başlık uzunluğu | JSON başlık | hizalı sütun blokları
+
+Sütunlar: float32 lat/lng, uint8 soket sayıları, enum kodlu güç/tip/durum ve
+ortak bir string tablosuna (ad, adres, şehir, ilçe) uint32 indeksler.
+StationStore dosyayı mmap ile açar; satırlar yalnızca erişildiğinde
+__slots__ kullanan StationRow görünümleri olarak oluşturulur.
+"""
+import argparse
+import json
+import mmap
+import re
+import struct
+import sys
+from array import array
+
+from .aggregates import split_station_name
+from .formats import iter_station_file, output_stem
+
+MAGIC = b'ZESCOL01'
+FILE_SUFFIX = '.zcol'
+_ALIGN = 16
+
+# Sütun adı -> array typecode
+COLUMNS = {
+    'id': 'I',
+    'lat': 'f',
+    'lng': 'f',
+    'dc_sockets': 'B',
+    'ac_sockets': 'B',
+    'power': 'B',
+    'type': 'B',
+    'status': 'B',
+    'name': 'I',
+    'address': 'I',
+    'city': 'I',
+    'district': 'I',
+}
+ENUM_COLUMNS = ('power', 'type', 'status')
+
+_ID_PATTERN = re.compile(r'ZES(\d+)$')
+
+
+def columnar_path(output):
+    """real_zes_stations.json / .ndjson / .ndjson.gz yanına yazılacak dosya adı."""
+    return output_stem(output) + FILE_SUFFIX
+
+
+def _pad(n):
+    return (-n) % _ALIGN
+
+
+class ColumnarWriter:
+    """İstasyonları tek tek alıp sütunlarda biriktirir, close() ile dosyaya yazar."""
+
+    def __init__(self, path):
+        self.path = path
+        self.columns = {name: array(code) for name, code in COLUMNS.items()}
+        self.enums = {name: {} for name in ENUM_COLUMNS}
+        self._strings = {}
+        self._string_data = bytearray()
+        self._string_offsets = array('I', [0])
+
+    def __len__(self):
+        return len(self.columns['id'])
+
+    def _intern(self, value):
+        index = self._strings.get(value)
+        if index is None:
+            index = len(self._strings)
+            self._strings[value] = index
+            self._string_data += value.encode('utf-8')
+            self._string_offsets.append(len(self._string_data))
+        return index
+
+    def _enum(self, column, value):
+        codes = self.enums[column]
+        code = codes.get(value)
+        if code is None:
+            if len(codes) == 255:
+                raise ValueError(f"{column} sütununda 255'ten fazla farklı değer var")
+            code = codes[value] = len(codes)
+        return code
+
+    def add(self, station):
+        match = _ID_PATTERN.match(station['id'])
+        if not match or f"ZES{int(match.group(1)):04d}" != station['id']:
+            raise ValueError(f"Desteklenmeyen istasyon kimliği: {station['id']}")
+        city, district = split_station_name(station['name'])
+        cols = self.columns
+        cols['id'].append(int(match.group(1)))
+        cols['lat'].append(station['coordinates']['lat'])
+        cols['lng'].append(station['coordinates']['lng'])
+        cols['dc_sockets'].append(station['dcSockets'])
+        cols['ac_sockets'].append(station['acSockets'])
+        cols['power'].append(self._enum('power', station['power']))
+        cols['type'].append(self._enum('type', station['type']))
+        cols['status'].append(self._enum('status', station['status']))
+        cols['name'].append(self._intern(station['name']))
+        cols['address'].append(self._intern(station['address']))
+        cols['city'].append(self._intern(city))
+        cols['district'].append(self._intern(district))
+
+    def close(self):
+        blocks = [(name, col) for name, col in self.columns.items()]
+        blocks.append(('string_offsets', self._string_offsets))
+
+        # Başlıktaki offset'ler veri bölümünün başına göredir
+        layout = {}
+        offset = 0
+        for name, col in blocks:
+            layout[name] = {'typecode': col.typecode, 'offset': offset, 'length': len(col)}
+            offset += len(col) * col.itemsize
+            offset += _pad(offset)
+        string_data_offset = offset
+
+        header = json.dumps({
+            'version': 1,
+            'count': len(self),
+            'columns': {name: layout[name] for name in COLUMNS},
+            'enums': {name: list(codes) for name, codes in self.enums.items()},
+            'strings': {
+                'count': len(self._strings),
+                'offsets': layout['string_offsets'],
+                'data': {'offset': string_data_offset, 'length': len(self._string_data)},
+            },
+        }, ensure_ascii=False).encode('utf-8')
+
+        prefix = len(MAGIC) + 4 + len(header)
+        with open(self.path, 'wb') as f:
+            f.write(MAGIC)
+            f.write(struct.pack('<I', len(header)))
+            f.write(header)
+            f.write(b'\0' * _pad(prefix))
+            for _, col in blocks:
+                if sys.byteorder != 'little':
+                    col = array(col.typecode, col)
+                    col.byteswap()
+                col.tofile(f)
+                f.write(b'\0' * _pad(len(col) * col.itemsize))
+            f.write(self._string_data)
+        return len(self)
+
+
+def write_columnar(stations, path):
+    """İstasyon akışını sütunlu dosyaya yazar; yazılan adedi döndürür."""
+    writer = ColumnarWriter(path)
+    for station in stations:
+        writer.add(station)
+    return writer.close()
+
+
+class StationRow:
+    """Depodaki tek bir istasyona tembel erişim sağlayan hafif görünüm."""
+
+    __slots__ = ('_store', '_index')
+
+    def __init__(self, store, index):
+        self._store = store
+        self._index = index
+
+    def __repr__(self):
+        return f"StationRow({self.id!r}, {self.name!r})"
+
+    @property
+    def id(self):
+        return f"ZES{self._store._columns['id'][self._index]:04d}"
+
+    @property
+    def lat(self):
+        return self._store._columns['lat'][self._index]
+
+    @property
+    def lng(self):
+        return self._store._columns['lng'][self._index]
+
+    @property
+    def dc_sockets(self):
+        return self._store._columns['dc_sockets'][self._index]
+
+    @property
+    def ac_sockets(self):
+        return self._store._columns['ac_sockets'][self._index]
+
+    @property
+    def power(self):
+        return self._store._enum('power', self._index)
+
+    @property
+    def type(self):
+        return self._store._enum('type', self._index)
+
+    @property
+    def status(self):
+        return self._store._enum('status', self._index)
+
+    @property
+    def name(self):
+        return self._store._string('name', self._index)
+
+    @property
+    def address(self):
+        return self._store._string('address', self._index)
+
+    @property
+    def city(self):
+        return self._store._string('city', self._index)
+
+    @property
+    def district(self):
+        return self._store._string('district', self._index)
+
+    def to_dict(self):
+        """JSON çıktısıyla aynı biçimde kayıt döndürür (koordinatlar float32 hassasiyetinde)."""
+        return {
+            'id': self.id,
+            'name': self.name,
+            'address': self.address,
+            'coordinates': {'lat': round(self.lat, 6), 'lng': round(self.lng, 6)},
+            'dcSockets': self.dc_sockets,
+            'acSockets': self.ac_sockets,
+            'power': self.power,
+            'status': self.status,
+            'type': self.type,
+        }
+
+
+class StationStore:
+    """Sütunlu istasyon dosyasını mmap ile açar; veriyi ayrıştırmadan okur."""
+
+    def __init__(self, path):
+        self.path = path
+        self._views = []
+        self._file = open(path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Boş veya geçersiz dosya: {path}") from None
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"ZES sütunlu dosyası değil: {path}")
+
+        try:
+            (header_len,) = struct.unpack_from('<I', self._mmap, len(MAGIC))
+            header_start = len(MAGIC) + 4
+            self.header = json.loads(self._mmap[header_start:header_start + header_len].decode('utf-8'))
+            data_start = header_start + header_len
+            data_start += _pad(data_start)
+
+            view = memoryview(self._mmap)
+            self._views.append(view)
+            self._columns = {
+                name: self._cast(view, data_start, spec)
+                for name, spec in self.header['columns'].items()
+            }
+            strings = self.header['strings']
+            self._string_offsets = self._cast(view, data_start, strings['offsets'])
+            data = strings['data']
+            self._string_data = view[data_start + data['offset']:data_start + data['offset'] + data['length']]
+            self._views.append(self._string_data)
+            self.enums = self.header['enums']
+        except Exception:
+            # Bozuk başlıkta dosya ve mmap açık kalmasın
+            self.close()
+            raise
+        self._string_cache = {}
+
+    def _cast(self, view, data_start, spec):
+        start = data_start + spec['offset']
+        size = array(spec['typecode']).itemsize
+        col = view[start:start + spec['length'] * size].cast(spec['typecode'])
+        if sys.byteorder != 'little':
+            # Büyük-endian makinelerde mmap yerine byteswap edilmiş kopya kullanılır
+            col = array(spec['typecode'], col.tobytes())
+            col.byteswap()
+        else:
+            self._views.append(col)
+        return col
+
+    def __len__(self):
+        return self.header['count']
+
+    def __getitem__(self, index):
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError(index)
+        return StationRow(self, index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield StationRow(self, index)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def column(self, name):
+        """Ham sütun (memoryview); numpy ile np.asarray(store.column('lat')) olarak kullanılabilir.
+
+        Dizi mmap'i paylaşır. close() sonrasında canlı kalan diziler geçerli
+        kalır; mmap son dizi bırakılınca kapanır.
+        """
+        return self._columns[name]
+
+    def string(self, index):
+        """String tablosundaki index'e karşılık gelen değeri döndürür."""
+        value = self._string_cache.get(index)
+        if value is None:
+            start = self._string_offsets[index]
+            end = self._string_offsets[index + 1]
+            value = str(self._string_data[start:end], 'utf-8')
+            # Şehir/ilçe gibi tekrar eden değerler için küçük bir önbellek
+            if len(self._string_cache) < 4096:
+                self._string_cache[index] = value
+        return value
+
+    def _string(self, column, row):
+        return self.string(self._columns[column][row])
+
+    def _enum(self, column, row):
+        return self.enums[column][self._columns[column][row]]
+
+    def close(self):
+        if self._mmap is None:
+            return
+        for view in reversed(self._views):
+            try:
+                view.release()
+            except BufferError:
+                # Sütun numpy dizisine dönüştürülmüş ve hâlâ kullanılıyor
+                pass
+        self._views = []
+        self._columns = {}
+        self._string_offsets = self._string_data = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Dışa aktarılmış görünümler varken mmap kapatılamaz; son görünüm
+            # bırakıldığında çöp toplayıcı kapatır
+            pass
+        self._file.close()
+        self._mmap = None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='JSON/NDJSON istasyon dosyasını sütunlu biçime çevirir')
+    parser.add_argument('input', help='real_zes_stations.json, .ndjson veya .ndjson.gz')
+    parser.add_argument('-o', '--output', help=f'çıktı dosyası (varsayılan: girdinin yanında {FILE_SUFFIX})')
+    args = parser.parse_args(argv)
+
+    output = args.output or columnar_path(args.input)
+    total = write_columnar(iter_station_file(args.input), output)
+    print(f"✅ {total} istasyon {output} dosyasına yazıldı")
+
+
+if __name__ == '__main__':
+    main()